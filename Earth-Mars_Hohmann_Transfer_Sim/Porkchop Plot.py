@@ -0,0 +1,19 @@
+import os
+import sys
+
+import matplotlib.pyplot as plt
+import numpy as np
+
+# Make the shared astrosim package importable when run as a script
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from astrosim.ephemeris import j2000_days
+from astrosim.porkchop import porkchop
+from astrosim.views.porkchop import plot_porkchop
+
+# The late-2026 Earth-Mars launch window, one-day departure steps
+departure = j2000_days("2026-08-01") + np.arange(0, 200, 1.0)
+arrival = j2000_days("2027-03-01") + np.arange(0, 450, 1.0)
+
+grid = porkchop(departure, arrival)
+plot_porkchop(grid)
+plt.show()
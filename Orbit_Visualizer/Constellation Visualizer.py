@@ -0,0 +1,14 @@
+import os
+import sys
+
+import matplotlib.pyplot as plt
+
+# Make the shared astrosim package importable when run as a script
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from astrosim.constellation import Constellation
+from astrosim.views.constellation import ConstellationView
+
+sim = Constellation()
+view = ConstellationView(sim)
+ani = view.animate(frames=1000)
+plt.show()
@@ -0,0 +1,5 @@
+# AstroSimulations shared compute package.
+#
+# The scripts in each project folder are thin front ends over the engines in
+# this package, so the physics can be imported, benchmarked and run without a
+# display.
@@ -0,0 +1,3 @@
+from astrosim.cli import main
+
+main()
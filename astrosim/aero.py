@@ -0,0 +1,233 @@
+# Tabulated atmosphere, drag and motor data for the rocket model.
+#
+# Everything the rocket looks up once per step (density and speed of sound
+# against altitude, the drag coefficient against Mach number, thrust and
+# mass against time) is sampled once onto a uniform grid. A lookup is then
+# a division, one gather and one multiply-add, with no search. The same
+# Table works on one float per step for RocketModel and on whole arrays per
+# step for simulate_ensemble(), and both give bit-identical results.
+
+import os
+from functools import lru_cache
+
+import numpy as np
+
+G0 = 9.80665  # standard gravity, for specific impulse (m/s^2)
+
+# US Standard Atmosphere 1976 below 86 km: layer base geopotential heights
+# (m) and temperature lapse rates (K/m)
+R_EARTH = 6356766.0  # effective Earth radius for geopotential height (m)
+R_AIR = 287.05287  # specific gas constant of air (J/(kg K))
+GAMMA = 1.4
+T0, P0 = 288.15, 101325.0
+SPEED_OF_SOUND = float(np.sqrt(GAMMA * R_AIR * T0))  # at sea level (m/s)
+LAYER_H = (0.0, 11000.0, 20000.0, 32000.0, 47000.0, 51000.0, 71000.0, 84852.0)
+LAYER_LAPSE = (-0.0065, 0.0, 0.001, 0.0028, 0.0, -0.0028, -0.002)
+TOP = 86000.0  # geometric top of the model; lookups above it clamp (m)
+
+ATMOSPHERE_STEP = 10.0  # altitude spacing of the atmosphere table (m)
+MACH_STEP = 0.005
+MOTOR_STEP = 0.001  # time spacing of thrust curve tables (s)
+
+# Drag coefficient against Mach number, relative to the subsonic value: the
+# usual transonic rise and supersonic decay of a slender rocket
+MACH_CD = ((0.0, 1.0), (0.6, 1.0), (0.8, 1.04), (0.95, 1.25), (1.05, 1.5),
+           (1.2, 1.45), (1.5, 1.3), (2.0, 1.15), (3.0, 1.0), (5.0, 0.9))
+
+
+class Table:
+    """A function sampled on a uniform grid, with linear interpolation.
+
+    values has one row per grid point and optionally several columns, which
+    are looked up together and come back as a tuple, one entry per column.
+    Arguments outside the grid clamp to its ends.
+    """
+
+    def __init__(self, x0, dx, values):
+        self.x0 = float(x0)
+        self.dx = float(dx)
+        self.values = np.array(values, dtype=np.float64)
+        self.values.flags.writeable = False
+        self._n = len(self.values)
+        self._scale = 1.0 / self.dx
+        # Each column and its slopes as separate contiguous arrays: 1-D
+        # gathers are several times faster than gathering rows
+        columns = self.values.reshape(self._n, -1).T
+        self._columns = [np.ascontiguousarray(c) for c in columns]
+        self._slopes = [np.diff(c) for c in self._columns]
+        self._rows = [c.tolist() for c in self._columns]
+        self._row_slopes = [s.tolist() for s in self._slopes]
+
+    @classmethod
+    def from_points(cls, x, y, dx):
+        # Resample (x, y) breakpoints, y with one or more columns, onto a grid
+        x = np.asarray(x, dtype=np.float64)
+        y = np.asarray(y, dtype=np.float64)
+        grid = x[0] + dx * np.arange(int(np.ceil((x[-1] - x[0]) / dx)) + 1)
+        columns = y.reshape(len(x), -1).T
+        values = np.stack([np.interp(grid, x, col) for col in columns], axis=-1)
+        return cls(x[0], dx, values.reshape((len(grid),) + y.shape[1:]))
+
+    def __call__(self, x):
+        # Vectorized lookup, one array of x's shape per column
+        u = (np.asarray(x, dtype=np.float64) - self.x0) * self._scale
+        np.clip(u, 0, self._n - 1, out=u)
+        i = u.astype(np.intp)
+        np.minimum(i, self._n - 2, out=i)
+        u -= i
+        out = []
+        for column, slope in zip(self._columns, self._slopes):
+            value = slope.take(i)
+            value *= u
+            value += column.take(i)
+            out.append(value)
+        return out[0] if self.values.ndim == 1 else tuple(out)
+
+    def at(self, x):
+        # Scalar lookup in plain Python floats, much cheaper than __call__ for
+        # one value and bit-identical to it
+        u = min(max((x - self.x0) * self._scale, 0.0), self._n - 1.0)
+        i = min(int(u), self._n - 2)
+        f = u - i
+        out = tuple(row[i] + slope[i] * f for row, slope in zip(self._rows, self._row_slopes))
+        return out[0] if self.values.ndim == 1 else out
+
+
+def _layer(t_base, p_base, lapse, dh):
+    # Temperature and pressure dh above the base of a layer; lapse may be an
+    # array with isothermal (zero) entries
+    with np.errstate(divide="ignore", invalid="ignore"):
+        t = t_base + lapse * dh
+        p = np.where(lapse == 0, p_base * np.exp(-G0 * dh / (R_AIR * t_base)),
+                     p_base * (t / t_base) ** (-G0 / (lapse * R_AIR)))
+    return t, p
+
+
+def _layer_bases():
+    t, p = [T0], [P0]
+    for base, top, lapse in zip(LAYER_H, LAYER_H[1:], LAYER_LAPSE):
+        t_top, p_top = _layer(t[-1], p[-1], np.float64(lapse), top - base)
+        t.append(float(t_top))
+        p.append(float(p_top))
+    return np.array(t[:-1]), np.array(p[:-1])
+
+
+def standard_atmosphere(altitude):
+    # Temperature (K), pressure (Pa), density (kg/m^3) and speed of sound
+    # (m/s) at geometric altitude (m), from the 1976 US Standard Atmosphere
+    h = np.clip(np.asarray(altitude, dtype=np.float64), 0.0, TOP)
+    h = R_EARTH * h / (R_EARTH + h)  # geopotential height
+    layer = np.searchsorted(LAYER_H[:-1], h, side="right") - 1
+    t_base, p_base = _layer_bases()
+    temperature, pressure = _layer(t_base[layer], p_base[layer], np.asarray(LAYER_LAPSE)[layer],
+                                   h - np.asarray(LAYER_H)[layer])
+    return {
+        "temperature": temperature,
+        "pressure": pressure,
+        "density": pressure / (R_AIR * temperature),
+        "speed_of_sound": np.sqrt(GAMMA * R_AIR * temperature),
+    }
+
+
+@lru_cache(maxsize=None)
+def atmosphere_table(step=ATMOSPHERE_STEP):
+    # Density and speed of sound against altitude, 0 to 86 km, as a
+    # two-column Table
+    altitude = np.arange(0.0, TOP + step, step)
+    atm = standard_atmosphere(altitude)
+    return Table(0.0, step, np.stack([atm["density"], atm["speed_of_sound"]], axis=-1))
+
+
+@lru_cache(maxsize=None)
+def _mach_table(points, step):
+    mach, cd = zip(*points)
+    return Table.from_points(mach, cd, step)
+
+
+def mach_cd_table(points=MACH_CD, step=MACH_STEP):
+    # Cd multiplier against Mach number, from (mach, multiplier) breakpoints.
+    # points=True means the default MACH_CD curve.
+    if points is True:
+        points = MACH_CD
+    return _mach_table(tuple(tuple(map(float, p)) for p in points), step)
+
+
+class Motor:
+    """A motor's thrust curve and masses, as in a RASP .eng file.
+
+    times (s) and thrusts (N) are the curve's breakpoints, starting at
+    ignition. Propellant is burnt in proportion to the impulse delivered, as
+    rocket simulators usually assume.
+    """
+
+    def __init__(self, name, times, thrusts, propellant_mass, total_mass,
+                 diameter=0.0, length=0.0, manufacturer=""):
+        times = np.asarray(times, dtype=np.float64)
+        thrusts = np.asarray(thrusts, dtype=np.float64)
+        if times[0] > 0:
+            times, thrusts = np.r_[0.0, times], np.r_[0.0, thrusts]
+        if thrusts[-1] != 0:
+            times, thrusts = np.r_[times, times[-1]], np.r_[thrusts, 0.0]
+        self.name = name
+        self.times = times
+        self.thrusts = thrusts
+        self.propellant_mass = float(propellant_mass)
+        self.total_mass = float(total_mass)
+        self.diameter = float(diameter)
+        self.length = float(length)
+        self.manufacturer = manufacturer
+
+    @property
+    def burn_time(self):
+        return float(self.times[-1])
+
+    @property
+    def impulse(self):
+        return float(np.sum((self.thrusts[1:] + self.thrusts[:-1]) * np.diff(self.times)) / 2)
+
+    def table(self, step=MOTOR_STEP):
+        # Thrust (N) and motor mass (kg) against time since ignition
+        grid = np.arange(0.0, self.burn_time + step, step)
+        thrust = np.interp(grid, self.times, self.thrusts)
+        delivered = np.concatenate([[0.0], np.cumsum((thrust[1:] + thrust[:-1]) * (step / 2))])
+        burnt = self.propellant_mass * delivered / delivered[-1] if delivered[-1] > 0 else np.zeros_like(delivered)
+        return Table(0.0, step, np.stack([thrust, self.total_mass - burnt], axis=-1))
+
+    def __repr__(self):
+        return (f"Motor({self.name!r}, {self.impulse:.0f} N s over {self.burn_time:g} s, "
+                f"propellant {self.propellant_mass:g} kg)")
+
+
+def load_eng(path):
+    # The first motor in a RASP .eng file: ";" comment lines, then a header
+    # "name diameter(mm) length(mm) delays propellant(kg) total(kg) maker"
+    # and one "time thrust" pair per line
+    motor, points = None, []
+    with open(path) as f:
+        for line in f:
+            line = line.split(";", 1)[0].strip()
+            if not line:
+                continue
+            fields = line.split()
+            if motor is None:
+                if len(fields) < 7:
+                    raise ValueError(f"{path}: bad .eng header {line!r}")
+                motor = fields
+                continue
+            try:
+                points.append((float(fields[0]), float(fields[1])))
+            except (ValueError, IndexError):
+                break  # the next motor's header
+    if motor is None or not points:
+        raise ValueError(f"{path}: no thrust curve found")
+    name, diameter, length, _delays, propellant, total, maker = motor[:7]
+    times, thrusts = zip(*points)
+    return Motor(name, times, thrusts, float(propellant), float(total),
+                 diameter=float(diameter) / 1000, length=float(length) / 1000, manufacturer=maker)
+
+
+def motor(spec):
+    # A Motor from a Motor or a path to a .eng file
+    if isinstance(spec, (str, os.PathLike)):
+        return load_eng(spec)
+    return spec
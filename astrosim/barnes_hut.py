@@ -0,0 +1,169 @@
+# Barnes-Hut gravity on a linear octree.
+#
+# The tree is a set of flat NumPy arrays, not node objects. Sources are sorted
+# by Morton code, which makes every octree cell a contiguous run of the sorted
+# bodies. A cell's mass and centre of mass are then differences of running
+# sums. Cells are built breadth first. Each cell stores its body range and a
+# contiguous block of children. Evaluation walks the tree for all targets at
+# once, keeping a list of (target, cell) pairs: far cells are accepted as
+# point masses, leaves are summed directly, and every other cell is replaced
+# by its children.
+
+import numpy as np
+
+DEPTH = 21  # bits per axis; 3 * 21 = 63-bit Morton codes
+LEAF_SIZE = 8  # cells with at most this many bodies are not split
+THETA = 0.5  # opening angle: accept a cell when width / distance < theta
+# (distance less the centre-of-mass offset from the cell centre)
+CHUNK = 4096  # targets walked together
+
+
+def _spread_bits(v):
+    # Insert two zero bits between each of the low 21 bits of v
+    v = v & np.uint64(0x1FFFFF)
+    v = (v | v << np.uint64(32)) & np.uint64(0x1F00000000FFFF)
+    v = (v | v << np.uint64(16)) & np.uint64(0x1F0000FF0000FF)
+    v = (v | v << np.uint64(8)) & np.uint64(0x100F00F00F00F00F)
+    v = (v | v << np.uint64(4)) & np.uint64(0x10C30C30C30C30C3)
+    v = (v | v << np.uint64(2)) & np.uint64(0x1249249249249249)
+    return v
+
+
+def morton_codes(points, lo, size):
+    # Interleaved-bit cell codes of points inside the cube [lo, lo + size)
+    cells = 1 << DEPTH
+    q = np.clip(((points - lo) * (cells / size)).astype(np.int64), 0, cells - 1).astype(np.uint64)
+    return (_spread_bits(q[:, 0]) << np.uint64(2)) | (_spread_bits(q[:, 1]) << np.uint64(1)) | _spread_bits(q[:, 2])
+
+
+class Octree:
+    """Linear octree over massive source bodies.
+
+    field(targets) gives sum(m * d / |d|^3) over the sources at each target.
+    Multiply by G for accelerations. Targets can be anything, e.g. test
+    particles, which then feel the sources without acting on each other.
+    """
+
+    def __init__(self, points, masses, leaf_size=LEAF_SIZE):
+        points = np.asarray(points, dtype=np.float64)
+        masses = np.asarray(masses, dtype=np.float64)
+        lo = points.min(axis=0)
+        size = float((points.max(axis=0) - lo).max()) * (1 + 1e-9) or 1.0
+        codes = morton_codes(points, lo, size)
+        self.lo, self.size = lo, size
+        order = np.argsort(codes, kind="stable")
+        codes = codes[order]
+        self.points = points[order]
+        self.masses = masses[order]
+        n = len(codes)
+
+        # Running sums, so any run [a, b) of sorted bodies has mass
+        # cm[b] - cm[a] and first moment cmx[b] - cmx[a]
+        cm = np.concatenate([[0.0], np.cumsum(self.masses)])
+        cmx = np.concatenate([np.zeros((1, 3)), np.cumsum(self.masses[:, None] * self.points, axis=0)])
+
+        start, end, level = [np.array([0])], [np.array([n])], [np.array([0])]
+        first = []
+        parents = np.array([0]) if n > leaf_size else np.array([], dtype=np.intp)
+        parent_start, parent_end = np.array([0]), np.array([n])
+        total = 1
+        for depth in range(1, DEPTH + 1):
+            if len(parents) == 0:
+                break
+            # Cells of this level inside the parents being split; parents
+            # are disjoint, sorted runs, so their children come out grouped
+            # by parent and in parent order
+            prefix = codes >> np.uint64(3 * (DEPTH - depth))
+            inside = np.zeros(n + 1, dtype=np.int64)
+            inside[parent_start] += 1
+            inside[parent_end] -= 1
+            inside = np.cumsum(inside[:-1]) > 0
+            new = np.empty(n, dtype=bool)
+            new[0] = True
+            new[1:] = prefix[1:] != prefix[:-1]
+            new[parent_start] = True
+            c_start = np.flatnonzero(new & inside)
+            c_end = np.append(c_start[1:], n)
+            owner = np.searchsorted(parent_start, c_start, side="right") - 1
+            c_end = np.minimum(c_end, parent_end[owner])
+
+            per_parent = np.bincount(owner, minlength=len(parents))
+            first.append((parents, total + np.concatenate([[0], np.cumsum(per_parent)[:-1]]), per_parent))
+            start.append(c_start)
+            end.append(c_end)
+            level.append(np.full(len(c_start), depth))
+            split = (c_end - c_start) > leaf_size
+            parents = total + np.flatnonzero(split)
+            parent_start, parent_end = c_start[split], c_end[split]
+            total += len(c_start)
+
+        self.start = np.concatenate(start)
+        self.end = np.concatenate(end)
+        self.level = np.concatenate(level)
+        self.child_first = np.zeros(total, dtype=np.intp)
+        self.child_count = np.zeros(total, dtype=np.intp)
+        for nodes, f, c in first:
+            self.child_first[nodes] = f
+            self.child_count[nodes] = c
+        self.mass = cm[self.end] - cm[self.start]
+        self.com = (cmx[self.end] - cmx[self.start]) / self.mass[:, None]
+        self.width = size / (1 << self.level).astype(np.float64)
+        # Offset of the centre of mass from the cell centre; a lopsided cell
+        # has to be further away before it is accepted
+        cell = np.floor((self.points[self.start] - lo) / self.width[:, None])
+        centre = lo + (cell + 0.5) * self.width[:, None]
+        self.offset = np.linalg.norm(self.com - centre, axis=1)
+
+    def __len__(self):
+        return len(self.start)
+
+    def field(self, targets, theta=THETA, softening=0.0, chunk=CHUNK):
+        targets = np.asarray(targets, dtype=np.float64)
+        out = np.empty_like(targets)
+        for lo in range(0, len(targets), chunk):
+            out[lo:lo + chunk] = self._walk(targets[lo:lo + chunk], theta, softening)
+        return out
+
+    def _walk(self, targets, theta, softening):
+        n = len(targets)
+        acc = np.zeros((n, 3))
+        eps2 = softening**2
+        inv_theta = np.inf if theta == 0 else 1.0 / theta  # theta=0 opens every cell
+
+        def add(t, d, r2, m):
+            r2 = r2 + eps2
+            w = np.divide(m, r2 * np.sqrt(r2), out=np.zeros_like(r2), where=r2 > 0)
+            for k in range(3):
+                acc[:, k] += np.bincount(t, weights=w * d[:, k], minlength=n)
+
+        t = np.arange(n)
+        node = np.zeros(n, dtype=np.intp)
+        while len(t):
+            d = self.com[node] - targets[t]
+            r2 = np.einsum("ij,ij->i", d, d)
+            reach = self.width[node] * inv_theta + self.offset[node]
+            far = reach * reach < r2
+            add(t[far], d[far], r2[far], self.mass[node[far]])
+
+            near = ~far
+            leaf = near & (self.child_count[node] == 0)
+            if leaf.any():
+                # Sum leaves body by body; a target sitting on a source (its
+                # own body) is skipped by the r2 > 0 test
+                lt, ln = t[leaf], node[leaf]
+                counts = self.end[ln] - self.start[ln]
+                rep = np.repeat(np.arange(len(lt)), counts)
+                offset = np.arange(len(rep)) - np.repeat(np.cumsum(counts) - counts, counts)
+                body = self.start[ln][rep] + offset
+                bd = self.points[body] - targets[lt[rep]]
+                add(lt[rep], bd, np.einsum("ij,ij->i", bd, bd), self.masses[body])
+
+            # Replace every remaining cell by its children
+            opened = near & ~leaf
+            ot, on = t[opened], node[opened]
+            counts = self.child_count[on]
+            rep = np.repeat(np.arange(len(ot)), counts)
+            offset = np.arange(len(rep)) - np.repeat(np.cumsum(counts) - counts, counts)
+            t = ot[rep]
+            node = self.child_first[on][rep] + offset
+        return acc
@@ -0,0 +1,267 @@
+# Orbit catalogs loaded from TLE or CSV files into columnar NumPy arrays.
+#
+# A Catalog holds one array per element (norad id, name, epoch, a, e,
+# inclination, RAAN, argument of perigee, mean anomaly), one row per
+# object. The parsers stream the file in chunks of CHUNK objects and
+# convert each chunk with vectorized fixed-width field casts rather than
+# one float() per field. They never hold more than one chunk of text at a
+# time.
+#
+# load_catalog() caches the parsed columns as .npy files, keyed by the
+# source's path, size and modification time. Later runs memory-map them
+# back in milliseconds. A catalog feeds KeplerOrbits (catalog.orbits()),
+# conjunction screening, and the constellation and orbit visualizers
+# (catalog=... or orbits=catalog).
+#
+# Angles are in degrees, a in km, and epochs in seconds since J2000, so
+# catalog.orbits().positions(t) takes t in seconds since J2000.
+
+import csv
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+
+import numpy as np
+
+from astrosim.ephemeris import DAY, J2000
+from astrosim.kepler import MU_EARTH, KeplerOrbits
+
+CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "astrosim", "catalogs")
+FORMAT = 1  # bump when the cached layout changes
+CHUNK = 65536  # objects parsed per chunk
+NAME_WIDTH = 24
+
+COLUMNS = {
+    "norad": np.int64,
+    "name": f"U{NAME_WIDTH}",
+    "epoch": np.float64,
+    "a": np.float64,
+    "e": np.float64,
+    "inclination": np.float64,
+    "raan": np.float64,
+    "argp": np.float64,
+    "mean_anomaly": np.float64,
+}
+ELEMENTS = ("a", "e", "inclination", "raan", "argp", "mean_anomaly")
+
+# TLE line 2 fields: (start, end) columns, 0-based
+TLE_FIELDS = {"norad": (2, 7), "inclination": (8, 16), "raan": (17, 25), "e": (26, 33),
+              "argp": (34, 42), "mean_anomaly": (43, 51), "mean_motion": (52, 63)}
+TLE_EPOCH = (18, 20, 32)  # line 1: two-digit year, then day of year
+TLE_WIDTH = 69
+
+
+class Catalog:
+    """Orbital elements of many objects, one array per column.
+
+    columns maps every name in COLUMNS to an array with one entry per
+    object. Index with a column name for the array, or with a mask, slice
+    or index array for a sub-catalog.
+    """
+
+    def __init__(self, columns):
+        self.columns = {name: np.asanyarray(columns[name], dtype=dtype) for name, dtype in COLUMNS.items()}
+
+    def __len__(self):
+        return len(self.columns["a"])
+
+    def __getitem__(self, key):
+        if isinstance(key, str):
+            return self.columns[key]
+        return Catalog({name: col[key] for name, col in self.columns.items()})
+
+    def __repr__(self):
+        return f"<Catalog of {len(self)} objects>"
+
+    @property
+    def perigee(self):
+        return self.columns["a"] * (1 - self.columns["e"])
+
+    @property
+    def apogee(self):
+        return self.columns["a"] * (1 + self.columns["e"])
+
+    def orbits(self, mu=MU_EARTH):
+        # Every object as one KeplerOrbits propagator, each from its own epoch
+        return KeplerOrbits(**{name: self.columns[name] for name in ELEMENTS}, epoch=self.columns["epoch"], mu=mu)
+
+    def orbit_dicts(self, colors=("red", "orange", "green", "cyan", "magenta", "yellow")):
+        # Rows in the form of orbits.ORBITS, for the per-orbit visualizer
+        return [{"name": str(self.columns["name"][k]) or str(self.columns["norad"][k]),
+                 **{name: float(self.columns[name][k]) for name in ELEMENTS},
+                 "color": colors[k % len(colors)]}
+                for k in range(len(self))]
+
+    def save(self, path):
+        # One .npy per column plus catalog.json, written to a temporary
+        # directory and renamed into place
+        parent = os.path.dirname(os.path.abspath(path))
+        os.makedirs(parent, exist_ok=True)
+        tmp = tempfile.mkdtemp(dir=parent, prefix=".catalog-")
+        for name, col in self.columns.items():
+            np.save(os.path.join(tmp, name + ".npy"), col)
+        with open(os.path.join(tmp, "catalog.json"), "w") as f:
+            json.dump({"format": FORMAT, "objects": len(self), "columns": list(self.columns)}, f)
+        if os.path.isdir(path):
+            shutil.rmtree(path)
+        os.replace(tmp, path)
+        return path
+
+    @classmethod
+    def load(cls, path, mmap_mode="r"):
+        with open(os.path.join(path, "catalog.json")) as f:
+            meta = json.load(f)
+        if meta["format"] != FORMAT:
+            raise ValueError(f"{path}: catalog format {meta['format']}, expected {FORMAT}")
+        return cls({name: np.load(os.path.join(path, name + ".npy"), mmap_mode=mmap_mode) for name in COLUMNS})
+
+
+def _concat(chunks):
+    if not chunks:
+        return Catalog({name: np.zeros(0, dtype) for name, dtype in COLUMNS.items()})
+    return Catalog({name: np.concatenate([c[name] for c in chunks]) for name in COLUMNS})
+
+
+def _fields(lines, width, start, end):
+    # Column range [start, end) of fixed-width lines as one bytes array
+    block = np.frombuffer("".join(lines).encode("ascii"), dtype=np.uint8).reshape(len(lines), width)
+    return np.ascontiguousarray(block[:, start:end]).view(f"S{end - start}").ravel()
+
+
+def semi_major_axis(mean_motion, mu=MU_EARTH):
+    # a (km) from a mean motion in revolutions per day
+    n = np.asarray(mean_motion, dtype=np.float64) * (2 * np.pi / DAY)
+    return np.cbrt(mu / (n * n))
+
+
+def _tle_chunk(names, line1, line2):
+    line1 = [line[:TLE_WIDTH].ljust(TLE_WIDTH) for line in line1]
+    line2 = [line[:TLE_WIDTH].ljust(TLE_WIDTH) for line in line2]
+    col = {key: _fields(line2, TLE_WIDTH, lo, hi) for key, (lo, hi) in TLE_FIELDS.items()}
+    yy = _fields(line1, TLE_WIDTH, *TLE_EPOCH[:2]).astype(np.int64)
+    day = _fields(line1, TLE_WIDTH, *TLE_EPOCH[1:]).astype(np.float64)
+    year = np.where(yy < 57, 2000 + yy, 1900 + yy)
+    jan1 = (year - 1970).astype("datetime64[Y]").astype("datetime64[s]")
+    epoch = (jan1 - J2000) / np.timedelta64(1, "s") + (day - 1) * DAY
+    return {
+        "norad": col["norad"].astype(np.int64),
+        "name": np.array(names, dtype=COLUMNS["name"]),
+        "epoch": epoch,
+        "a": semi_major_axis(col["mean_motion"].astype(np.float64)),
+        "e": col["e"].astype(np.float64) * 1e-7,  # implied leading decimal point
+        **{key: col[key].astype(np.float64) for key in ("inclination", "raan", "argp", "mean_anomaly")},
+    }
+
+
+def read_tle(path, chunk=CHUNK):
+    # A Catalog from a two- or three-line element file; name lines are
+    # optional ("0 " prefixes are dropped)
+    chunks, names, line1, line2 = [], [], [], []
+    name = ""
+    with open(path, encoding="ascii", errors="replace") as f:
+        for line in f:
+            line = line.rstrip("\r\n")
+            if line.startswith("1 ") and len(line) >= TLE_EPOCH[2]:
+                line1.append(line)
+            elif line.startswith("2 ") and len(line) >= TLE_FIELDS["mean_motion"][1]:
+                line2.append(line)
+                names.append(name)
+                name = ""
+                if len(line2) == chunk:
+                    chunks.append(_tle_chunk(names, line1, line2))
+                    names, line1, line2 = [], [], []
+            elif line.strip():
+                name = line[2:].strip() if line.startswith("0 ") else line.strip()
+    if len(line1) != len(line2):
+        raise ValueError(f"{path}: unpaired TLE lines")
+    if line2:
+        chunks.append(_tle_chunk(names, line1, line2))
+    return _concat(chunks)
+
+
+def _csv_chunk(rows, omm):
+    def column(key, dtype=np.float64):
+        return np.array([row[key] for row in rows], dtype=dtype)
+
+    if omm:
+        # CCSDS OMM columns, as in CelesTrak CSV exports
+        epoch = (column("EPOCH", "datetime64[us]") - J2000) / np.timedelta64(1, "s")
+        return {
+            "norad": column("NORAD_CAT_ID", np.int64),
+            "name": column("OBJECT_NAME", COLUMNS["name"]),
+            "epoch": epoch,
+            "a": semi_major_axis(column("MEAN_MOTION")),
+            "e": column("ECCENTRICITY"),
+            "inclination": column("INCLINATION"),
+            "raan": column("RA_OF_ASC_NODE"),
+            "argp": column("ARG_OF_PERICENTER"),
+            "mean_anomaly": column("MEAN_ANOMALY"),
+        }
+    # Plain element columns named as in COLUMNS; a is required
+    n = len(rows)
+    fields = rows[0].keys()
+    return {
+        "norad": column("norad", np.int64) if "norad" in fields else np.zeros(n, np.int64),
+        "name": column("name", COLUMNS["name"]) if "name" in fields else np.full(n, "", COLUMNS["name"]),
+        **{key: column(key) if key in fields else np.zeros(n) for key in ("epoch",) + ELEMENTS},
+    }
+
+
+def read_csv(path, chunk=CHUNK):
+    # A Catalog from a CSV with a header row: either OMM columns
+    # (MEAN_MOTION, ECCENTRICITY, ...) or this module's column names
+    chunks = []
+    with open(path, newline="") as f:
+        reader = csv.DictReader(f)
+        fields = reader.fieldnames or []
+        omm = "MEAN_MOTION" in fields
+        if not omm and "a" not in fields:
+            raise ValueError(f"{path}: expected OMM columns or an 'a' column")
+        rows = []
+        for row in reader:
+            rows.append(row)
+            if len(rows) == chunk:
+                chunks.append(_csv_chunk(rows, omm))
+                rows = []
+        if rows:
+            chunks.append(_csv_chunk(rows, omm))
+    return _concat(chunks)
+
+
+def read_catalog(path, chunk=CHUNK):
+    # Parse a .csv, or anything else as TLE text
+    if path.lower().endswith(".csv"):
+        return read_csv(path, chunk)
+    return read_tle(path, chunk)
+
+
+def cache_path(path, cache_dir=CACHE_DIR):
+    # Where the parsed copy of a catalog file lives; any edit to the file
+    # gives a new path
+    st = os.stat(path)
+    spec = f"{os.path.abspath(path)}\0{st.st_size}\0{st.st_mtime_ns}\0{FORMAT}"
+    return os.path.join(cache_dir, hashlib.sha256(spec.encode()).hexdigest()[:16])
+
+
+def load_catalog(path, cache=True, cache_dir=CACHE_DIR, mmap_mode="r"):
+    """A Catalog from a TLE or CSV file, parsed once and cached as .npy.
+
+    A Catalog passes through unchanged, and a directory written by
+    Catalog.save is loaded directly. With cache=False the file is always
+    parsed.
+    """
+    if isinstance(path, Catalog):
+        return path
+    path = os.fspath(path)
+    if os.path.isdir(path):
+        return Catalog.load(path, mmap_mode)
+    if not cache:
+        return read_catalog(path)
+    cached = cache_path(path, cache_dir)
+    if os.path.exists(os.path.join(cached, "catalog.json")):
+        return Catalog.load(cached, mmap_mode)
+    catalog = read_catalog(path)
+    catalog.save(cached)
+    return catalog
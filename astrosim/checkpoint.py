@@ -0,0 +1,179 @@
+# Keyframe checkpoints: seek a simulation to any frame without replaying
+# it from the start.
+#
+# A compute core that can be checkpointed implements snapshot(), which
+# returns its mutable state as a dict of NumPy arrays, and restore(), which
+# puts such a dict back. Checkpoints takes a keyframe every `every` steps
+# and keeps them in an in-memory LRU store. seek(frame) restores the
+# nearest keyframe at or before the frame and replays only the steps after
+# it, so any jump costs at most `every` steps.
+#
+# Keyframes beyond max_bytes spill to a directory as .npz files, or are
+# dropped when there is no directory. The first keyframe is always kept.
+# With persist=True every keyframe is written to the directory as soon as
+# it is taken. A run that crashes can then be picked up from its last
+# keyframe by a new process (resume()).
+
+import json
+import os
+import tempfile
+from collections import OrderedDict
+
+import numpy as np
+
+EVERY = 100  # steps between keyframes
+MAX_BYTES = 256 * 2**20  # keyframes held in memory
+KEYFRAME = "keyframe_{:08d}.npz"
+META = "checkpoints.json"
+
+
+def snapshot(sim):
+    # A copy of sim's mutable state that later steps cannot change
+    if not hasattr(sim, "snapshot"):
+        raise TypeError(f"{type(sim).__name__} does not support checkpoints")
+    return {key: np.array(value) for key, value in sim.snapshot().items()}
+
+
+def nbytes(snap):
+    return sum(value.nbytes for value in snap.values())
+
+
+class Checkpoints:
+    """Keyframes of one simulation, taken every `every` steps.
+
+    step() advances the simulation and takes a keyframe whenever its frame
+    becomes a multiple of every. seek(frame) moves it to any frame,
+    backwards or forwards, and returns its state there. tag identifies the
+    run whose keyframes a directory holds (e.g. the simulation name and
+    parameters); reopening the directory with a different tag is an error.
+    """
+
+    def __init__(self, sim, every=EVERY, max_bytes=MAX_BYTES, directory=None, persist=False, tag=None):
+        if persist and directory is None:
+            raise ValueError("persist=True needs a directory")
+        self.sim = sim
+        self.every = every
+        self.max_bytes = max_bytes
+        self.directory = directory
+        self.persist = persist
+        self.stats = dict.fromkeys(("taken", "spilled", "loaded", "restored", "replayed"), 0)
+        self._memory = OrderedDict()  # frame -> snapshot, least recently used first
+        self._bytes = 0
+        self._disk = set()
+        self._first = None
+        if directory is not None:
+            self._open(directory, tag)
+        if sim.frame % every == 0 and sim.frame not in self:
+            self.take()
+
+    def _open(self, directory, tag):
+        os.makedirs(directory, exist_ok=True)
+        meta_path = os.path.join(directory, META)
+        meta = {"every": self.every, "tag": tag}
+        if os.path.exists(meta_path):
+            with open(meta_path) as f:
+                found = json.load(f)
+            if found != meta:
+                raise ValueError(f"{directory} holds keyframes of another run ({found}, expected {meta})")
+        else:
+            with open(meta_path, "w") as f:
+                json.dump(meta, f)
+        prefix, suffix = KEYFRAME.split("{")[0], ".npz"
+        self._disk = {int(name[len(prefix):-len(suffix)]) for name in os.listdir(directory)
+                      if name.startswith(prefix) and name.endswith(suffix)}
+        self._first = min(self._disk, default=None)
+
+    def __contains__(self, frame):
+        return frame in self._memory or frame in self._disk
+
+    def __len__(self):
+        return len(self.frames())
+
+    def frames(self):
+        # Frames of all keyframes, in memory or on disk
+        return sorted(self._memory.keys() | self._disk)
+
+    @property
+    def memory_bytes(self):
+        return self._bytes
+
+    def take(self):
+        # Keyframe of the simulation's current frame
+        frame = self.sim.frame
+        snap = snapshot(self.sim)
+        if self._first is None or frame < self._first:
+            self._first = frame
+        if self.persist:
+            self._write(frame, snap)
+        self._put(frame, snap)
+        self.stats["taken"] += 1
+        return frame
+
+    def _path(self, frame):
+        return os.path.join(self.directory, KEYFRAME.format(frame))
+
+    def _write(self, frame, snap):
+        fd, tmp = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        with os.fdopen(fd, "wb") as f:
+            np.savez(f, **snap)
+        os.replace(tmp, self._path(frame))
+        self._disk.add(frame)
+
+    def _put(self, frame, snap):
+        if frame in self._memory:
+            self._bytes -= nbytes(self._memory.pop(frame))
+        self._memory[frame] = snap
+        self._bytes += nbytes(snap)
+        # Evict least recently used keyframes, never the first
+        for old in list(self._memory):
+            if self._bytes <= self.max_bytes:
+                break
+            if old in (frame, self._first):
+                continue
+            evicted = self._memory.pop(old)
+            self._bytes -= nbytes(evicted)
+            if self.directory is not None and old not in self._disk:
+                self._write(old, evicted)
+                self.stats["spilled"] += 1
+
+    def _get(self, frame):
+        if frame in self._memory:
+            self._memory.move_to_end(frame)
+            return self._memory[frame]
+        with np.load(self._path(frame)) as data:
+            snap = {key: data[key] for key in data.files}
+        self.stats["loaded"] += 1
+        self._put(frame, snap)
+        return snap
+
+    def step(self):
+        self.sim.step()
+        if self.sim.frame % self.every == 0 and self.sim.frame not in self:
+            self.take()
+        return self.sim.state()
+
+    def seek(self, frame):
+        # Move the simulation to `frame` (or where it stops, if it finishes
+        # earlier) and return its state
+        frame = max(int(frame), 0)
+        current = self.sim.frame
+        keyframe = max((k for k in self.frames() if k <= frame), default=None)
+        if keyframe is None:
+            raise ValueError(f"no keyframe at or before frame {frame}")
+        # Stepping on is cheaper than restoring when the simulation already
+        # sits between the keyframe and the target
+        if not keyframe <= current <= frame:
+            self.sim.restore(self._get(keyframe))
+            self.stats["restored"] += 1
+        while self.sim.frame < frame and not getattr(self.sim, "done", False):
+            self.step()
+            self.stats["replayed"] += 1
+        return self.sim.state()
+
+    def resume(self):
+        # Restore the newest keyframe; returns its frame
+        frames = self.frames()
+        if not frames:
+            raise ValueError("no keyframes to resume from")
+        self.seek(frames[-1])
+        return self.sim.frame
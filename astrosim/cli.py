@@ -0,0 +1,232 @@
+# Command line entry point:
+#
+#   python -m astrosim list
+#   python -m astrosim run solar --steps 1000 --out solar.npz
+#   python -m astrosim run solar --steps 1000000 --out solar_run/
+#   python -m astrosim run debris --steps 500 -p num_debris=10000 -p seed=1
+#   python -m astrosim run debris --steps 100000 --checkpoints debris_ck/ --resume
+#   python -m astrosim render hohmann --out hohmann.mp4 --workers 4
+#   python -m astrosim sweep rocket --grid thrust=1000,1500,2000 --lhs 50 --range cd=0.5:1.0
+#
+# `run` steps a simulation's compute core without a display and never
+# imports matplotlib. An --out ending in .npz is written in one go at the
+# end; anything else is a directory that states stream into, one .npy per
+# field, in chunks (see astrosim.recorder). --checkpoints keeps keyframes on
+# disk (see astrosim.checkpoint); with --resume, a run that was cut short
+# carries on from its newest keyframe (a random simulation needs its seed
+# again). `render` draws a view off screen into a video, GIF or PNG
+# directory across a process pool (see astrosim.render). `sweep` runs a
+# simulation over a parameter design, reusing cached results (see
+# astrosim.sweep).
+
+import argparse
+import ast
+import importlib
+import os
+import sys
+import time
+
+import numpy as np
+
+from astrosim import profiling, registry, sweep
+from astrosim.checkpoint import EVERY, Checkpoints
+from astrosim.recorder import Recorder
+from astrosim.runner import record, run_to_arrays
+
+
+def parse_param(text):
+    name, sep, value = text.partition("=")
+    if not sep:
+        raise argparse.ArgumentTypeError(f"expected NAME=VALUE, got {text!r}")
+    try:
+        value = ast.literal_eval(value)
+    except (ValueError, SyntaxError):
+        pass  # keep it as a string
+    return name, value
+
+
+def parse_values(text):
+    name, value = parse_param(text)
+    values = value if isinstance(value, tuple) else (value,) if value != "" else ()
+    return name, list(values)
+
+
+def parse_range(text):
+    name, sep, value = text.partition("=")
+    lo, sep2, hi = value.partition(":")
+    if not sep or not sep2:
+        raise argparse.ArgumentTypeError(f"expected NAME=LOW:HIGH, got {text!r}")
+    return name, (float(lo), float(hi))
+
+
+def add_profile_args(parser):
+    parser.add_argument("--profile", nargs="?", const="1", metavar="TRACE",
+                        help="time every frame and print latency percentiles; "
+                             "with a .json/.csv path, also write the per-frame trace")
+    parser.add_argument("--profile-alloc", action="store_true", help="also track allocations per frame")
+    parser.add_argument("--cprofile", metavar="PATH", help="dump cProfile stats to PATH")
+
+
+def profile_env(args):
+    # The ASTROSIM_PROFILE* settings (see astrosim.profiling) for the flags
+    env = {}
+    if args.profile:
+        env["ASTROSIM_PROFILE"] = args.profile
+    if args.profile_alloc:
+        env["ASTROSIM_PROFILE_ALLOC"] = "1"
+        env.setdefault("ASTROSIM_PROFILE", "1")
+    if args.cprofile:
+        env["ASTROSIM_CPROFILE"] = args.cprofile
+    return env
+
+
+def pid_path(path):
+    # path with a "{pid}" before its extension (trace.json -> trace.{pid}.json)
+    if "{pid}" in path:
+        return path
+    root, ext = os.path.splitext(path)
+    return f"{root}.{{pid}}{ext}"
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog="astrosim", description="AstroSimulations command line")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    sub.add_parser("list", help="list the available simulations")
+
+    run = sub.add_parser("run", help="run a simulation headlessly and save its states")
+    run.add_argument("sim", choices=sorted(registry.SIMULATIONS))
+    run.add_argument("--steps", type=int, default=1000)
+    run.add_argument("--every", type=int, default=1, help="keep every N-th state")
+    run.add_argument("--out", help="output .npz file or streaming directory (default: <sim>.npz)")
+    run.add_argument("--chunk", type=int, help="rows per streamed chunk (default: about 8 MiB)")
+    run.add_argument("--checkpoints", metavar="DIR", help="write a keyframe to DIR every --checkpoint-every steps")
+    run.add_argument("--checkpoint-every", type=int, default=EVERY, metavar="N")
+    run.add_argument("--resume", action="store_true",
+                     help="continue from the newest keyframe in --checkpoints; only later states are saved")
+    run.add_argument("-p", "--param", type=parse_param, action="append", default=[],
+                     help="constructor parameter as NAME=VALUE (repeatable)")
+    add_profile_args(run)
+
+    render = sub.add_parser("render", help="render an animation to a video, GIF or PNG directory")
+    render.add_argument("sim", choices=sorted(name for name, (_, view) in registry.SIMULATIONS.items() if view))
+    render.add_argument("--out", required=True, help=".mp4/.gif file, or a directory for PNG frames")
+    render.add_argument("--frames", type=int, help="frames to render (default: the simulation's own length)")
+    render.add_argument("--workers", type=int, help="worker processes (default: one per CPU)")
+    render.add_argument("--fps", type=float, help="output frame rate (default: the view's interval)")
+    render.add_argument("--dpi", type=float, help="figure resolution")
+    render.add_argument("-p", "--param", type=parse_param, action="append", default=[],
+                        help="constructor parameter as NAME=VALUE (repeatable)")
+    add_profile_args(render)
+
+    sw = sub.add_parser("sweep", help="run a simulation over a parameter design, with cached results")
+    sw.add_argument("sim", choices=sorted(registry.SIMULATIONS))
+    sw.add_argument("--grid", type=parse_values, action="append", default=[],
+                    help="grid axis as NAME=V1,V2,... (repeatable)")
+    design = sw.add_mutually_exclusive_group()
+    design.add_argument("--random", type=int, metavar="N", help="N uniform random points over the --range axes")
+    design.add_argument("--lhs", type=int, metavar="N", help="N Latin hypercube points over the --range axes")
+    sw.add_argument("--range", type=parse_range, action="append", default=[],
+                    help="sampled axis as NAME=LOW:HIGH (repeatable)")
+    sw.add_argument("--seed", type=int, help="master seed of the random designs and replicates")
+    sw.add_argument("--replicates", type=int,
+                    help="run every point N times, each with its own seed spawned from --seed")
+    sw.add_argument("--steps", type=int, default=1000)
+    sw.add_argument("--metrics", help="result function as module:function (default: the final state)")
+    sw.add_argument("--workers", type=int, help="worker processes (default: one per CPU)")
+    sw.add_argument("--cache", default=sweep.CACHE_DIR, help="result cache directory")
+    sw.add_argument("--no-cache", action="store_true")
+    sw.add_argument("--out", help="save params and results to this .npz")
+    sw.add_argument("-p", "--param", type=parse_param, action="append", default=[],
+                    help="fixed constructor parameter as NAME=VALUE (repeatable)")
+    return parser
+
+
+def cmd_list(args):
+    for name in registry.SIMULATIONS:
+        print(name)
+
+
+def cmd_run(args):
+    start = time.perf_counter()
+    params = dict(args.param)
+    sim = registry.create(args.sim, **params)
+    profiler = profiling.from_env({**os.environ, **profile_env(args)})
+    checkpoints, resumed = None, ""
+    if args.resume and not args.checkpoints:
+        sys.exit("--resume needs --checkpoints")
+    # Keyframes hold only the state that changes as a simulation runs; the
+    # rest of a random one must come out of create() the same again
+    if args.resume and registry.takes_seed(args.sim) and params.get("seed") is None:
+        sys.exit(f"--resume needs the seed of the interrupted run (-p seed=N) for {args.sim}")
+    if args.checkpoints:
+        try:
+            checkpoints = Checkpoints(sim, every=args.checkpoint_every, directory=args.checkpoints, persist=True,
+                                      tag=f"{args.sim} {sorted(params.items())!r}")
+        except ValueError as error:
+            sys.exit(f"--checkpoints: {error}")
+        # Nothing to resume from (a first run) starts at step 0
+        keyframe = max((k for k in checkpoints.frames() if k <= args.steps), default=None) if args.resume else None
+        if keyframe:
+            checkpoints.seek(keyframe)
+            resumed = f" (resumed from step {sim.frame})"
+    steps = args.steps - sim.frame
+    out = args.out or f"{args.sim}.npz"
+    if out.endswith(".npz"):
+        np.savez(out, **run_to_arrays(sim, steps, every=args.every, profiler=profiler, checkpoints=checkpoints))
+    else:
+        with Recorder(out, chunk_size=args.chunk) as recorder:
+            record(sim, steps, recorder, every=args.every, profiler=profiler, checkpoints=checkpoints)
+    print(f"{args.sim}: {sim.frame} steps{resumed} in {time.perf_counter() - start:.3f}s -> {out}")
+
+
+def cmd_render(args):
+    from astrosim.render import render
+
+    env = profile_env(args)
+    if env and (args.workers or os.cpu_count() or 1) > 1:
+        # One trace and cProfile file per worker process
+        env = {k: v if v == "1" or k == "ASTROSIM_PROFILE_ALLOC" else pid_path(v) for k, v in env.items()}
+    os.environ.update(env)
+    start = time.perf_counter()
+    frames = render(args.sim, args.out, frames=args.frames, workers=args.workers,
+                    fps=args.fps, dpi=args.dpi, **dict(args.param))
+    print(f"{args.sim}: {frames} frames in {time.perf_counter() - start:.3f}s -> {args.out}")
+
+
+def cmd_sweep(args):
+    points = sweep.grid(**dict(args.grid))
+    if args.random is not None or args.lhs is not None:
+        make = sweep.random_design if args.random is not None else sweep.latin_hypercube
+        rng = np.random.default_rng(args.seed)
+        samples = make(args.lhs if args.random is None else args.random, rng, **dict(args.range))
+        points = [{**p, **q} for p in points for q in samples]
+    if not points:
+        sys.exit(f"{args.sim}: the sweep design has no points")
+    design = [{**dict(args.param), **p} for p in points]
+    if args.replicates:
+        design = sweep.replicate(design, args.replicates, args.seed)
+        points = [{k: v for k, v in p.items() if k != "seed"} for p in design]
+    metrics = None
+    if args.metrics:
+        module, _, func = args.metrics.partition(":")
+        metrics = getattr(importlib.import_module(module), func)
+    cache = None if args.no_cache else sweep.ResultCache(args.cache)
+
+    results, stats = sweep.sweep(args.sim, design, steps=args.steps, metrics=metrics,
+                                 workers=args.workers, cache=cache)
+    print(f"{args.sim}: {stats['points']} points, {stats['runs']} runs, {stats['hits']} cached "
+          f"({stats['hit_rate']:.0%} hit rate) in {stats['seconds']:.3f}s, {stats['runs_per_s']:.1f} runs/s")
+    if args.out:
+        columns = {f"param_{k}": np.array([p[k] for p in points]) for k in points[0]}
+        columns.update({k: np.stack([r[k] for r in results]) for k in results[0]})
+        np.savez(args.out, **columns)
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    {"list": cmd_list, "run": cmd_run, "render": cmd_render, "sweep": cmd_sweep}[args.command](args)
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
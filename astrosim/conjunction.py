@@ -0,0 +1,198 @@
+# Conjunction screening: which objects pass within a threshold distance of
+# each other over a span of time.
+#
+# The span is cut into buckets of `step`. In every bucket all objects are
+# propagated to the bucket's midpoint, and close_pairs() (a spatial hash)
+# finds the pairs within the threshold plus the furthest two objects can
+# close on each other in half a bucket. No closer approach can hide between
+# midpoints. Candidate pairs then go through cheap orbit filters:
+#
+#   apogee/perigee  the radius shells swept by the two orbits must come
+#                   within the threshold of each other
+#   orbit path      (Keplerian orbits) two orbit planes only meet along
+#                   their line of nodes. Away from it the orbits are more
+#                   than the threshold apart, so the orbit radii near the
+#                   nodes must come within reach
+#
+# Survivors are refined to their time of closest approach (TCA) with Newton
+# steps on d/dt |r_rel|^2 = 0. An approach is reported by the bucket that
+# contains its TCA, so each is found once. Ranges of buckets are screened
+# in parallel.
+#
+# Objects are a KeplerOrbits (km, s), a Catalog or catalog file (see
+# astrosim.catalog; times in seconds since J2000), or any other set of
+# tracks with the KeplerOrbits interface: len(), positions(t),
+# states_at(index, t), radius_range() and max_speed(), e.g.
+# DebrisField.tracks() (scene units, frames).
+
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from astrosim.catalog import Catalog, load_catalog
+from astrosim.kepler import KeplerOrbits
+from astrosim.spatial import close_pairs
+
+THRESHOLD = 5.0  # km
+STEP = 10.0  # bucket length (s)
+NEWTON_ITER = 8
+CHUNK_BUCKETS = 16  # buckets per parallel task
+EVENT_KEYS = ("i", "j", "tca", "miss", "speed")
+
+
+def apogee_perigee_filter(objects, i, j, threshold):
+    # True for pairs whose radius shells come within threshold
+    lo, hi = objects.radius_range()
+    return np.maximum(lo[i], lo[j]) - np.minimum(hi[i], hi[j]) <= threshold
+
+
+def _radius_window(orbits, k, direction, delta):
+    # Smallest and largest radius of orbit k within true anomaly delta of
+    # the given in-plane direction (k, 3)
+    nu = np.arctan2(np.einsum("ij,ij->i", direction, orbits._Q[k]), np.einsum("ij,ij->i", direction, orbits._P[k]))
+    a, e = orbits.a[k], orbits.e[k]
+    p = a * (1 - e * e)
+    r = np.stack([p / (1 + e * np.cos(nu + d)) for d in (-delta, 0.0, delta)])
+    lo, hi = r.min(axis=0), r.max(axis=0)
+    # r only turns around at perigee and apogee
+    lo = np.where(np.abs(nu) <= delta, a * (1 - e), lo)
+    hi = np.where(np.pi - np.abs(nu) <= delta, a * (1 + e), hi)
+    return lo, hi
+
+
+def orbit_path_filter(orbits, i, j, threshold):
+    # True for pairs that may still come within threshold once the orbit
+    # geometry is taken into account. A point on orbit i at angle d from
+    # the line of nodes lies r sin(d) sin(I) from the plane of orbit j (I
+    # the relative inclination), so close approaches happen within an angle
+    # delta of either node, where the two orbit radii must meet. Nearly
+    # coplanar pairs, where delta would be wide, always pass.
+    normal_i = np.cross(orbits._P[i], orbits._Q[i])
+    normal_j = np.cross(orbits._P[j], orbits._Q[j])
+    nodes = np.cross(normal_i, normal_j)
+    sin_rel = np.sqrt(np.einsum("ij,ij->i", nodes, nodes))
+    r_min = np.minimum(orbits.a[i] * (1 - orbits.e[i]), orbits.a[j] * (1 - orbits.e[j]))
+    applies = sin_rel * r_min > 2 * threshold  # delta below 30 degrees
+    keep = ~applies
+    k = np.flatnonzero(applies)
+    if not len(k):
+        return keep
+    nodes = nodes[k] / sin_rel[k, None]
+    delta = np.arcsin(threshold / (r_min[k] * sin_rel[k]))
+    near = np.zeros(len(k), dtype=bool)
+    for direction in (nodes, -nodes):
+        lo_i, hi_i = _radius_window(orbits, i[k], direction, delta)
+        lo_j, hi_j = _radius_window(orbits, j[k], direction, delta)
+        near |= (lo_i - hi_j <= threshold) & (lo_j - hi_i <= threshold)
+    keep[k] = near
+    return keep
+
+
+def shell_overlap_pairs(objects, threshold):
+    # How many of all N(N-1)/2 pairs pass the apogee/perigee filter, from
+    # one sort of the perigees
+    lo, hi = objects.radius_range()
+    order = np.argsort(lo)
+    lo, hi = lo[order], hi[order]
+    reach = np.searchsorted(lo, hi + threshold, side="right") - np.arange(1, len(lo) + 1)
+    return int(np.maximum(reach, 0).sum())
+
+
+def refine(objects, i, j, t, lo, hi):
+    # Newton iterations on f(t) = r_rel . v_rel, kept inside [lo, hi].
+    # Returns the TCA, miss distance, relative speed and final f.
+    t = np.array(t, dtype=np.float64)
+    for _ in range(NEWTON_ITER):
+        ri, vi, ai = objects.states_at(i, t)
+        rj, vj, aj = objects.states_at(j, t)
+        r, v = ri - rj, vi - vj
+        f = np.einsum("ij,ij->i", r, v)
+        df = np.einsum("ij,ij->i", v, v) + np.einsum("ij,ij->i", r, ai - aj)
+        # Where the distance is not convex, step to the end it shrinks towards
+        dt = np.where(df > 0, -f / np.where(df > 0, df, 1.0), np.where(f > 0, lo - t, hi - t))
+        t = np.clip(t + dt, lo, hi)
+    ri, vi, _ = objects.states_at(i, t)
+    rj, vj, _ = objects.states_at(j, t)
+    r, v = ri - rj, vi - vj
+    return t, np.linalg.norm(r, axis=1), np.linalg.norm(v, axis=1)
+
+
+def _screen_chunk(args):
+    objects, mids, t0, t1, step, threshold, filters = args
+    reach = threshold + objects.max_speed() * step  # two objects, half a bucket each
+    events = {key: [] for key in EVENT_KEYS}
+    counts = dict.fromkeys(("candidates", "apogee_perigee", "orbit_path", "refined"), 0)
+    path = filters and isinstance(objects, KeplerOrbits)
+    for mid in mids:
+        i, j = close_pairs(objects.positions(mid), reach)
+        counts["candidates"] += len(i)
+        if filters:
+            keep = apogee_perigee_filter(objects, i, j, threshold)
+            i, j = i[keep], j[keep]
+            counts["apogee_perigee"] += len(i)
+            if path:
+                keep = orbit_path_filter(objects, i, j, threshold)
+                i, j = i[keep], j[keep]
+            counts["orbit_path"] += len(i)
+        if not len(i):
+            continue
+        counts["refined"] += len(i)
+        lo, hi = max(mid - step / 2, t0), min(mid + step / 2, t1)
+        tca, miss, speed = refine(objects, i, j, np.full(len(i), mid), lo, hi)
+        # Approaches clamped to a bucket edge belong to the neighbouring bucket
+        own = ((tca > lo) | (lo == t0)) & ((tca < hi) | (hi == t1)) & (miss < threshold)
+        for key, value in zip(EVENT_KEYS, (i, j, tca, miss, speed)):
+            events[key].append(value[own])
+    return events, counts
+
+
+def screen(objects, t0, t1, threshold=THRESHOLD, step=STEP, filters=True, workers=None,
+           chunk_buckets=CHUNK_BUCKETS):
+    """Every approach closer than threshold between t0 and t1.
+
+    Returns the events, sorted by TCA, as arrays i, j (object indices, i <
+    j, or fragment ids for tracks that carry ids), tca, miss and speed
+    (relative speed at TCA), and a stats dict with the pair counts at each
+    stage and the screening rate.
+    """
+    start = time.perf_counter()
+    if isinstance(objects, (str, os.PathLike, Catalog)):
+        objects = load_catalog(objects).orbits()
+    n_buckets = max(1, int(np.ceil((t1 - t0) / step)))
+    step = (t1 - t0) / n_buckets
+    mids = t0 + step * (np.arange(n_buckets) + 0.5)
+    chunks = [(objects, mids[lo:lo + chunk_buckets], t0, t1, step, threshold, filters)
+              for lo in range(0, n_buckets, chunk_buckets)]
+    workers = workers or os.cpu_count() or 1
+    if workers == 1 or len(chunks) == 1:
+        parts = [_screen_chunk(c) for c in chunks]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            parts = list(pool.map(_screen_chunk, chunks))
+
+    events = {key: np.concatenate([np.concatenate(p[0][key]) if p[0][key] else np.zeros(0) for p in parts])
+              for key in EVENT_KEYS}
+    order = np.argsort(events["tca"], kind="stable")
+    events = {key: value[order] for key, value in events.items()}
+    ids = getattr(objects, "ids", None)
+    for key in ("i", "j"):
+        events[key] = events[key].astype(np.intp)
+        if ids is not None:
+            events[key] = ids[events[key]]
+
+    seconds = time.perf_counter() - start
+    n = len(objects)
+    pairs = n * (n - 1) // 2
+    stats = {
+        "objects": n,
+        "pairs": pairs,
+        "shell_overlap_pairs": shell_overlap_pairs(objects, threshold),
+        "buckets": n_buckets,
+        **{key: sum(p[1][key] for p in parts) for key in parts[0][1]},
+        "conjunctions": len(events["tca"]),
+        "seconds": seconds,
+        "pairs_per_s": pairs / seconds,
+    }
+    return events, stats
@@ -0,0 +1,134 @@
+# Compute core for large satellite constellations.
+#
+# Each shell is a Walker-delta pattern: `planes` evenly spaced orbit planes
+# with `per_plane` satellites each, offset between neighbouring planes by
+# `phasing`. All shells share one KeplerOrbits propagator, so a frame is a
+# single vectorized call however many satellites there are. A catalog (see
+# astrosim.catalog) can stand in for the generated shells. Its objects are
+# then grouped by orbit regime instead.
+
+import numpy as np
+
+from astrosim.catalog import load_catalog
+from astrosim.geometry import orbit_polyline
+from astrosim.kepler import KeplerOrbits
+from astrosim.orbits import EARTH_RADIUS
+
+# Starlink-like shells: altitude (km), inclination (deg)
+SHELLS = [
+    {"name": "53.0° shell", "altitude": 550, "inclination": 53.0, "planes": 72, "per_plane": 22, "phasing": 17, "color": "cyan"},
+    {"name": "70.0° shell", "altitude": 570, "inclination": 70.0, "planes": 36, "per_plane": 20, "phasing": 11, "color": "magenta"},
+    {"name": "97.6° shell", "altitude": 560, "inclination": 97.6, "planes": 6, "per_plane": 58, "phasing": 1, "color": "yellow"},
+]
+
+SECONDS_PER_FRAME = 20.0
+
+# Catalog objects are grouped by mean altitude (km): name, upper bound, color
+REGIMES = [("LEO", 2000, "cyan"), ("MEO", 35000, "magenta"), ("GEO", 36500, "yellow"), ("HEO", np.inf, "orange")]
+
+
+def walker_delta(planes, per_plane, phasing, a, inclination, e=0.0):
+    # Element arrays (degrees) for a Walker-delta i: t/p/f pattern
+    plane = np.repeat(np.arange(planes), per_plane)
+    slot = np.tile(np.arange(per_plane), planes)
+    total = planes * per_plane
+    return {
+        "a": np.full(total, float(a)),
+        "e": np.full(total, float(e)),
+        "inclination": np.full(total, float(inclination)),
+        "raan": 360.0 * plane / planes,
+        "argp": np.zeros(total),
+        "mean_anomaly": (360.0 * slot / per_plane + 360.0 * phasing * plane / total) % 360.0,
+    }
+
+
+def single_shell(num_satellites, altitude=550, inclination=53.0, color="cyan"):
+    # One shell of roughly num_satellites in a near-square plane layout
+    planes = max(1, int(round(np.sqrt(num_satellites))))
+    per_plane = -(-num_satellites // planes)
+    return [{"name": f"{planes * per_plane} satellites", "altitude": altitude, "inclination": inclination,
+             "planes": planes, "per_plane": per_plane, "phasing": 1, "color": color}]
+
+
+class Constellation:
+    """Every satellite of every shell, propagated together.
+
+    state() gives all (n_satellites, 3) positions in km; slices[k] selects
+    shell k's rows.
+
+    catalog (a Catalog or a catalog file) replaces the shells. Its objects
+    are sorted into orbit regimes, and frames start at the newest epoch
+    unless start (seconds since J2000) is given.
+    """
+
+    def __init__(self, shells=SHELLS, seconds_per_frame=SECONDS_PER_FRAME, catalog=None, start=None):
+        self.seconds_per_frame = seconds_per_frame
+        self.start = 0.0 if start is None else start
+        self.frame = 0
+        if catalog is not None:
+            self._from_catalog(load_catalog(catalog), start)
+            return
+        self.shells = shells
+        elements, self.slices, start = [], [], 0
+        for shell in shells:
+            el = walker_delta(shell["planes"], shell["per_plane"], shell["phasing"],
+                              EARTH_RADIUS + shell["altitude"], shell["inclination"])
+            elements.append(el)
+            n = len(el["a"])
+            self.slices.append(slice(start, start + n))
+            start += n
+        self.propagator = KeplerOrbits(**{key: np.concatenate([el[key] for el in elements]) for key in elements[0]})
+        self._state = self.state_at(0)
+
+    def _from_catalog(self, catalog, start):
+        regime = np.searchsorted([bound for _, bound, _ in REGIMES], catalog["a"] - EARTH_RADIUS)
+        order = np.argsort(regime, kind="stable")
+        counts = np.bincount(regime, minlength=len(REGIMES))
+        self.rows = order  # catalog row of every satellite
+        self.shells, self.slices, lo = [], [], 0
+        for (name, _, color), count in zip(REGIMES, counts):
+            if count:
+                self.shells.append({"name": f"{name} ({count})", "color": color})
+                self.slices.append(slice(lo, lo + count))
+            lo += count
+        self.propagator = catalog[order].orbits()
+        if start is None:
+            self.start = float(catalog["epoch"].max(initial=0.0))
+        self._state = self.state_at(0)
+
+    def __len__(self):
+        return len(self.propagator)
+
+    def plane_paths(self, k, samples=200):
+        # (planes, 3, samples) outlines of shell k's orbit planes; none for
+        # catalog regimes
+        shell = self.shells[k]
+        if "planes" not in shell:
+            return np.zeros((0, 3, samples))
+        a = EARTH_RADIUS + shell["altitude"]
+        return np.array([orbit_polyline(a, 0.0, shell["inclination"], samples, raan)
+                         for raan in 360.0 * np.arange(shell["planes"]) / shell["planes"]])
+
+    def state_at(self, frame):
+        return {"positions": self.propagator.positions(self.start + frame * self.seconds_per_frame)}
+
+    def step(self):
+        self._state = self.state_at(self.frame)
+        self.frame += 1
+
+    def state(self):
+        return self._state
+
+    def snapshot(self):
+        # Positions follow from the frame alone (see astrosim.checkpoint)
+        return {"frame": self.frame}
+
+    def restore(self, snap):
+        self.frame = int(snap["frame"])
+        self._state = self.state_at(max(self.frame - 1, 0))
+
+
+def create(num_satellites=None, **params):
+    if num_satellites is not None:
+        params["shells"] = single_shell(num_satellites)
+    return Constellation(**params)
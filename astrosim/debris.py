@@ -0,0 +1,278 @@
+# Headless debris field engine for the Space Debris Cleanup simulation.
+#
+# All fragment state lives in flat NumPy arrays (structure of arrays) instead
+# of one dict per fragment, so a single step advances every band at once and
+# the field scales to millions of fragments.
+
+import numpy as np
+
+from astrosim.spatial import GridIndex, brute_force_pairs
+
+BANDS = ("LEO", "MEO", "GEO")
+LEO, MEO, GEO = range(3)
+
+# Torus geometry of each band: major radius R, minor radius r
+BAND_R = np.array([3.0, 6.0, 9.0])
+BAND_r = np.array([0.3, 1.5, 1.5])
+
+# Debris angular speed range (rad/frame) for each band
+DEBRIS_SPEED_RANGES = np.array([
+    [0.035, 0.065],
+    [0.02, 0.04],
+    [0.01, 0.02],
+])
+
+# Collector satellite speed (rad/frame) for each band
+SAT_SPEEDS = np.array([0.05, 0.03, 0.01])
+
+CAPTURE_RADIUS = 0.7
+
+# Simulated time per frame: a LEO collector at 0.05 rad/frame completes a
+# ~90 minute orbit in about 126 frames
+FRAME_SECONDS = 43.0
+
+# Incremental rotation drifts by a few ulps per step; recompute positions
+# from theta this often to keep them exact
+RESYNC_EVERY = 256
+
+
+def torus_points(R, r, theta, phi):
+    # Works with scalars or arrays; R and r may be per-point arrays
+    ring = R + r * np.cos(phi)
+    return ring * np.cos(theta), ring * np.sin(theta), r * np.sin(phi)
+
+
+class DebrisField:
+    """Debris fragments and the collector satellites sweeping them up.
+
+    theta, phi, speed, band and captured are parallel arrays with one entry
+    per fragment; sat_band and sat_speeds describe the collectors (one per
+    band by default). Call step() once per animation frame.
+
+    Captures are found with a GridIndex over the fragment positions; pass
+    use_index=False to fall back to the brute-force distance check.
+    """
+
+    def __init__(self, theta, phi, speed, band, capture_radius=CAPTURE_RADIUS,
+                 sat_speeds=SAT_SPEEDS, sat_band=None, sat_theta=None, use_index=True, skin=None):
+        self.theta = np.ascontiguousarray(theta, dtype=np.float64)
+        self.phi = np.ascontiguousarray(phi, dtype=np.float64)
+        self.speed = np.ascontiguousarray(speed, dtype=np.float64)
+        self.band = np.ascontiguousarray(band, dtype=np.int8)
+        self.captured = np.zeros(len(self.theta), dtype=bool)
+        # Index of the collector that captured each fragment, -1 while live
+        self.captured_by = np.full(len(self.theta), -1, dtype=np.int32)
+        self.capture_radius = capture_radius
+        # Collectors ride their band's torus at (sat_theta, sat_phi) and move
+        # by (sat_speeds, sat_phi_speeds) after every step
+        self.sat_speeds = np.array(sat_speeds, dtype=np.float64)
+        self.sat_band = (np.arange(len(self.sat_speeds)) if sat_band is None
+                         else np.asarray(sat_band)).astype(np.int8)
+        self.sat_theta = (np.zeros(len(self.sat_speeds)) if sat_theta is None
+                          else np.array(sat_theta, dtype=np.float64))
+        self.sat_phi = np.zeros(len(self.sat_speeds))
+        self.sat_phi_speeds = np.zeros(len(self.sat_speeds))
+        self.frame = 0
+
+        # phi never changes, so the ring radius and height of every fragment
+        # are fixed; each step only has to rotate them by theta
+        R, r = BAND_R[self.band], BAND_r[self.band]
+        self._ring = R + r * np.cos(self.phi)
+        # Coordinates are stored as rows of a (3, N) array so every update
+        # writes contiguous memory; positions exposes the (N, 3) view
+        self._xyz = np.empty((3, len(self.theta)))
+        self._xyz[2] = r * np.sin(self.phi)
+        self._scratch = np.empty((2, len(self.theta)))
+        # Each step rotates a fragment by its own speed, so keep the per-step
+        # rotation instead of evaluating cos/sin of theta every frame
+        self._cos_step = np.cos(self.speed)
+        self._sin_step = np.sin(self.speed)
+        self._sync_positions()
+        self.sat_pos = self.satellite_positions()
+
+        # A fragment moves at most one chord of its ring per step
+        self._max_step = float(np.max(self._ring * np.abs(self.speed), initial=0.0))
+        if use_index:
+            skin = capture_radius if skin is None else skin
+            self.index = GridIndex(capture_radius, skin=max(skin, self._max_step))
+        else:
+            self.index = None
+
+    @classmethod
+    def random(cls, num_debris=5, rng=None, **kwargs):
+        # num_debris fragments per band, spread uniformly over each torus
+        rng = np.random.default_rng(rng)
+        n = num_debris * len(BANDS)
+        band = np.repeat(np.arange(len(BANDS)), num_debris)
+        theta = rng.uniform(0, 2 * np.pi, n)
+        phi = rng.uniform(0, 2 * np.pi, n)
+        lo, hi = DEBRIS_SPEED_RANGES[band].T
+        speed = rng.uniform(lo, hi)
+        return cls(theta, phi, speed, band, **kwargs)
+
+    def __len__(self):
+        return len(self.theta)
+
+    @property
+    def positions(self):
+        # (N, 3) cartesian positions; captured fragments keep their last spot
+        return self._xyz.T
+
+    @property
+    def live(self):
+        return ~self.captured
+
+    def satellite_positions(self):
+        x, y, z = torus_points(BAND_R[self.sat_band], BAND_r[self.sat_band], self.sat_theta, self.sat_phi)
+        return np.column_stack([x, y, z])
+
+    def _sync_positions(self):
+        # Exact positions from theta
+        x, y = self._xyz[0], self._xyz[1]
+        np.cos(self.theta, out=x)
+        x *= self._ring
+        np.sin(self.theta, out=y)
+        y *= self._ring
+
+    def _rotate_positions(self):
+        # x, y <- R(speed) (x, y); captured fragments have an identity
+        # rotation, so the whole array is updated without gathering
+        x, y = self._xyz[0], self._xyz[1]
+        xs, ys = self._scratch
+        np.multiply(x, self._sin_step, out=xs)
+        np.multiply(y, self._sin_step, out=ys)
+        x *= self._cos_step
+        x -= ys
+        y *= self._cos_step
+        y += xs
+
+    def capture(self):
+        # Mark live fragments within capture_radius of a collector in their
+        # own band; returns the newly captured fragment indices
+        sat_idx, idx = self.capture_pairs()
+        same_band = self.band[idx] == self.sat_band[sat_idx]
+        sat_idx, idx = sat_idx[same_band], idx[same_band]
+        # A fragment in range of several collectors goes to the first one
+        idx, first = np.unique(idx, return_index=True)
+        self.mark_captured(idx, sat_idx[first])
+        return idx
+
+    def capture_pairs(self):
+        # All (collector, fragment) pairs within capture_radius, any band
+        if self.index is None:
+            return brute_force_pairs(self.positions, self.sat_pos, self.capture_radius, active=~self.captured)
+        if self.index.stale:
+            self.index.build(self.positions, active=~self.captured)
+        return self.index.query_pairs(self.positions, self.sat_pos)
+
+    def mark_captured(self, idx, by=-1):
+        self.captured[idx] = True
+        self.captured_by[idx] = by
+        self._cos_step[idx] = 1.0
+        self._sin_step[idx] = 0.0
+        if self.index is not None and not self.index.stale:
+            self.index.discard(idx)
+
+    def step(self):
+        # Advance live debris, place the collectors, then run the capture
+        # check. Collectors move on by their speeds afterwards, so a
+        # controller can retarget them between steps. Returns the indices of
+        # fragments captured during this step.
+        live = ~self.captured
+        np.add(self.theta, self.speed, out=self.theta, where=live)
+        if self.frame % RESYNC_EVERY == RESYNC_EVERY - 1:
+            self._sync_positions()
+        else:
+            self._rotate_positions()
+        if self.index is not None:
+            self.index.advance(self._max_step)
+        self.sat_pos = self.satellite_positions()
+        self.sat_theta += self.sat_speeds
+        self.sat_phi += self.sat_phi_speeds
+        self.frame += 1
+        return self.capture()
+
+    def state(self):
+        # Views into the live arrays; copy anything that must outlive the
+        # next step
+        return {"positions": self.positions, "captured": self.captured, "sat_pos": self.sat_pos}
+
+    def snapshot(self):
+        # Mutable state for astrosim.checkpoint. The rotated x, y rows are
+        # kept rather than recomputed from theta, so a restored run
+        # continues bit for bit.
+        return {"theta": self.theta, "xy": self._xyz[:2], "captured": self.captured,
+                "captured_by": self.captured_by, "sat_pos": self.sat_pos, "sat_theta": self.sat_theta,
+                "sat_phi": self.sat_phi, "sat_speeds": self.sat_speeds, "sat_phi_speeds": self.sat_phi_speeds,
+                "frame": self.frame}
+
+    def restore(self, snap):
+        # Copies into the field's own buffers
+        self.theta[:] = snap["theta"]
+        self._xyz[:2] = snap["xy"]
+        self.captured[:] = snap["captured"]
+        self.captured_by[:] = snap["captured_by"]
+        np.cos(self.speed, out=self._cos_step)
+        np.sin(self.speed, out=self._sin_step)
+        self._cos_step[self.captured] = 1.0
+        self._sin_step[self.captured] = 0.0
+        self.sat_pos = np.array(snap["sat_pos"], dtype=np.float64)
+        for key in ("sat_theta", "sat_phi", "sat_speeds", "sat_phi_speeds"):
+            getattr(self, key)[:] = snap[key]
+        self.frame = int(snap["frame"])
+        if self.index is not None:
+            self.index.invalidate()
+
+    def band_positions(self, band, live_only=True):
+        mask = self.band == band
+        if live_only:
+            mask &= ~self.captured
+        return self._xyz.T[mask]
+
+    def tracks(self):
+        # The live fragments' motion from this frame on, for conjunction
+        # screening (see astrosim.conjunction)
+        return DebrisTracks(self)
+
+
+class DebrisTracks:
+    """Live fragments as functions of time, t in frames from now.
+
+    Every fragment circles the z axis at a fixed ring radius and height.
+    ids maps each track back to its fragment index in the field.
+    """
+
+    def __init__(self, field):
+        self.ids = np.flatnonzero(~field.captured)
+        self.theta = field.theta[self.ids].copy()
+        self.speed = field.speed[self.ids]
+        self.ring = field._ring[self.ids]
+        self.z = field._xyz[2, self.ids]
+
+    def __len__(self):
+        return len(self.ids)
+
+    def radius_range(self):
+        r = np.hypot(self.ring, self.z)
+        return r, r
+
+    def max_speed(self):
+        return float(np.max(self.ring * np.abs(self.speed), initial=0.0))
+
+    def positions(self, t):
+        theta = self.theta + self.speed * t
+        return np.column_stack([self.ring * np.cos(theta), self.ring * np.sin(theta), self.z])
+
+    def states_at(self, index, t):
+        ring, w = self.ring[index], self.speed[index]
+        theta = self.theta[index] + w * t
+        c, s = ring * np.cos(theta), ring * np.sin(theta)
+        zero = np.zeros(len(ring))
+        pos = np.column_stack([c, s, self.z[index]])
+        vel = np.column_stack([-w * s, w * c, zero])
+        acc = np.column_stack([-w * w * c, -w * w * s, zero])
+        return pos, vel, acc
+
+
+def create(num_debris=5, seed=None, **params):
+    return DebrisField.random(num_debris, rng=np.random.default_rng(seed), **params)
@@ -0,0 +1,154 @@
+# Tabulated planet ephemerides with interpolated lookups.
+#
+# A planet model (any function of time returning positions and velocities)
+# is evaluated once on a uniform grid of epochs. Between neighbouring epochs
+# it is replaced by the cubic Hermite polynomial that matches the positions
+# and velocities at both ends, and the table keeps those polynomials'
+# coefficients. A lookup at any time inside the span is then one gathered
+# table row and a few multiply-adds. Tables can be saved to a directory and
+# memory-mapped back, so many processes or runs can share one table without
+# recomputing it.
+#
+# The table does not care about units. Times and velocities just have to
+# agree: velocities are position units per time unit of the model.
+
+import json
+import os
+
+import numpy as np
+
+from astrosim.kepler import KeplerOrbits
+
+MU_SUN = 1.32712440018e11  # km^3 / s^2
+AU_KM = 1.495978707e8
+DAY = 86400.0  # seconds
+J2000 = np.datetime64("2000-01-01T12:00")
+
+# Mean elements at J2000 (Standish): a (km), e, inclination, RAAN, argument
+# of perihelion, mean anomaly (deg)
+PLANET_ELEMENTS = {
+    "mercury": (0.38709927 * AU_KM, 0.20563593, 7.00497902, 48.33076593, 29.12703035, 174.79252722),
+    "venus": (0.72333566 * AU_KM, 0.00677672, 3.39467605, 76.67984255, 54.92262463, 50.37663232),
+    "earth": (1.00000261 * AU_KM, 0.01671123, -0.00001531, 0.0, 102.93768193, -2.47311027),
+    "mars": (1.52371034 * AU_KM, 0.09339410, 1.84969142, 49.55953891, 286.4968315, 19.39019754),
+    "jupiter": (5.20288700 * AU_KM, 0.04838624, 1.30439695, 100.47390909, 274.25457074, 19.66796068),
+    "saturn": (9.53667594 * AU_KM, 0.05386179, 2.48599187, 113.66242448, 338.93645383, -42.64463408),
+    "uranus": (19.18916464 * AU_KM, 0.04725744, 0.77263783, 74.01692503, 96.93735127, 142.28382821),
+    "neptune": (30.06992276 * AU_KM, 0.00859048, 1.77004347, 131.78422574, 273.18053653, -100.08479196),
+}
+
+
+def j2000_days(dates):
+    # Days since J2000 for ISO date strings or datetime64 values
+    return (np.asarray(dates, dtype="datetime64[s]") - J2000) / np.timedelta64(1, "D")
+
+
+def planet_orbits(names=tuple(PLANET_ELEMENTS)):
+    # KeplerOrbits of the named planets about the Sun; time is seconds
+    # since J2000
+    elements = np.array([PLANET_ELEMENTS[name] for name in names]).T
+    return KeplerOrbits(*elements, mu=MU_SUN)
+
+
+class Ephemeris:
+    """Interpolation table of n_bodies bodies on a uniform grid of epochs.
+
+    The table holds, for each interval [t0 + k step, t0 + (k+1) step], the
+    (4, n_bodies, 3) cubic Hermite coefficients through the states at both
+    ends. states(t) evaluates them for an array of times inside the span.
+    Bodies can be picked by name.
+    """
+
+    def __init__(self, t0, step, coefficients, names=None):
+        self.t0 = float(t0)
+        self.step = float(step)
+        self.coefficients = coefficients  # (n_epochs - 1, 4, n_bodies, 3)
+        n_bodies = coefficients.shape[2]
+        self.names = list(names) if names is not None else [str(i) for i in range(n_bodies)]
+        self.t1 = self.t0 + self.step * len(coefficients)
+
+    @classmethod
+    def from_states(cls, t0, step, positions, velocities, names=None):
+        # Table through (n_epochs, n_bodies, 3) states at t0, t0 + step, ...
+        if positions.shape != velocities.shape or len(positions) < 2:
+            raise ValueError("need matching position and velocity tables of at least two epochs")
+        p0, p1 = positions[:-1], positions[1:]
+        v0, v1 = velocities[:-1] * step, velocities[1:] * step
+        d = p1 - p0
+        # p(s) = p0 + s (v0 + s (c2 + s c3)) for s in [0, 1]
+        coefficients = np.stack([p0, v0, 3 * d - 2 * v0 - v1, v0 + v1 - 2 * d], axis=1)
+        return cls(t0, step, coefficients, names)
+
+    @classmethod
+    def tabulate(cls, model, t0, t1, step, names=None):
+        # Evaluate model(times) -> (positions, velocities), each
+        # (n_epochs, n_bodies, 3), once over [t0, t1]
+        n = int(np.ceil((t1 - t0) / step - 1e-9)) + 1
+        positions, velocities = model(t0 + step * np.arange(n))
+        return cls.from_states(t0, step, np.asarray(positions), np.asarray(velocities), names)
+
+    @classmethod
+    def load(cls, path, mmap_mode="r"):
+        with open(os.path.join(path, "ephemeris.json")) as f:
+            meta = json.load(f)
+        coefficients = np.load(os.path.join(path, "coefficients.npy"), mmap_mode=mmap_mode)
+        return cls(meta["t0"], meta["step"], coefficients, meta["names"])
+
+    def save(self, path):
+        os.makedirs(path, exist_ok=True)
+        np.save(os.path.join(path, "coefficients.npy"), self.coefficients)
+        with open(os.path.join(path, "ephemeris.json"), "w") as f:
+            json.dump({"t0": self.t0, "step": self.step, "names": self.names}, f)
+
+    def __len__(self):
+        # Number of tabulated epochs
+        return len(self.coefficients) + 1
+
+    def states(self, t, bodies=None, velocities=True):
+        """Interpolated (..., n_bodies, 3) positions (and velocities) at t.
+
+        bodies picks bodies by name or index; a single name drops the body
+        axis. Times outside [t0, t1] raise ValueError.
+        """
+        t = np.asarray(t, dtype=np.float64)
+        u = (t - self.t0) / self.step
+        if np.any(u < 0) or np.any(u > len(self.coefficients)):
+            raise ValueError(f"times outside the tabulated span [{self.t0}, {self.t1}]")
+        k = np.minimum(u.astype(np.int64), len(self.coefficients) - 1)
+        table = self.coefficients
+        if isinstance(bodies, (str, int)):
+            # A strided view, so the gather below reads only this body
+            table = table[:, :, self._index(bodies)]
+        # One gathered row per time; on a memmap this reads just those rows
+        c = table[k]
+        if bodies is not None and not isinstance(bodies, (str, int)):
+            c = c[..., [self._index(b) for b in bodies], :]
+        s = (u - k).reshape(u.shape + (1,) * (c.ndim - u.ndim - 1))
+        c0, c1, c2, c3 = np.moveaxis(c, u.ndim, 0)
+        pos = c3 * s
+        pos += c2
+        pos *= s
+        pos += c1
+        pos *= s
+        pos += c0
+        if not velocities:
+            return pos
+        vel = 3 * c3 * s
+        vel += 2 * c2
+        vel *= s
+        vel += c1
+        vel /= self.step
+        return pos, vel
+
+    def positions_at(self, t, bodies=None):
+        return self.states(t, bodies, velocities=False)
+
+    def _index(self, body):
+        return self.names.index(body) if isinstance(body, str) else body
+
+
+def planet_ephemeris(t0, t1, step, names=tuple(PLANET_ELEMENTS)):
+    # Table of the J2000 Kepler planets between two dates in days since
+    # J2000; states are heliocentric km and km/s, queried in seconds
+    orbits = planet_orbits(names)
+    return Ephemeris.tabulate(lambda t: orbits.positions(t, velocities=True), t0 * DAY, t1 * DAY, step * DAY, names)
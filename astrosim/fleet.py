@@ -0,0 +1,230 @@
+# Fleet scheduler for the debris cleanup simulation.
+#
+# Collectors are assigned debris targets in batches by solving a min-cost
+# assignment over a phase-angle / delta-v cost matrix, then steered towards
+# their target on the band torus. Assignment only runs again when a capture
+# takes away a collector's target, and then only for the collectors that were
+# freed.
+
+import time
+
+import numpy as np
+
+from astrosim.debris import FRAME_SECONDS
+
+# Largest extra angular rate (rad/frame) a collector can use to close on its
+# target along the ring (theta) and around the tube (phi)
+CHASE_RATE = 0.02
+PHI_RATE = 0.05
+
+# Each collector only considers this many of its cheapest targets, found by
+# scanning the WINDOW fragments nearest to it in theta
+CANDIDATES = 8
+WINDOW = 1024
+
+
+def wrap_angle(a):
+    # Map angles to [-pi, pi)
+    return (a + np.pi) % (2 * np.pi) - np.pi
+
+
+def angle_gap(a, b):
+    # |wrap_angle(a - b)| for angles already reduced to [0, 2pi); avoids the
+    # float modulo, which dominates cost-matrix construction
+    d = np.abs(a - b)
+    return np.minimum(d, 2 * np.pi - d)
+
+
+def hungarian(cost):
+    """Minimum-cost assignment for a rectangular cost matrix.
+
+    Returns (row_idx, col_idx) like scipy.optimize.linear_sum_assignment;
+    every row (or every column, if there are fewer columns) is assigned.
+    Shortest augmenting path with potentials, O(n^2 m) with the inner scan
+    over columns vectorised.
+    """
+    cost = np.asarray(cost, dtype=np.float64)
+    transposed = cost.shape[0] > cost.shape[1]
+    if transposed:
+        cost = cost.T
+    n, m = cost.shape
+
+    # 1-based rows/columns; column 0 is the virtual start of each search
+    u = np.zeros(n + 1)
+    v = np.zeros(m + 1)
+    row_of = np.zeros(m + 1, dtype=np.intp)
+    way = np.zeros(m + 1, dtype=np.intp)
+    for i in range(1, n + 1):
+        row_of[0] = i
+        j0 = 0
+        minv = np.full(m + 1, np.inf)
+        used = np.zeros(m + 1, dtype=bool)
+        while True:
+            used[j0] = True
+            i0 = row_of[j0]
+            reduced = cost[i0 - 1] - u[i0] - v[1:]
+            free = ~used[1:]
+            better = free & (reduced < minv[1:])
+            minv[1:][better] = reduced[better]
+            way[1:][better] = j0
+            masked = np.where(free, minv[1:], np.inf)
+            j1 = int(np.argmin(masked)) + 1
+            delta = masked[j1 - 1]
+            u[row_of[used]] += delta
+            v[used] -= delta
+            minv[~used] -= delta
+            j0 = j1
+            if row_of[j0] == 0:
+                break
+        while j0:
+            j1 = way[j0]
+            row_of[j0] = row_of[j1]
+            j0 = j1
+
+    cols = np.flatnonzero(row_of[1:])
+    rows = row_of[1:][cols] - 1
+    if transposed:
+        rows, cols = cols, rows
+    order = np.argsort(rows)
+    return rows[order], cols[order]
+
+
+class FleetScheduler:
+    """Assigns and steers the collectors of a DebrisField.
+
+    Call step() instead of field.step(); report() summarises throughput and
+    re-plan cost.
+    """
+
+    def __init__(self, field, chase_rate=CHASE_RATE, phi_rate=PHI_RATE,
+                 candidates=CANDIDATES, window=WINDOW, dv_weight=1.0):
+        self.field = field
+        self.chase_rate = chase_rate
+        self.phi_rate = phi_rate
+        self.candidates = candidates
+        self.window = window
+        self.dv_weight = dv_weight
+        self.base_speeds = field.sat_speeds.copy()
+        # Fragment index each collector is chasing, -1 when idle
+        self.target = np.full(len(field.sat_band), -1, dtype=np.intp)
+        self.replan_seconds = []
+        self._start_frame = field.frame
+        self._start_captured = int(field.captured.sum())
+        self.plan()
+
+    def cost(self, sats, frags):
+        # Frames needed to close the phase gap, plus the delta-v (as a rate
+        # change, in the same frame units) to match the target's drift.
+        # sats and frags broadcast against each other; angles come from the
+        # snapshot taken by _reduce_angles().
+        d_theta = angle_gap(self._theta[frags], self._sat_theta[sats])
+        d_phi = angle_gap(self._phi[frags], self._sat_phi[sats])
+        closing = np.maximum(d_theta / self.chase_rate, d_phi / self.phi_rate)
+        dv = np.abs(self.field.speed[frags] - self.base_speeds[sats])
+        return closing + self.dv_weight * dv / self.chase_rate
+
+    def _reduce_angles(self):
+        two_pi = 2 * np.pi
+        f = self.field
+        self._theta = f.theta % two_pi
+        self._phi = f.phi % two_pi
+        self._sat_theta = f.sat_theta % two_pi
+        self._sat_phi = f.sat_phi % two_pi
+
+    def cost_matrix(self, sats, frags):
+        return self.cost(sats[:, None], frags[None, :])
+
+    def _candidate_columns(self, sats, frags):
+        # Union of every collector's `candidates` cheapest fragments. Each
+        # collector scans a window of fragments sorted by theta; a fragment
+        # outside the window is at least `gap` away in theta, so the window is
+        # exact whenever its k-th best cost is below gap / chase_rate.
+        # Collectors failing that test fall back to a full scan.
+        k = min(self.candidates, len(frags))
+        w = min(self.window, len(frags))
+        theta = self._theta[frags]
+        order = np.argsort(theta)
+        theta = theta[order]
+        sat_theta = self._sat_theta[sats]
+        pos = np.searchsorted(theta, sat_theta)
+        win = (pos[:, None] + np.arange(-(w // 2), w - w // 2)) % len(frags)
+        cand = frags[order[win]]
+        cost = self.cost(sats[:, None], cand)
+        top = np.argpartition(cost, k - 1, axis=1)[:, :k]
+        best = np.take_along_axis(cand, top, axis=1)
+
+        if w < len(frags):
+            kth = np.take_along_axis(cost, top, axis=1).max(axis=1)
+            edges = theta[win[:, [0, -1]]]
+            gap = angle_gap(edges, sat_theta[:, None]).min(axis=1)
+            inexact = np.flatnonzero(kth > gap / self.chase_rate)
+            if len(inexact):
+                full = self.cost_matrix(sats[inexact], frags)
+                best[inexact] = frags[np.argpartition(full, k - 1, axis=1)[:, :k]]
+        return np.unique(best)
+
+    def plan(self, sats=None):
+        # Batch-assign targets to the given collectors (default: all idle
+        # ones) from the live fragments nobody else is chasing
+        f = self.field
+        if sats is None:
+            sats = np.flatnonzero(self.target < 0)
+        if len(sats) == 0:
+            return
+        start = time.perf_counter()
+        self.target[sats] = -1
+        taken = np.zeros(len(f), dtype=bool)
+        taken[self.target[self.target >= 0]] = True
+        free = ~f.captured & ~taken
+        self._reduce_angles()
+
+        for band in np.unique(f.sat_band[sats]):
+            band_sats = sats[f.sat_band[sats] == band]
+            frags = np.flatnonzero(free & (f.band == band))
+            if len(frags) == 0:
+                continue
+            # Only each collector's cheapest few targets can win the
+            # assignment, so solve it over the union of those
+            frags = self._candidate_columns(band_sats, frags)
+            rows, cols = hungarian(self.cost_matrix(band_sats, frags))
+            self.target[band_sats[rows]] = frags[cols]
+        self.replan_seconds.append(time.perf_counter() - start)
+
+    def steer(self):
+        # Match each target's drift and close the remaining phase gap at no
+        # more than the chase rates; idle collectors coast at base speed
+        f = self.field
+        busy = self.target >= 0
+        tgt = self.target[busy]
+        d_theta = wrap_angle(f.theta[tgt] + f.speed[tgt] - f.sat_theta[busy])
+        d_phi = wrap_angle(f.phi[tgt] - f.sat_phi[busy])
+        f.sat_speeds[:] = self.base_speeds
+        f.sat_speeds[busy] = f.speed[tgt] + np.clip(d_theta, -self.chase_rate, self.chase_rate)
+        f.sat_phi_speeds[:] = 0.0
+        f.sat_phi_speeds[busy] = np.clip(d_phi, -self.phi_rate, self.phi_rate)
+
+    def step(self):
+        self.steer()
+        newly = self.field.step()
+        if len(newly):
+            # Re-plan only the collectors whose target just disappeared
+            lost = (self.target >= 0) & self.field.captured[np.maximum(self.target, 0)]
+            if lost.any():
+                self.plan(np.flatnonzero(lost))
+        return newly
+
+    def report(self):
+        frames = self.field.frame - self._start_frame
+        cleared = int(self.field.captured.sum()) - self._start_captured
+        days = frames * FRAME_SECONDS / 86400.0
+        replan_ms = np.array(self.replan_seconds) * 1e3
+        return {
+            "collectors": len(self.target),
+            "frames": frames,
+            "simulated_days": days,
+            "cleared": cleared,
+            "cleared_per_day": cleared / days if days else 0.0,
+            "replans": len(replan_ms),
+            "replan_ms_mean": float(replan_ms.mean()) if len(replan_ms) else 0.0,
+            "replan_ms_p95": float(np.percentile(replan_ms, 95)) if len(replan_ms) else 0.0,
+        }
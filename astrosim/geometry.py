@@ -0,0 +1,69 @@
+# Cached static geometry: orbit polylines and body meshes.
+#
+# Orbit outlines, planet spheres and band shells never change while an
+# animation runs, so they are computed once per parameter set and shared.
+# Every result is a read-only array, so that no caller can corrupt the
+# cached copy.
+
+from functools import lru_cache
+
+import numpy as np
+
+from astrosim.kepler import orientation
+
+CACHE_SIZE = 256
+
+
+def _frozen(*arrays):
+    for a in arrays:
+        a.setflags(write=False)
+    return arrays if len(arrays) > 1 else arrays[0]
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def _orbit_polyline(a, e, inclination, samples, raan, argp):
+    theta = np.linspace(0, 2 * np.pi, samples)
+    r = (a * (1 - e**2)) / (1 + e * np.cos(theta))
+    P, Q = orientation(inclination, raan, argp)
+    return _frozen(np.outer(P, r * np.cos(theta)) + np.outer(Q, r * np.sin(theta)))
+
+
+def orbit_polyline(a, e, inclination, samples, raan=0.0, argp=0.0):
+    # (3, samples) outline of an orbit with semi-major axis a and
+    # eccentricity e about a focus at the origin, sampled at evenly spaced
+    # true anomalies from perigee. Angles are in degrees; with raan = argp = 0
+    # the orbit is tilted by `inclination` about the x axis.
+    return _orbit_polyline(float(a), float(e), float(inclination), int(samples), float(raan), float(argp))
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def _sphere_mesh(radius, nu, nv):
+    u = np.linspace(0, 2 * np.pi, nu)[:, None]
+    v = np.linspace(0, np.pi, nv)[None, :]
+    return _frozen(radius * np.cos(u) * np.sin(v), radius * np.sin(u) * np.sin(v), radius * np.cos(v) + 0 * u)
+
+
+def sphere_mesh(radius, nu, nv):
+    # (x, y, z) grids of shape (nu, nv) for plot_surface
+    return _sphere_mesh(float(radius), int(nu), int(nv))
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def _torus_mesh(R, r, nu, nv):
+    u = np.linspace(0, 2 * np.pi, nu)[None, :]
+    v = np.linspace(0, 2 * np.pi, nv)[:, None]
+    ring = R + r * np.cos(v)
+    return _frozen(ring * np.cos(u), ring * np.sin(u), r * np.sin(v) + 0 * u)
+
+
+def torus_mesh(R, r, nu, nv):
+    # (x, y, z) grids of shape (nv, nu) for plot_surface
+    return _torus_mesh(float(R), float(r), int(nu), int(nv))
+
+
+def cache_info():
+    return {
+        "orbit_polyline": _orbit_polyline.cache_info(),
+        "sphere_mesh": _sphere_mesh.cache_info(),
+        "torus_mesh": _torus_mesh.cache_info(),
+    }
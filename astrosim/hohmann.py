@@ -0,0 +1,120 @@
+# Compute core for the Earth-Mars Hohmann transfer simulation.
+#
+# Earth and Mars move on circular coplanar orbits; the spacecraft follows the
+# half ellipse between them, launched when Mars leads Earth by the phase angle
+# that brings it to the arrival point together with the spacecraft.
+
+import numpy as np
+
+from astrosim.ephemeris import Ephemeris
+
+# Orbital constants
+AU = 1.496e+11  # meters, but we use AU as base unit for plotting
+EARTH_ORBIT_RADIUS = 1.0  # AU
+MARS_ORBIT_RADIUS = 1.52  # AU
+
+# Make orbits slower
+EARTH_ORBITAL_PERIOD = 365.25 * 1.2  # 20% slower
+MARS_ORBITAL_PERIOD = 687 * 1.2      # 20% slower
+
+# Time scale
+DAYS_PER_FRAME = 5
+TOTAL_DAYS = 2000  # total simulation length
+
+
+class HohmannTransfer:
+    """Earth, Mars and a spacecraft on a Hohmann transfer, frame by frame.
+
+    step() advances one frame; state() holds the positions for the frame just
+    computed, with the spacecraft as NaN outside the transfer.
+    """
+
+    def __init__(self, days_per_frame=DAYS_PER_FRAME, total_days=TOTAL_DAYS,
+                 r1=EARTH_ORBIT_RADIUS, r2=MARS_ORBIT_RADIUS,
+                 earth_period=EARTH_ORBITAL_PERIOD, mars_period=MARS_ORBITAL_PERIOD, ephemeris=None):
+        self.days_per_frame = days_per_frame
+        self.total_days = total_days
+        self.num_frames = total_days // days_per_frame
+        self.r1, self.r2 = r1, r2
+
+        # Angular speed = 2π / T
+        self.earth_omega = 2 * np.pi / earth_period
+        self.mars_omega = 2 * np.pi / mars_period
+
+        # Transfer orbit parameters
+        self.a_transfer = (r1 + r2) / 2
+        transfer_time = np.pi * np.sqrt(self.a_transfer**3)  # in "years" (1 year = 1 Earth orbital period)
+        self.transfer_days = transfer_time * earth_period  # in days, using the slower Earth period
+        self.transfer_frames = int(self.transfer_days // days_per_frame)
+
+        # Mars must be ahead by the angle it will move during the transfer
+        mars_travel_angle = self.mars_omega * self.transfer_days
+        self.phase_angle = np.pi - mars_travel_angle
+
+        # Optional astrosim.ephemeris.Ephemeris of (earth, mars) in days,
+        # used instead of evaluating planet_states() every frame
+        self.ephemeris = ephemeris
+        self.frame = 0
+        self._state = self.state_at(0)
+
+    def transfer_orbit(self, n=300):
+        # Half ellipse from Earth's orbit to Mars' orbit (z=0)
+        theta = np.linspace(0, np.pi, n)
+        x = self.a_transfer * np.cos(theta) - (self.r2 - self.r1) / 2  # center-shifted
+        y = self.a_transfer * np.sin(theta)
+        return x, y, np.zeros_like(x)
+
+    def planet_states(self, days):
+        # (..., 2, 3) positions (AU) and velocities (AU/day) of Earth and
+        # Mars for an array of days. Earth starts at 0, Mars starts ahead
+        # by phase_angle.
+        days = np.asarray(days, dtype=np.float64)[..., None]
+        radius = np.array([self.r1, self.r2])
+        omega = np.array([self.earth_omega, self.mars_omega])
+        angle = np.array([0.0, self.phase_angle]) + omega * days
+        c, s = np.cos(angle), np.sin(angle)
+        zero = np.zeros_like(c)
+        positions = np.stack([radius * c, radius * s, zero], axis=-1)
+        velocities = np.stack([-radius * omega * s, radius * omega * c, zero], axis=-1)
+        return positions, velocities
+
+    def tabulate(self, step=1.0):
+        # Ephemeris table of Earth and Mars over the whole run
+        return Ephemeris.tabulate(self.planet_states, 0.0, self.total_days, step, names=("earth", "mars"))
+
+    def state_at(self, frame):
+        day = frame * self.days_per_frame
+        if self.ephemeris is not None:
+            earth, mars = self.ephemeris.states(day, velocities=False)
+        else:
+            earth, mars = self.planet_states(day)[0]
+
+        if frame <= self.transfer_frames:
+            theta = np.pi * frame / self.transfer_frames
+            spacecraft = np.array([
+                self.a_transfer * np.cos(theta) - (self.r2 - self.r1) / 2,
+                self.a_transfer * np.sin(theta),
+                0.0,
+            ])
+        else:
+            spacecraft = np.full(3, np.nan)
+        return {"day": np.float64(day), "earth": earth, "mars": mars, "spacecraft": spacecraft}
+
+    def step(self):
+        self._state = self.state_at(self.frame)
+        self.frame += 1
+
+    def state(self):
+        return self._state
+
+    def snapshot(self):
+        # Positions follow from the frame alone (see astrosim.checkpoint)
+        return {"frame": self.frame}
+
+    def restore(self, snap):
+        self.frame = int(snap["frame"])
+        self._state = self.state_at(max(self.frame - 1, 0))
+
+
+def create(**params):
+    return HohmannTransfer(**params)
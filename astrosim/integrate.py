@@ -0,0 +1,194 @@
+# Adaptive Dormand-Prince 5(4) integrator with event location.
+#
+# Steps are sized by the embedded 4th-order error estimate. After every
+# accepted step the event functions are checked for a sign change, and roots
+# are found on the 4th-order dense output, so event times do not depend on
+# where the steps happened to land.
+
+import numpy as np
+
+# Butcher tableau
+C = np.array([0, 1 / 5, 3 / 10, 4 / 5, 8 / 9, 1])
+A = [
+    np.array([]),
+    np.array([1 / 5]),
+    np.array([3 / 40, 9 / 40]),
+    np.array([44 / 45, -56 / 15, 32 / 9]),
+    np.array([19372 / 6561, -25360 / 2187, 64448 / 6561, -212 / 729]),
+    np.array([9017 / 3168, -355 / 33, 46732 / 5247, 49 / 176, -5103 / 18656]),
+]
+B = np.array([35 / 384, 0, 500 / 1113, 125 / 192, -2187 / 6784, 11 / 84])
+# 5th minus embedded 4th order weights (the 7th stage is the FSAL derivative)
+E = np.array([71 / 57600, 0, -71 / 16695, 71 / 1920, -17253 / 339200, 22 / 525, -1 / 40])
+# Dense output: y(t + x h) = y + h K^T P [x, x^2, x^3, x^4]
+P = np.array([
+    [1, -8048581381 / 2820520608, 8663915743 / 2820520608, -12715105075 / 11282082432],
+    [0, 0, 0, 0],
+    [0, 131558114200 / 32700410799, -68118460800 / 10900136933, 87487479700 / 32700410799],
+    [0, -1754552775 / 470086768, 14199869525 / 1410260304, -10690763975 / 1880347072],
+    [0, 127303824393 / 49829197408, -318862633887 / 49829197408, 701980252875 / 199316789632],
+    [0, -282668133 / 205662961, 2019193451 / 616988883, -1453857185 / 822651844],
+    [0, 40617522 / 29380423, -110615467 / 29380423, 69997945 / 29380423],
+])
+
+SAFETY = 0.9
+MIN_FACTOR = 0.2
+MAX_FACTOR = 10.0
+
+
+def event(terminal=False, direction=0):
+    # Mark g(t, y) as an event function. direction > 0 only fires on rising
+    # crossings, < 0 only on falling ones; terminal events stop integration.
+    def mark(fn):
+        fn.terminal = terminal
+        fn.direction = direction
+        return fn
+    return mark
+
+
+def _rms(x):
+    return np.sqrt(np.mean(x * x))
+
+
+def _initial_step(fun, t0, y0, f0, rtol, atol):
+    # Hairer, Norsett & Wanner, Solving ODEs I, II.4
+    scale = atol + rtol * np.abs(y0)
+    d0, d1 = _rms(y0 / scale), _rms(f0 / scale)
+    h0 = 1e-6 if d0 < 1e-5 or d1 < 1e-5 else 0.01 * d0 / d1
+    f1 = fun(t0 + h0, y0 + h0 * f0)
+    d2 = _rms((f1 - f0) / scale) / h0
+    if max(d1, d2) <= 1e-15:
+        h1 = max(1e-6, h0 * 1e-3)
+    else:
+        h1 = (0.01 / max(d1, d2)) ** (1 / 5)
+    return min(100 * h0, h1)
+
+
+def _dense(t, y, h, K):
+    Q = K.T @ P
+
+    def at(t_eval):
+        x = (t_eval - t) / h
+        return y + h * (Q @ np.array([x, x * x, x ** 3, x ** 4]))
+    return at
+
+
+def _find_root(g, interp, t_lo, t_hi, g_lo, g_hi, xtol):
+    # Illinois regula falsi on the dense output
+    side = 0
+    while t_hi - t_lo > xtol:
+        t_mid = (t_lo * g_hi - t_hi * g_lo) / (g_hi - g_lo)
+        if not t_lo < t_mid < t_hi:
+            t_mid = 0.5 * (t_lo + t_hi)
+        g_mid = g(t_mid, interp(t_mid))
+        if g_mid == 0:
+            return t_mid
+        if np.sign(g_mid) == np.sign(g_lo):
+            t_lo, g_lo = t_mid, g_mid
+            if side == -1:
+                g_hi *= 0.5
+            side = -1
+        else:
+            t_hi, g_hi = t_mid, g_mid
+            if side == 1:
+                g_lo *= 0.5
+            side = 1
+    return t_hi
+
+
+def dopri5(fun, t0, y0, t_end, rtol=1e-6, atol=1e-9, events=(), max_step=np.inf, first_step=None):
+    """Integrate y' = fun(t, y) from t0 to t_end.
+
+    events are functions g(t, y) (see event()); each crossing is located to
+    near machine precision on the dense output. A terminal event ends the
+    integration at its root.
+
+    Returns a dict with the accepted step times "t" and states "y" (one row
+    per time), per-event "t_events"/"y_events" lists, "nfev", "steps",
+    "rejected" and "terminated" (index of the terminal event that fired, or
+    None).
+    """
+    y = np.array(y0, dtype=np.float64)
+    t = float(t0)
+    f = np.asarray(fun(t, y), dtype=np.float64)
+    nfev = 1
+    h = first_step or _initial_step(fun, t, y, f, rtol, atol)
+    nfev += 0 if first_step else 1
+
+    ts, ys = [t], [y.copy()]
+    t_events = [[] for _ in events]
+    y_events = [[] for _ in events]
+    g_old = [g(t, y) for g in events]
+    steps = rejected = 0
+    terminated = None
+    K = np.empty((7, len(y)))
+
+    while t < t_end:
+        h = min(h, max_step, t_end - t)
+        # Stages 2-6, then the FSAL stage at the new point
+        K[0] = f
+        for s in range(1, 6):
+            K[s] = fun(t + C[s] * h, y + h * (A[s] @ K[:s]))
+        y_new = y + h * (B @ K[:6])
+        f_new = np.asarray(fun(t + h, y_new), dtype=np.float64)
+        K[6] = f_new
+        nfev += 6
+
+        scale = atol + rtol * np.maximum(np.abs(y), np.abs(y_new))
+        err = _rms(h * (E @ K) / scale)
+        if err > 1:
+            h *= max(MIN_FACTOR, SAFETY * err ** -0.2)
+            rejected += 1
+            continue
+
+        t_new = t + h
+        steps += 1
+
+        # Event detection over [t, t_new]
+        g_new = [g(t_new, y_new) for g in events]
+        hits = []
+        for i, g in enumerate(events):
+            lo, hi = g_old[i], g_new[i]
+            rising = lo < 0 <= hi or lo <= 0 < hi
+            falling = lo > 0 >= hi or lo >= 0 > hi
+            d = getattr(g, "direction", 0)
+            if (rising and d >= 0) or (falling and d <= 0):
+                interp = _dense(t, y, h, K.copy())
+                if lo == 0 and t == t0:
+                    # Leaving the surface at the start only counts when it
+                    # goes the way the event asks, and then it is at t0
+                    if d == 0:
+                        continue
+                    root = t0
+                else:
+                    root = _find_root(g, interp, t, t_new, lo, hi,
+                                      xtol=4 * np.finfo(float).eps * max(1.0, abs(t_new)))
+                hits.append((root, i, interp))
+        hits.sort(key=lambda hit: hit[0])
+        for root, i, interp in hits:
+            t_events[i].append(root)
+            y_events[i].append(interp(root))
+            if getattr(events[i], "terminal", False):
+                terminated = i
+                t_new, y_new = root, interp(root)
+                break
+
+        t, y, f = t_new, y_new, f_new
+        ts.append(t)
+        ys.append(y.copy())
+        g_old = g_new
+        if terminated is not None:
+            break
+        factor = MAX_FACTOR if err == 0 else min(MAX_FACTOR, SAFETY * err ** -0.2)
+        h *= factor
+
+    return {
+        "t": np.array(ts),
+        "y": np.array(ys),
+        "t_events": [np.array(te) for te in t_events],
+        "y_events": [np.array(ye).reshape(-1, len(y)) for ye in y_events],
+        "nfev": nfev,
+        "steps": steps,
+        "rejected": rejected,
+        "terminated": terminated,
+    }
@@ -0,0 +1,121 @@
+# Two-body Kepler propagation for many satellites at once.
+#
+# Orbits are given by classical elements (a, e, i, RAAN, argument of
+# perigee, mean anomaly at epoch). Propagating is then just advancing the
+# mean anomaly and solving Kepler's equation M = E - e sin E. The solver
+# runs Halley (or Newton) iterations over whole arrays of anomalies. Angles
+# are in degrees, like the orbit tables elsewhere in astrosim; a is in km and
+# time in seconds.
+
+import numpy as np
+
+MU_EARTH = 398600.4418  # km^3 / s^2
+
+TOL = 1e-12  # radians
+MAX_ITER = 50
+
+
+def solve_kepler(M, e, tol=TOL, max_iter=MAX_ITER, method="halley", full_output=False):
+    """Eccentric anomaly E with E - e sin E = M, elementwise (elliptic e < 1).
+
+    M (radians) and e broadcast. Halley converges cubically, Newton
+    quadratically. Iteration stops once every correction is below tol. With
+    full_output, also returns the iteration count.
+    """
+    if method not in ("halley", "newton"):
+        raise ValueError(f"unknown method {method!r}; use 'halley' or 'newton'")
+    M, e = np.broadcast_arrays(np.asarray(M, dtype=np.float64), np.asarray(e, dtype=np.float64))
+    M = np.mod(M + np.pi, 2 * np.pi) - np.pi
+    # Starting guess; for high eccentricity, E = M + 0.85 e sign(M) avoids
+    # the overshoot near perigee (Danby 1987)
+    E = np.where(e < 0.8, M + e * np.sin(M), M + 0.85 * e * np.sign(M))
+    for iterations in range(1, max_iter + 1):
+        s, c = np.sin(E), np.cos(E)
+        f = E - e * s - M
+        f1 = 1 - e * c
+        if method == "halley":
+            dE = 2 * f * f1 / (2 * f1 * f1 - f * e * s)
+        else:
+            dE = f / f1
+        E = E - dE
+        if np.all(np.abs(dE) < tol):
+            break
+    return (E, iterations) if full_output else E
+
+
+def orientation(inclination, raan=0.0, argp=0.0):
+    # Unit vectors P (towards perigee) and Q (90 degrees ahead in the orbit
+    # plane), each (..., 3), for angles in degrees
+    i, O, w = (np.radians(np.asarray(x, dtype=np.float64)) for x in (inclination, raan, argp))
+    ci, si, cO, sO, cw, sw = np.cos(i), np.sin(i), np.cos(O), np.sin(O), np.cos(w), np.sin(w)
+    P = np.stack([cO * cw - sO * sw * ci, sO * cw + cO * sw * ci, sw * si], axis=-1)
+    Q = np.stack([-cO * sw - sO * cw * ci, -sO * sw + cO * cw * ci, cw * si], axis=-1)
+    return P, Q
+
+
+class KeplerOrbits:
+    """A set of satellites on unperturbed Keplerian orbits.
+
+    Elements broadcast to one value per satellite; epoch, the time the mean
+    anomaly refers to, may also differ per satellite. positions(t) takes a
+    scalar epoch or an array of epochs and returns (..., n_satellites, 3)
+    positions in km; velocities=True also returns km/s velocities.
+    """
+
+    def __init__(self, a, e, inclination=0.0, raan=0.0, argp=0.0, mean_anomaly=0.0, epoch=0.0, mu=MU_EARTH):
+        a, e, inclination, raan, argp, mean_anomaly = (
+            np.atleast_1d(np.asarray(x, dtype=np.float64))
+            for x in np.broadcast_arrays(a, e, inclination, raan, argp, mean_anomaly))
+        if np.any(e < 0) or np.any(e >= 1):
+            raise ValueError("eccentricities must be in [0, 1)")
+        self.a, self.e = a, e
+        self.inclination, self.raan, self.argp = inclination, raan, argp
+        self.mean_anomaly = np.radians(mean_anomaly)  # at epoch
+        self.epoch = epoch if np.ndim(epoch) == 0 else np.broadcast_to(np.asarray(epoch, dtype=np.float64), a.shape)
+        self.mu = mu
+        self.mean_motion = np.sqrt(mu / a**3)  # rad / s
+        self.period = 2 * np.pi / self.mean_motion
+        self._P, self._Q = orientation(inclination, raan, argp)
+        self._b = a * np.sqrt(1 - e**2)
+
+    def __len__(self):
+        return len(self.a)
+
+    def radius_range(self):
+        # Perigee and apogee radius of every orbit (km)
+        return self.a * (1 - self.e), self.a * (1 + self.e)
+
+    def max_speed(self):
+        # Fastest speed of any satellite, reached at perigee (km/s)
+        return float(np.max(np.sqrt(self.mu * (1 + self.e) / (self.a * (1 - self.e))), initial=0.0))
+
+    def positions(self, t, velocities=False, **solver):
+        t = np.asarray(t, dtype=np.float64)[..., None]
+        M = self.mean_anomaly + self.mean_motion * (t - self.epoch)
+        E = solve_kepler(M, self.e, **solver)
+        c, s = np.cos(E), np.sin(E)
+        x = self.a * (c - self.e)
+        y = self._b * s
+        pos = x[..., None] * self._P + y[..., None] * self._Q
+        if not velocities:
+            return pos
+        rate = self.mean_motion / (1 - self.e * c)  # dE/dt
+        vel = (-self.a * s * rate)[..., None] * self._P + (self._b * c * rate)[..., None] * self._Q
+        return pos, vel
+
+    def states_at(self, index, t, **solver):
+        # Position, velocity and gravitational acceleration of satellite
+        # index[k] at epoch t[k], each (k, 3); a satellite may repeat
+        index = np.asarray(index)
+        a, e, b = self.a[index], self.e[index], self._b[index]
+        n = self.mean_motion[index]
+        epoch = self.epoch if np.ndim(self.epoch) == 0 else self.epoch[index]
+        E = solve_kepler(self.mean_anomaly[index] + n * (np.asarray(t, dtype=np.float64) - epoch), e, **solver)
+        c, s = np.cos(E), np.sin(E)
+        P, Q = self._P[index], self._Q[index]
+        pos = (a * (c - e))[:, None] * P + (b * s)[:, None] * Q
+        rate = n / (1 - e * c)
+        vel = (-a * s * rate)[:, None] * P + (b * c * rate)[:, None] * Q
+        r = np.sqrt(np.einsum("ij,ij->i", pos, pos))
+        acc = pos * (-self.mu / r**3)[:, None]
+        return pos, vel, acc
@@ -0,0 +1,156 @@
+# Gravitational N-body engine.
+#
+# Units are AU, years and solar masses, so G = 4 pi^2. Bodies are stored as
+# (N, 3) position and velocity arrays plus an (N,) mass array, with the
+# massive bodies first. Zero-mass test particles (asteroids, Kuiper belt
+# objects) feel the massive bodies but exert no force, so a step costs
+# O(N * n_massive) rather than O(N^2). With many massive bodies,
+# solver="tree" switches the force sum to Barnes-Hut (astrosim.barnes_hut).
+# Integration is kick-drift-kick leapfrog, which is symplectic: energy errors
+# oscillate instead of growing.
+
+import numpy as np
+
+from astrosim.barnes_hut import THETA, Octree
+
+G = 4 * np.pi**2  # AU^3 / (Msun yr^2)
+
+DT = 0.002  # years (about 0.7 days; ~120 steps per Mercury orbit)
+
+# Main-belt and Kuiper-belt radii (AU) for test particles
+ASTEROID_BELT = (2.1, 3.3)
+KUIPER_BELT = (30.0, 50.0)
+
+CHUNK = 1 << 20  # (target, source) pairs per block of the direct sum
+
+
+def circular_orbit(radius, inclination, phase, mu):
+    # Position and velocity on a circular orbit tilted about the x axis,
+    # starting at `phase` from the x axis. Arguments broadcast.
+    radius, inclination, phase = np.broadcast_arrays(radius, inclination, phase)
+    speed = np.sqrt(mu / np.where(radius > 0, radius, 1.0)) * (radius > 0)
+    c, s = np.cos(phase), np.sin(phase)
+    ci, si = np.cos(inclination), np.sin(inclination)
+    pos = np.stack([radius * c, radius * s * ci, radius * s * si], axis=-1)
+    vel = np.stack([-speed * s, speed * c * ci, speed * c * si], axis=-1)
+    return pos, vel
+
+
+def direct_field(targets, sources, masses, softening=0.0, sources_first=False, chunk=CHUNK):
+    # sum(m * d / |d|^3) over all sources at each target, in blocks of
+    # targets so the pair arrays stay bounded. sources_first says the leading
+    # targets are the sources themselves (target i is source i), which then
+    # get no self-force.
+    out = np.empty_like(targets)
+    k = len(sources) if sources_first else 0
+    step = max(1, chunk // max(len(sources), 1))
+    for lo in range(0, len(targets), step):
+        d = sources[None] - targets[lo:lo + step, None]  # (block, sources, 3)
+        r2 = np.einsum("ijk,ijk->ij", d, d) + softening**2
+        own = np.arange(lo, min(lo + step, k))
+        r2[own - lo, own] = np.inf
+        w = masses / (r2 * np.sqrt(r2))
+        out[lo:lo + step] = np.einsum("ij,ijk->ik", w, d)
+    return out
+
+
+class NBody:
+    """Massive bodies plus test particles under mutual gravity.
+
+    positions and velocities are (N, 3), masses (N,) with every massive body
+    ahead of the zero-mass test particles. step() advances one leapfrog step
+    of dt; advance(t) covers an arbitrary span in equal steps no longer than
+    dt. solver is "direct" or "tree" (Barnes-Hut with opening angle theta).
+    """
+
+    def __init__(self, positions, velocities, masses, dt=DT, softening=0.0, solver="direct", theta=THETA):
+        self.positions = np.array(positions, dtype=np.float64)
+        self.velocities = np.array(velocities, dtype=np.float64)
+        self.masses = np.array(masses, dtype=np.float64)
+        self.n_massive = int(np.count_nonzero(self.masses))
+        if np.any(self.masses[self.n_massive:]):
+            raise ValueError("massive bodies must come before the test particles")
+        self.dt = dt
+        self.softening = softening
+        if solver not in ("direct", "tree"):
+            raise ValueError(f"unknown solver {solver!r}; use 'direct' or 'tree'")
+        self.solver = solver
+        self.theta = theta
+        self.time = 0.0
+        self.frame = 0
+        self._acc = self.accelerations(self.positions)
+
+    @classmethod
+    def from_planets(cls, planets, masses, test_particles=0, belt=ASTEROID_BELT, rng=None, **kw):
+        # Planets (rows of astrosim.solar.PLANETS, the central body first) on
+        # circular orbits at their real radii and inclinations, moved to the
+        # barycentre frame, plus `test_particles` on circular orbits spread
+        # through `belt`. masses maps planet name to solar masses.
+        rng = np.random.default_rng(rng)
+        m = np.array([masses[p[0]] for p in planets])
+        radius = np.array([p[2] for p in planets], dtype=np.float64)
+        incl = np.radians([p[4] for p in planets])
+        pos, vel = circular_orbit(radius, incl, 0.0, G * (m[0] + m))
+        pos -= m @ pos / m.sum()
+        vel -= m @ vel / m.sum()
+
+        if test_particles:
+            r = rng.uniform(*belt, test_particles)
+            i = np.radians(rng.uniform(0, 10, test_particles))
+            tp_pos, tp_vel = circular_orbit(r, i, rng.uniform(0, 2 * np.pi, test_particles), G * m[0])
+            pos = np.concatenate([pos, tp_pos + pos[0]])
+            vel = np.concatenate([vel, tp_vel + vel[0]])
+            m = np.concatenate([m, np.zeros(test_particles)])
+        return cls(pos, vel, m, **kw)
+
+    def __len__(self):
+        return len(self.masses)
+
+    def accelerations(self, positions):
+        # Acceleration of every body due to the massive bodies only
+        k = self.n_massive
+        if self.solver == "tree":
+            tree = Octree(positions[:k], self.masses[:k])
+            return G * tree.field(positions, self.theta, self.softening)
+        return G * direct_field(positions, positions[:k], self.masses[:k], self.softening, sources_first=True)
+
+    def step(self, dt=None):
+        dt = self.dt if dt is None else dt
+        self.velocities += 0.5 * dt * self._acc
+        self.positions += dt * self.velocities
+        self._acc = self.accelerations(self.positions)
+        self.velocities += 0.5 * dt * self._acc
+        self.time += dt
+        self.frame += 1
+
+    def advance(self, span):
+        # Integrate over `span` years in equal steps of at most dt
+        n = max(1, int(np.ceil(abs(span) / self.dt - 1e-9)))
+        for _ in range(n):
+            self.step(span / n)
+
+    def energy(self):
+        # Total energy of the massive bodies (test particles carry none)
+        k = self.n_massive
+        m, x = self.masses[:k], self.positions[:k]
+        kinetic = 0.5 * m @ np.einsum("ij,ij->i", self.velocities[:k], self.velocities[:k])
+        i, j = np.triu_indices(k, 1)
+        r = np.sqrt(np.sum((x[i] - x[j]) ** 2, axis=1) + self.softening**2)
+        return kinetic - G * np.sum(m[i] * m[j] / r)
+
+    def state(self):
+        return {"time": np.float64(self.time), "positions": self.positions, "velocities": self.velocities}
+
+    def snapshot(self):
+        # Mutable state for astrosim.checkpoint; the accelerations are kept
+        # so a restored run continues bit for bit
+        return {"positions": self.positions, "velocities": self.velocities, "acc": self._acc,
+                "time": self.time, "frame": self.frame}
+
+    def restore(self, snap):
+        self.positions = np.array(snap["positions"], dtype=np.float64)
+        self.velocities = np.array(snap["velocities"], dtype=np.float64)
+        self._acc = np.array(snap["acc"], dtype=np.float64)
+        self.time = float(snap["time"])
+        self.frame = int(snap["frame"])
+
@@ -0,0 +1,85 @@
+# Compute core for the Orbit Visualizer.
+#
+# Each orbit is drawn from its classical elements, and the satellites are
+# propagated along them with Kepler's equation, so they speed up near perigee
+# and each orbit takes its real period.
+
+import os
+
+import numpy as np
+
+from astrosim.catalog import Catalog, load_catalog
+from astrosim.geometry import orbit_polyline
+from astrosim.kepler import KeplerOrbits
+
+# Orbit definitions: semi-major axis (km), eccentricity and angles (deg)
+ORBITS = [
+    {"name": "LEO", "a": 6771, "e": 0.01, "inclination": 51.6, "raan": 0.0, "argp": 0.0, "color": "red"},
+    {"name": "MEO", "a": 20200, "e": 0.02, "inclination": 55.0, "raan": 0.0, "argp": 0.0, "color": "orange"},
+    {"name": "GEO", "a": 42164, "e": 0.0, "inclination": 0.0, "raan": 0.0, "argp": 0.0, "color": "green"},
+]
+
+EARTH_RADIUS = 6371  # km
+SAMPLES = 1000  # points per drawn orbit
+SECONDS_PER_FRAME = 30.0
+
+
+def orbit_path(a, e, inclination, samples=SAMPLES, raan=0.0, argp=0.0):
+    # Shared, read-only samples from the geometry cache
+    return orbit_polyline(a, e, inclination, samples, raan, argp)
+
+
+class OrbitSet:
+    """Satellites propagated along their orbits by Kepler's equation.
+
+    paths has shape (n_orbits, 3, samples) for drawing; state() gives the
+    (n_orbits, 3) satellite positions for the frame just computed.
+    num_frames covers one period of the slowest orbit.
+
+    orbits may also be a Catalog or a catalog file (see astrosim.catalog);
+    each of its objects becomes one drawn orbit, so keep it small. Frames
+    then start at the newest epoch in the catalog, unless start (seconds
+    since J2000) is given.
+    """
+
+    def __init__(self, orbits=ORBITS, samples=SAMPLES, seconds_per_frame=SECONDS_PER_FRAME, start=None):
+        if isinstance(orbits, (str, os.PathLike, Catalog)):
+            catalog = load_catalog(orbits)
+            orbits = catalog.orbit_dicts()
+            start = float(catalog["epoch"].max(initial=0.0)) if start is None else start
+            for o, epoch in zip(orbits, catalog["epoch"]):
+                o["epoch"] = float(epoch)
+        self.orbits = orbits
+        self.samples = samples
+        self.seconds_per_frame = seconds_per_frame
+        self.start = 0.0 if start is None else start
+        elements = {key: [o.get(key, 0.0) for o in orbits]
+                    for key in ("a", "e", "inclination", "raan", "argp", "mean_anomaly", "epoch")}
+        self.propagator = KeplerOrbits(**elements)
+        self.paths = np.array([orbit_path(o["a"], o["e"], o["inclination"], samples, o.get("raan", 0.0), o.get("argp", 0.0))
+                               for o in orbits])
+        self.num_frames = int(np.ceil(self.propagator.period.max() / seconds_per_frame))
+        self.frame = 0
+        self._state = self.state_at(0)
+
+    def state_at(self, frame):
+        return {"positions": self.propagator.positions(self.start + frame * self.seconds_per_frame)}
+
+    def step(self):
+        self._state = self.state_at(self.frame)
+        self.frame += 1
+
+    def state(self):
+        return self._state
+
+    def snapshot(self):
+        # Positions follow from the frame alone (see astrosim.checkpoint)
+        return {"frame": self.frame}
+
+    def restore(self, snap):
+        self.frame = int(snap["frame"])
+        self._state = self.state_at(max(self.frame - 1, 0))
+
+
+def create(**params):
+    return OrbitSet(**params)
@@ -0,0 +1,176 @@
+# Launch-window (porkchop) sweeps between two planets.
+#
+# The Hohmann simulation flies one idealised transfer between circular
+# coplanar orbits. Here the planets follow their real J2000 Keplerian
+# orbits, and Lambert's problem is solved for every (departure, arrival)
+# pair of a date grid at once. The solver uses universal variables: for
+# each pair, z is found with Newton steps inside a bisection bracket, as
+# whole arrays. Planet states are only looked up along the two date axes,
+# and those lookups are cached. The grid is split into departure-date
+# chunks over a process pool.
+#
+# Dates are days since J2000 (2000-01-01 12:00); distances are km, speeds
+# km/s. Planet elements and constants come from astrosim.ephemeris.
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+
+import numpy as np
+
+from astrosim.ephemeris import DAY, MU_SUN, PLANET_ELEMENTS
+from astrosim.kepler import KeplerOrbits
+
+Z_MIN = -1e4  # most hyperbolic universal variable tried
+Z_MAX = 4 * np.pi**2  # single-revolution limit
+TOL = 1e-10  # relative time-of-flight tolerance
+MAX_ITER = 60
+CHUNK_ROWS = 64  # departure dates per pool task
+EPHEMERIS_CACHE = 64
+
+
+@lru_cache(maxsize=EPHEMERIS_CACHE)
+def _ephemeris(elements, days_key):
+    days = np.frombuffer(days_key)
+    pos, vel = KeplerOrbits(*elements, mu=MU_SUN).positions(days * DAY, velocities=True)
+    pos, vel = pos[:, 0], vel[:, 0]
+    pos.setflags(write=False)
+    vel.setflags(write=False)
+    return pos, vel
+
+
+def ephemeris(body, days, table=None):
+    # Heliocentric (len(days), 3) positions and velocities of a planet name
+    # or element tuple, cached by body and date array. With an
+    # astrosim.ephemeris.Ephemeris table of planets (queried in seconds),
+    # states are interpolated from the table instead.
+    if table is not None:
+        return table.states(np.asarray(days) * DAY, body)
+    elements = PLANET_ELEMENTS[body] if isinstance(body, str) else tuple(body)
+    return _ephemeris(elements, np.ascontiguousarray(days, dtype=np.float64).tobytes())
+
+
+def _stumpff(z):
+    # Stumpff functions C(z) and S(z), with series near z = 0
+    small = np.abs(z) < 1e-6
+    az = np.where(small, 1.0, np.abs(z))
+    s = np.sqrt(az)
+    with np.errstate(over="ignore"):
+        C = np.where(z > 0, (1 - np.cos(s)) / az, (np.cosh(s) - 1) / az)
+        S = np.where(z > 0, (s - np.sin(s)) / az**1.5, (np.sinh(s) - s) / az**1.5)
+    C = np.where(small, 0.5 - z / 24, C)
+    S = np.where(small, 1 / 6 - z / 120, S)
+    return C, S
+
+
+def lambert(r1, r2, tof, mu=MU_SUN, prograde=True, tol=TOL, max_iter=MAX_ITER):
+    """Single-revolution Lambert solutions, elementwise.
+
+    r1 and r2 are (..., 3) positions and tof the times of flight (s); all
+    broadcast. Returns the (..., 3) velocities at both ends. Pairs with no
+    solution (non-positive tof, collinear ends, no convergence) are NaN.
+    """
+    r1, r2 = np.asarray(r1, dtype=np.float64), np.asarray(r2, dtype=np.float64)
+    tof = np.asarray(tof, dtype=np.float64)
+    n1, n2 = np.linalg.norm(r1, axis=-1), np.linalg.norm(r2, axis=-1)
+    cos_dnu = np.clip(np.sum(r1 * r2, axis=-1) / (n1 * n2), -1.0, 1.0)
+    dnu = np.arccos(cos_dnu)
+    cross_z = r1[..., 0] * r2[..., 1] - r1[..., 1] * r2[..., 0]
+    dnu = np.where((cross_z < 0) == prograde, 2 * np.pi - dnu, dnu)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        A = np.sin(dnu) * np.sqrt(n1 * n2 / (1 - cos_dnu))
+    n1, n2, A, tof = np.broadcast_arrays(n1, n2, A, tof)
+    target = np.sqrt(mu) * tof
+
+    def y_of(z):
+        C, S = _stumpff(z)
+        return n1 + n2 + A * (z * S - 1) / np.sqrt(C), C, S
+
+    # Time of flight grows monotonically with z. Newton steps are kept
+    # inside a bracket that shrinks every iteration; where y < 0 (too
+    # hyperbolic for this geometry) the time counts as too short.
+    lo, hi = np.full(A.shape, Z_MIN), np.full(A.shape, Z_MAX)
+    z = np.zeros(A.shape)
+    with np.errstate(invalid="ignore", divide="ignore", over="ignore"):
+        for _ in range(max_iter):
+            y, C, S = y_of(z)
+            valid = y > 0
+            F = np.where(valid, (y / C)**1.5 * S + A * np.sqrt(y) - target, -np.inf)
+            lo = np.where(F < 0, z, lo)
+            hi = np.where(F >= 0, z, hi)
+            near0 = np.abs(z) < 1e-6
+            zs = np.where(near0, 1.0, z)
+            dF = np.where(
+                near0,
+                np.sqrt(2) / 40 * y**1.5 + A / 8 * (np.sqrt(y) + A * np.sqrt(1 / (2 * y))),
+                (y / C)**1.5 * (1 / (2 * zs) * (C - 1.5 * S / C) + 0.75 * S**2 / C)
+                + A / 8 * (3 * S / C * np.sqrt(y) + A * np.sqrt(C / y)),
+            )
+            z_new = z - F / dF
+            bad = ~np.isfinite(z_new) | (z_new <= lo) | (z_new >= hi)
+            z_new = np.where(bad, 0.5 * (lo + hi), z_new)
+            done = np.abs(F) <= tol * target
+            z = np.where(done, z, z_new)
+            if np.all(done | ~np.isfinite(A) | (tof <= 0)):
+                break
+        y, C, S = y_of(z)
+        ok = done & (y > 0) & (A != 0) & (tof > 0)
+        f = 1 - y / n1
+        g = A * np.sqrt(y / mu)
+        gdot = 1 - y / n2
+        v1 = (r2 - f[..., None] * r1) / g[..., None]
+        v2 = (gdot[..., None] * r2 - r1) / g[..., None]
+    v1[~ok] = np.nan
+    v2[~ok] = np.nan
+    return v1, v2
+
+
+def _sweep(args):
+    # One block of departure dates against all arrival dates
+    dep_days, arr_days, r1, v_dep, r2, v_arr, mu = args
+    tof = (arr_days[None, :] - dep_days[:, None]) * DAY
+    v1, v2 = lambert(r1[:, None], r2[None, :], tof, mu=mu)
+    vinf_dep = np.linalg.norm(v1 - v_dep[:, None], axis=-1)
+    vinf_arr = np.linalg.norm(v2 - v_arr[None, :], axis=-1)
+    return vinf_dep, vinf_arr
+
+
+def porkchop(departure_days, arrival_days, origin="earth", target="mars", mu=MU_SUN,
+             workers=None, chunk_rows=CHUNK_ROWS, table=None):
+    """Transfer costs over every (departure, arrival) date pair.
+
+    origin and target are planet names from PLANET_ELEMENTS or element
+    tuples in the same layout. Returns a dict of (n_departure, n_arrival)
+    arrays: "tof" (days), "c3" (km^2/s^2, departure), "vinf_arrival" (km/s)
+    and "dv" (km/s, departure plus arrival hyperbolic excess speed), plus
+    the two date axes. Pairs without a transfer are NaN. table is an
+    optional planet Ephemeris to look the states up in.
+    """
+    dep = np.asarray(departure_days, dtype=np.float64)
+    arr = np.asarray(arrival_days, dtype=np.float64)
+    r1, v_dep = ephemeris(origin, dep, table)
+    r2, v_arr = ephemeris(target, arr, table)
+    workers = workers or os.cpu_count() or 1
+    chunks = [(dep[lo:lo + chunk_rows], arr, r1[lo:lo + chunk_rows], v_dep[lo:lo + chunk_rows], r2, v_arr, mu)
+              for lo in range(0, len(dep), chunk_rows)]
+    if workers == 1 or len(chunks) == 1:
+        parts = [_sweep(c) for c in chunks]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            parts = list(pool.map(_sweep, chunks))
+    vinf_dep = np.concatenate([p[0] for p in parts])
+    vinf_arr = np.concatenate([p[1] for p in parts])
+    return {
+        "departure": dep,
+        "arrival": arr,
+        "tof": arr[None, :] - dep[:, None],
+        "c3": vinf_dep**2,
+        "vinf_arrival": vinf_arr,
+        "dv": vinf_dep + vinf_arr,
+    }
+
+
+def best(grid, key="dv"):
+    # (departure, arrival, value) of the cheapest pair in a porkchop grid
+    i, j = np.unravel_index(np.nanargmin(grid[key]), grid[key].shape)
+    return grid["departure"][i], grid["arrival"][j], grid[key][i, j]
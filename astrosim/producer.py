@@ -0,0 +1,212 @@
+# Background frame production for interactive views.
+#
+# Normally a view steps its simulation inside the animation callback, so a
+# slow step stalls the GUI. A FrameProducer steps the simulation on a
+# worker thread instead. It copies each state into one of a fixed pool of
+# NumPy buffers and queues it, at most `depth` frames ahead of the view.
+# The callback only takes finished frames off the queue. NumPy releases the
+# GIL in its array loops, so physics and drawing overlap.
+#
+# Frames are paced by a clock that runs at the view's average frame rate,
+# or at a fixed `rate`. A late callback finds the clock past the next frame,
+# and the frames it skipped are dropped. An early one falls between two
+# queued frames and gets a linear interpolation of the float fields (other
+# fields come from the earlier frame). Motion therefore stays even however
+# much the callback intervals vary. When the physics falls behind, the
+# newest frame is held and the clock waits for it, so the animation slows
+# down instead of stuttering.
+#
+# On a single core the worker and the GUI take turns anyway, and physics
+# that runs while a frame is drawn only makes the draw slower. With
+# between_frames=True the worker waits from each get() until drawn()
+# reports the frame on screen. Physics then fills the idle time between
+# animation callbacks. Controls that change the simulation (e.g. the solar
+# system's sim_speed) take effect after the frames already queued.
+
+import queue
+import threading
+import time
+
+import numpy as np
+
+DEPTH = 4  # frames computed ahead of the view
+SMOOTHING = 0.1  # weight of the newest interval in the frame-rate average
+
+
+def _copy_into(buffer, state):
+    # Copy a state dict into buffer's arrays, reallocating any whose shape
+    # or dtype changed; returns the buffer
+    buffer = {} if buffer is None else buffer
+    for key, value in state.items():
+        value = np.asarray(value)
+        out = buffer.get(key)
+        if out is None or out.shape != value.shape or out.dtype != value.dtype:
+            buffer[key] = value.copy()
+        else:
+            np.copyto(out, value)
+    return buffer
+
+
+def _blend_into(out, a, b, fraction):
+    # out = a + (b - a) * fraction for float fields of matching shape,
+    # otherwise a copy of a
+    for key, value in a.items():
+        other = b.get(key)
+        target = out.get(key)
+        if target is None or target.shape != value.shape or target.dtype != value.dtype:
+            target = out[key] = value.copy()
+        if other is not None and other.shape == value.shape and np.issubdtype(value.dtype, np.floating):
+            np.subtract(other, value, out=target)
+            target *= fraction
+            target += value
+        else:
+            np.copyto(target, value)
+    return out
+
+
+class FrameProducer:
+    """Steps a simulation on a worker thread, up to `depth` frames ahead.
+
+    get() returns the state to show now, paced at `rate` frames per second
+    (None: the rate get() is called at, on average), without waiting for
+    physics except for the very first frame. The dict it returns is reused
+    and updated in place by the next call, and frame is the simulation
+    frame it shows (the earlier one when interpolating).
+    With an astrosim.checkpoint.Checkpoints, keyframes are taken as frames
+    are made. With between_frames, call drawn() once each frame is drawn.
+    stats counts frames produced, shown, dropped, interpolated and held.
+    """
+
+    def __init__(self, sim, rate=None, depth=DEPTH, interpolate=True, checkpoints=None, between_frames=False):
+        self.sim = sim
+        self.rate = rate
+        self.depth = depth
+        self.interpolate = interpolate
+        self.checkpoints = checkpoints
+        self.between_frames = between_frames
+        self.frame = None
+        self._thread = None
+
+    def start(self):
+        # Start (or restart, after stop()) producing from the simulation's
+        # current frame
+        self.stop()
+        self.stats = dict.fromkeys(("produced", "shown", "dropped", "interpolated", "held"), 0)
+        self._free = queue.Queue()
+        for _ in range(self.depth + 2):  # the queued frames plus the two the view holds
+            self._free.put(None)
+        self._ready = queue.Queue()
+        self._stop = threading.Event()
+        self._idle = threading.Event()  # the view is not drawing
+        self._idle.set()
+        self._error = None
+        self._finished = False
+        self._prev = self._next = None  # (frame, buffer, shown)
+        self._out = {}
+        self._clock = None  # frame number the view is due to show
+        self._last = None
+        self._period = None
+        self._thread = threading.Thread(target=self._produce, name="astrosim-frames", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        if self._thread is None:
+            return
+        self._stop.set()
+        self._thread.join()
+        self._thread = None
+
+    def drawn(self):
+        # The frame from the last get() is on screen
+        self._idle.set()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+    def _produce(self):
+        stepper = self.sim if self.checkpoints is None else self.checkpoints
+        try:
+            while not self._stop.is_set():
+                if getattr(self.sim, "done", False):
+                    self._ready.put(None)
+                    return
+                try:
+                    buffer = self._free.get(timeout=0.05)
+                except queue.Empty:
+                    continue
+                while not self._idle.wait(timeout=0.05):
+                    if self._stop.is_set():
+                        return
+                stepper.step()
+                self._ready.put((self.sim.frame, _copy_into(buffer, self.sim.state())))
+                self.stats["produced"] += 1
+        except BaseException as error:
+            self._error = error
+            self._ready.put(None)
+
+    def _pull(self, block):
+        # Move the next queued frame into _next; False if there is none
+        if self._finished:
+            return False
+        try:
+            item = self._ready.get(timeout=None) if block else self._ready.get_nowait()
+        except queue.Empty:
+            return False
+        if item is None:
+            self._finished = True
+            if self._error is not None:
+                raise RuntimeError("frame producer failed") from self._error
+            return False
+        if self._prev is not None:
+            if not self._prev[2]:
+                self.stats["dropped"] += 1
+            self._free.put(self._prev[1])
+        self._prev, self._next = self._next, [item[0], item[1], False]
+        return True
+
+    def get(self, now=None):
+        now = time.perf_counter() if now is None else now
+        if self._next is None:
+            if not self._pull(block=True):
+                raise RuntimeError("the simulation produced no frames")
+            self._clock = float(self._next[0])
+        elif self.rate is not None:
+            self._clock += (now - self._last) * self.rate
+        else:
+            elapsed = now - self._last
+            self._period = elapsed if self._period is None else self._period + SMOOTHING * (elapsed - self._period)
+            self._clock += elapsed / self._period if self._period > 0 else 1.0
+        self._last = now
+        target = self._clock
+        # Drop frames the clock has passed until the next one lies ahead of it
+        while self._next[0] <= target and self._pull(block=False):
+            pass
+
+        if self._next[0] <= target:
+            # Physics is behind: hold the newest frame and let the clock wait
+            self._clock = float(self._next[0])
+            shown = self._next
+            self.stats["held"] += shown[2]
+            _copy_into(self._out, shown[1])
+        elif self._prev is None or target < self._prev[0]:
+            shown = self._next if self._prev is None else self._prev
+            _copy_into(self._out, shown[1])
+        else:
+            shown = self._prev
+            fraction = (target - self._prev[0]) / (self._next[0] - self._prev[0])
+            if self.interpolate and fraction > 0:
+                _blend_into(self._out, self._prev[1], self._next[1], fraction)
+                self.stats["interpolated"] += 1
+            else:
+                _copy_into(self._out, shown[1])
+        if not shown[2]:
+            shown[2] = True
+            self.stats["shown"] += 1
+        self.frame = shown[0]
+        if self.between_frames:
+            self._idle.clear()
+        return self._out
@@ -0,0 +1,187 @@
+# Per-frame instrumentation for views and headless runs.
+#
+# A Profiler splits each frame into phases: "physics" (stepping the sim),
+# "artists" (pushing the state into the artists) and "draw" (rendering,
+# whether a blit or a full canvas draw). It keeps rolling p50/p95/p99
+# latencies per phase over the last `window` frames, and a full per-frame
+# trace that can be written as JSON or CSV. It can also record allocations
+# per frame with tracemalloc and wrap the run in cProfile.
+#
+# Enable it without code changes through the environment:
+#
+#   ASTROSIM_PROFILE=1             print a latency summary at exit
+#   ASTROSIM_PROFILE=trace.json    ... and write the trace (.json or .csv)
+#   ASTROSIM_PROFILE_ALLOC=1       also track allocations per frame
+#   ASTROSIM_CPROFILE=run.prof     dump cProfile stats (see pstats)
+#
+# A "{pid}" in a path is replaced by the process id, so worker processes
+# (e.g. astrosim.render) do not overwrite each other's files.
+
+import atexit
+import cProfile
+import csv
+import functools
+import json
+import os
+import sys
+import time
+import tracemalloc
+from contextlib import contextmanager
+
+import numpy as np
+
+from astrosim.recorder import Recorder
+
+WINDOW = 1000  # frames kept for the rolling percentiles
+PERCENTILES = (50, 95, 99)
+PHASES = ("physics", "artists", "draw")
+
+
+class Profiler:
+    """Phase timings, rolling latency percentiles and a per-frame trace.
+
+    Call start_frame() when a frame begins (View.update does) and time its
+    parts with phase(name). A frame ends at the next start_frame(), or at
+    end_frame()/close(), so a draw that happens after update() returns still
+    counts towards its frame. Nested timing of the same phase counts once.
+    """
+
+    def __init__(self, window=WINDOW, allocations=False, trace=None, cprofile=None):
+        self.window = window
+        self.columns = PHASES + ("frame",) + (("alloc_peak_kb", "alloc_net_kb") if allocations else ())
+        self._rolling = np.zeros((len(self.columns), window))
+        self.frames = 0
+        self.trace = Recorder()
+        self.trace_path = trace
+        self.allocations = allocations
+        self.cprofile_path = cprofile
+        self._current = None
+        self._depth = dict.fromkeys(PHASES, 0)
+        self._closed = False
+        if allocations and not tracemalloc.is_tracing():
+            tracemalloc.start()
+        self._cprofile = None
+        if cprofile:
+            self._cprofile = cProfile.Profile()
+            self._cprofile.enable()
+
+    def start_frame(self):
+        if self._current is not None:
+            self.end_frame()
+        self._current = dict.fromkeys(PHASES, 0.0)
+        if self.allocations:
+            tracemalloc.reset_peak()
+            self._alloc_start = tracemalloc.get_traced_memory()[0]
+
+    def end_frame(self):
+        if self._current is None:
+            return
+        row = dict(self._current)
+        row["frame"] = sum(row[p] for p in PHASES)
+        if self.allocations:
+            current, peak = tracemalloc.get_traced_memory()
+            row["alloc_peak_kb"] = (peak - self._alloc_start) / 1024
+            row["alloc_net_kb"] = (current - self._alloc_start) / 1024
+        self._rolling[:, self.frames % self.window] = [row[c] for c in self.columns]
+        self.trace.record({c: np.float64(row[c]) for c in self.columns})
+        self.frames += 1
+        self._current = None
+
+    @contextmanager
+    def phase(self, name):
+        # Adds the time spent inside to the current frame's phase, in ms
+        if self._depth[name] or self._current is None:
+            self._depth[name] += 1
+            try:
+                yield
+            finally:
+                self._depth[name] -= 1
+            return
+        self._depth[name] += 1
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self._depth[name] -= 1
+            if self._current is not None:
+                self._current[name] += (time.perf_counter() - start) * 1e3
+
+    def timed(self, name, fn):
+        # fn wrapped so that every call is timed as phase `name`
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            with self.phase(name):
+                return fn(*args, **kwargs)
+        return wrapper
+
+    def percentiles(self, column="frame", q=PERCENTILES):
+        # Rolling percentiles of one column over the last `window` frames
+        n = min(self.frames, self.window)
+        values = self._rolling[self.columns.index(column), :n]
+        if not n:
+            return dict.fromkeys((f"p{p}" for p in q), float("nan"))
+        return dict(zip((f"p{p}" for p in q), np.percentile(values, q)))
+
+    def summary(self):
+        return {"frames": self.frames, **{c: self.percentiles(c) for c in self.columns}}
+
+    def report(self):
+        lines = [f"{self.frames} frames (rolling window {self.window})",
+                 f"{'':>14} " + " ".join(f"{'p' + str(p):>9}" for p in PERCENTILES)]
+        for column in self.columns:
+            label = column if column.startswith("alloc") else column + " ms"
+            values = self.percentiles(column).values()
+            lines.append(f"{label:>14} " + " ".join(f"{v:>9.3f}" for v in values))
+        return "\n".join(lines)
+
+    def write(self, path):
+        # The per-frame trace as .csv rows or as .json with the summary
+        self.end_frame()
+        arrays = self.trace.arrays()
+        if path.endswith(".csv"):
+            with open(path, "w", newline="") as f:
+                writer = csv.writer(f)
+                writer.writerow(("index",) + self.columns)
+                columns = [arrays.get(c, np.zeros(0)) for c in self.columns]
+                for i, row in enumerate(zip(*columns)):
+                    writer.writerow((i,) + tuple(f"{v:.6g}" for v in row))
+        else:
+            with open(path, "w") as f:
+                json.dump({"summary": self.summary(),
+                           "frames": {c: arrays.get(c, np.zeros(0)).tolist() for c in self.columns}}, f)
+
+    def close(self):
+        # Finish the last frame, stop cProfile and tracemalloc, and write
+        # the trace if a path was given; returns the summary
+        if self._closed:
+            return self.summary()
+        self._closed = True
+        self.end_frame()
+        if self._cprofile is not None:
+            self._cprofile.disable()
+            self._cprofile.dump_stats(self.cprofile_path)
+        if self.allocations:
+            tracemalloc.stop()
+        if self.trace_path:
+            self.write(self.trace_path)
+        return self.summary()
+
+
+def _path(value):
+    return value.replace("{pid}", str(os.getpid())) if value else value
+
+
+def from_env(environ=os.environ, report_at_exit=True):
+    # A Profiler configured from the ASTROSIM_PROFILE* variables, or None
+    # when profiling is off. By default it is closed and reports to stderr
+    # when the process exits.
+    setting = environ.get("ASTROSIM_PROFILE", "")
+    cprofile = _path(environ.get("ASTROSIM_CPROFILE", ""))
+    if setting in ("", "0") and not cprofile:
+        return None
+    trace = None if setting in ("", "0", "1") else _path(setting)
+    profiler = Profiler(allocations=environ.get("ASTROSIM_PROFILE_ALLOC", "") not in ("", "0"),
+                        trace=trace, cprofile=cprofile or None)
+    if report_at_exit:
+        atexit.register(lambda: (profiler.close(), print(profiler.report(), file=sys.stderr)))
+    return profiler
@@ -0,0 +1,159 @@
+# Streaming recorder for simulation states.
+#
+# States are written row by row into preallocated NumPy chunk buffers, one
+# buffer per state field, so recording never builds Python lists of floats.
+# Full chunks are either kept in memory, dropped (ring mode, which keeps only
+# the newest rows) or appended to one .npy file per field. The .npy header is
+# rewritten after every flush, so the files can be memory-mapped with
+# load() while a run is still going, or after it crashed.
+
+import os
+
+import numpy as np
+
+# Default chunk size, in bytes across all fields of a row
+CHUNK_BYTES = 8 << 20
+
+# Every .npy header is padded to this many bytes so it can be rewritten in
+# place as the row count grows
+_HEADER_BYTES = 256
+
+
+class _NpyAppender:
+    # One .npy file growing along its first axis
+
+    def __init__(self, path, dtype, row_shape):
+        self.path = path
+        self.dtype = np.dtype(dtype)
+        self.row_shape = tuple(row_shape)
+        self.rows = 0
+        self._file = open(path, "wb")
+        self._write_header()
+
+    def _write_header(self):
+        header = repr({
+            "descr": np.lib.format.dtype_to_descr(self.dtype),
+            "fortran_order": False,
+            "shape": (self.rows,) + self.row_shape,
+        })
+        # magic (6) + version (2) + header length (2) + header text
+        pad = _HEADER_BYTES - 10 - len(header) - 1
+        if pad < 0:
+            raise ValueError(f"dtype {self.dtype} is too large for a {_HEADER_BYTES}-byte .npy header")
+        self._file.seek(0)
+        self._file.write(b"\x93NUMPY\x01\x00")
+        self._file.write((_HEADER_BYTES - 10).to_bytes(2, "little"))
+        self._file.write((header + " " * pad + "\n").encode("latin1"))
+        self._file.seek(0, os.SEEK_END)
+
+    def append(self, block):
+        self._file.write(np.ascontiguousarray(block, dtype=self.dtype).tobytes())
+        self.rows += len(block)
+        self._write_header()
+        self._file.flush()
+
+    def close(self):
+        self._file.close()
+
+
+class Recorder:
+    """Records state dicts (as returned by a sim's state()) field by field.
+
+    path=None keeps everything in memory; ring=True keeps only the newest
+    chunk_size rows; otherwise full chunks are appended to <path>/<field>.npy.
+    Memory use is one chunk per field in the ring and on-disk modes. Without
+    a chunk_size, chunks hold about CHUNK_BYTES of rows.
+    """
+
+    def __init__(self, path=None, chunk_size=None, ring=False):
+        if ring and path is not None:
+            raise ValueError("a ring recorder keeps its rows in memory; drop path or ring")
+        if ring and not chunk_size:
+            raise ValueError("a ring recorder needs a chunk_size (the number of rows it keeps)")
+        self.path = path
+        self.chunk_size = chunk_size
+        self.ring = ring
+        self.rows = 0  # total rows recorded
+        self._buffers = None
+        self._fill = 0  # rows in the current chunk
+        self._chunks = {}  # in-memory mode: field -> list of full chunks
+        self._files = {}
+        if path is not None:
+            os.makedirs(path, exist_ok=True)
+
+    def __len__(self):
+        return self.rows
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def _allocate(self, state):
+        state = {key: np.asarray(value) for key, value in state.items()}
+        if not self.chunk_size:
+            row_bytes = sum(value.nbytes for value in state.values())
+            self.chunk_size = max(1, CHUNK_BYTES // max(row_bytes, 1))
+        self._buffers = {}
+        for key, value in state.items():
+            self._buffers[key] = np.empty((self.chunk_size,) + value.shape, dtype=value.dtype)
+            if self.path is not None:
+                self._files[key] = _NpyAppender(os.path.join(self.path, key + ".npy"), value.dtype, value.shape)
+            else:
+                self._chunks[key] = []
+
+    def record(self, state):
+        if self._buffers is None:
+            self._allocate(state)
+        row = self.rows % self.chunk_size if self.ring else self._fill
+        for key, buf in self._buffers.items():
+            buf[row] = state[key]
+        self.rows += 1
+        self._fill += 1
+        if self._fill == self.chunk_size:
+            self.flush()
+
+    def flush(self):
+        if not self._fill or self._buffers is None:
+            return
+        if self.ring:
+            self._fill = 0  # rows stay in place and are overwritten in turn
+            return
+        for key, buf in self._buffers.items():
+            block = buf[:self._fill]
+            if self.path is not None:
+                self._files[key].append(block)
+            else:
+                self._chunks[key].append(block.copy())
+        self._fill = 0
+
+    def arrays(self):
+        # Everything recorded so far as one array per field (ring mode: the
+        # newest rows, oldest first). On-disk recordings are memory-mapped.
+        if self.path is not None:
+            self.flush()
+            return load(self.path)
+        if self._buffers is None:
+            return {}
+        if self.ring:
+            n = min(self.rows, self.chunk_size)
+            start = self.rows % self.chunk_size if self.rows > self.chunk_size else 0
+            order = (np.arange(n) + start) % self.chunk_size
+            return {key: buf[order] for key, buf in self._buffers.items()}
+        return {key: np.concatenate(self._chunks[key] + [buf[:self._fill]])
+                for key, buf in self._buffers.items()}
+
+    def close(self):
+        self.flush()
+        for f in self._files.values():
+            f.close()
+        self._files = {}
+
+
+def load(path, mmap_mode="r"):
+    # Fields recorded to `path`, memory-mapped by default
+    return {
+        name[:-4]: np.load(os.path.join(path, name), mmap_mode=mmap_mode)
+        for name in sorted(os.listdir(path)) if name.endswith(".npy")
+    }
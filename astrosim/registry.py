@@ -0,0 +1,44 @@
+# Name -> (compute core module, view class) for every simulation.
+#
+# Both are import paths rather than objects so that looking a simulation up
+# never imports matplotlib; the view is only imported when something renders.
+
+import importlib
+import inspect
+
+SIMULATIONS = {
+    "orbits": ("astrosim.orbits", "astrosim.views.orbits:OrbitView"),
+    "rocket": ("astrosim.rocket", None),
+    "solar": ("astrosim.solar", "astrosim.views.solar:SolarSystemView"),
+    "debris": ("astrosim.debris", "astrosim.views.debris:DebrisView"),
+    "hohmann": ("astrosim.hohmann", "astrosim.views.hohmann:HohmannView"),
+    "constellation": ("astrosim.constellation", "astrosim.views.constellation:ConstellationView"),
+}
+
+
+def _lookup(name):
+    try:
+        return SIMULATIONS[name]
+    except KeyError:
+        raise ValueError(f"unknown simulation {name!r}; choose from {', '.join(SIMULATIONS)}") from None
+
+
+def create(name, **params):
+    # Build the compute core of a simulation
+    module, _ = _lookup(name)
+    return importlib.import_module(module).create(**params)
+
+
+def takes_seed(name):
+    # Whether a simulation's initial state is random, i.e. its create()
+    # takes a seed
+    module, _ = _lookup(name)
+    return "seed" in inspect.signature(importlib.import_module(module).create).parameters
+
+
+def view_class(name):
+    _, view = _lookup(name)
+    if view is None:
+        raise ValueError(f"simulation {name!r} has no renderer")
+    module, cls = view.split(":")
+    return getattr(importlib.import_module(module), cls)
@@ -0,0 +1,139 @@
+# Offline rendering of an animation to a video, GIF or PNG sequence.
+#
+# The frame range is split into one contiguous chunk per worker process.
+# Each worker builds its own simulation and view on the Agg backend, replays
+# the frames before its chunk without drawing them (so trails and any other
+# view state match a serial run), then draws its frames into raw RGB
+# buffers. Video and GIF output is stitched from the chunks in frame order;
+# PNG frames are written by the workers themselves.
+#
+# Every chunk must start from the same initial state, so a simulation with
+# a random one that is given no seed gets one drawn here and passed to all
+# the workers. With profiling switched on (see astrosim.profiling), every
+# worker reports on the frames it drew.
+
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from astrosim import registry
+
+DEFAULT_FRAMES = 1000  # for simulations without a num_frames of their own
+PNG_PATTERN = "frame_{:05d}.png"
+
+
+def frame_chunks(frames, workers):
+    # Split range(frames) into `workers` contiguous (start, stop) pairs
+    bounds = np.linspace(0, frames, min(workers, frames) + 1).round().astype(int)
+    return [(int(lo), int(hi)) for lo, hi in zip(bounds[:-1], bounds[1:])]
+
+
+def _render_chunk(args):
+    name, params, start, stop, dpi, target, as_png = args
+    import matplotlib
+    matplotlib.use("Agg")
+    import matplotlib.pyplot as plt
+    from matplotlib.image import imsave
+
+    from astrosim import profiling
+
+    view = registry.view_class(name)(registry.create(name, **params))
+    if dpi is not None:
+        view.fig.set_dpi(dpi)
+    canvas = view.fig.canvas
+    for i in range(start):
+        view.update(i)
+    # Only the frames this chunk draws are profiled, not the replay
+    profiler = profiling.from_env(report_at_exit=False)
+    if profiler is not None:
+        view.instrument(profiler)
+
+    width, height = canvas.get_width_height()
+    if not as_png:
+        out = np.lib.format.open_memmap(target, mode="w+", dtype=np.uint8, shape=(stop - start, height, width, 3))
+    for i in range(start, stop):
+        view.update(i)
+        canvas.draw()
+        rgb = np.asarray(canvas.buffer_rgba())[..., :3]
+        if as_png:
+            imsave(os.path.join(target, PNG_PATTERN.format(i)), rgb)
+        else:
+            out[i - start] = rgb
+    if not as_png:
+        out.flush()
+        del out
+    plt.close(view.fig)
+    if profiler is not None:
+        profiler.close()
+        print(f"frames {start}-{stop - 1}: {profiler.report()}", file=sys.stderr)
+    return width, height
+
+
+def _frames_in_order(chunk_files):
+    for path in chunk_files:
+        yield from np.load(path, mmap_mode="r")
+
+
+def _encode_video(chunk_files, size, fps, out):
+    ffmpeg = shutil.which("ffmpeg")
+    if ffmpeg is None:
+        raise RuntimeError("ffmpeg not found on PATH; render to a .gif or a PNG directory instead")
+    width, height = size
+    cmd = [ffmpeg, "-y", "-loglevel", "error",
+           "-f", "rawvideo", "-pix_fmt", "rgb24", "-s", f"{width}x{height}", "-r", str(fps), "-i", "-",
+           "-pix_fmt", "yuv420p", "-vf", "pad=ceil(iw/2)*2:ceil(ih/2)*2", out]
+    with subprocess.Popen(cmd, stdin=subprocess.PIPE) as proc:
+        for frame in _frames_in_order(chunk_files):
+            proc.stdin.write(np.ascontiguousarray(frame).data)
+        proc.stdin.close()
+    if proc.returncode:
+        raise RuntimeError(f"ffmpeg exited with status {proc.returncode}")
+
+
+def _encode_gif(chunk_files, fps, out):
+    from PIL import Image
+    images = (Image.fromarray(np.asarray(frame)) for frame in _frames_in_order(chunk_files))
+    first = next(images)
+    first.save(out, save_all=True, append_images=images, duration=round(1000 / fps), loop=0)
+
+
+def render(name, out, frames=None, workers=None, fps=None, dpi=None, **params):
+    """Render `frames` frames of a simulation's view to `out`.
+
+    out ending in .gif is written with Pillow, any other extension (.mp4,
+    .webm, ...) through an ffmpeg pipe, and a path without an extension is
+    a directory of PNG frames. fps defaults to the view's own frame
+    interval. Returns the number of frames rendered.
+    """
+    if registry.takes_seed(name) and params.get("seed") is None:
+        params["seed"] = np.random.SeedSequence().entropy
+    if frames is None:
+        frames = getattr(registry.create(name, **params), "num_frames", DEFAULT_FRAMES)
+    workers = workers or os.cpu_count() or 1
+    if fps is None:
+        fps = 1000 / registry.view_class(name).interval
+    ext = os.path.splitext(out)[1].lower()
+    as_png = not ext
+
+    with tempfile.TemporaryDirectory(prefix="astrosim-render-") as tmp:
+        if as_png:
+            os.makedirs(out, exist_ok=True)
+        chunks = frame_chunks(frames, workers)
+        targets = [out if as_png else os.path.join(tmp, f"chunk_{lo:06d}.npy") for lo, _ in chunks]
+        jobs = [(name, params, lo, hi, dpi, target, as_png) for (lo, hi), target in zip(chunks, targets)]
+        if workers == 1 or len(jobs) == 1:
+            sizes = [_render_chunk(job) for job in jobs]
+        else:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                sizes = list(pool.map(_render_chunk, jobs))
+
+        if ext == ".gif":
+            _encode_gif(targets, fps, out)
+        elif not as_png:
+            _encode_video(targets, sizes[0], fps, out)
+    return frames
@@ -0,0 +1,377 @@
+# Compute core for the rocket trajectory simulation.
+#
+# A vertically launched rocket under constant thrust, gravity and quadratic
+# drag, integrated with semi-implicit Euler. simulate_ensemble() runs the same
+# model for thousands of parameter samples at once, and fly() integrates it
+# adaptively with exact burnout, apogee and impact events.
+#
+# By default air density, drag coefficient and mass stay constant. The
+# stepped models (RocketModel and simulate_ensemble) can switch on a
+# standard atmosphere, a Mach-dependent Cd, a propellant load burnt at a
+# given specific impulse, or a thrust curve from a motor file. All of these
+# are read from precomputed tables (see astrosim.aero), so they add only a
+# few multiply-adds per step. fly() keeps the constant model.
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from astrosim import aero
+from astrosim.integrate import dopri5, event
+from astrosim.recorder import Recorder
+from astrosim.seeding import spawn
+
+# Constants
+G = 9.81  # gravity (m/s^2)
+RHO = 1.225  # air density at sea level (kg/m^3)
+CD = 0.75  # drag coefficient
+AREA = 0.03  # cross-sectional area (m^2)
+MASS = 50  # mass of rocket (kg)
+F_THRUST = 1500  # constant thrust (N)
+BURN_TIME = None  # thrust cutoff (s); None burns for the whole flight
+ISP = 180.0  # specific impulse when burning a propellant load (s)
+
+DT = 0.01  # time step (s)
+MAX_TIME = 30  # max. simulation time (s)
+
+
+class RocketModel:
+    """Single rocket stepped one dt at a time.
+
+    state() gives time, altitude and velocity after the last step; done turns
+    True once the rocket is back below ground or max_time is reached.
+
+    atmosphere=True replaces the constant rho with the standard atmosphere.
+    cd_mach scales cd by a Mach number table (True for aero.MACH_CD, or
+    (mach, multiplier) pairs). propellant (kg) is burnt at the thrust's mass
+    flow for the given isp, and thrust stops when it runs out. motor (an
+    aero.Motor or a .eng path) replaces thrust with its thrust curve and
+    adds its mass as it burns. mass is always the dry mass without
+    propellant or motor.
+    """
+
+    def __init__(self, thrust=F_THRUST, cd=CD, area=AREA, mass=MASS,
+                 g=G, rho=RHO, dt=DT, max_time=MAX_TIME, burn_time=BURN_TIME,
+                 atmosphere=False, cd_mach=None, propellant=0.0, isp=ISP, motor=None):
+        self.thrust = thrust
+        self.burn_time = burn_time
+        self.cd = cd
+        self.area = area
+        self.mass = mass
+        self.g = g
+        self.rho = rho
+        self.dt = dt
+        self.max_time = max_time
+        self.propellant = propellant
+        self.isp = isp
+        self._atmosphere = aero.atmosphere_table() if atmosphere else None
+        self._mach_cd = aero.mach_cd_table(cd_mach) if cd_mach is not None and cd_mach is not False else None
+        self.motor = aero.motor(motor)
+        self._motor = None if self.motor is None else self.motor.table()
+        self._mdot = thrust / (isp * aero.G0) if propellant else 0.0
+
+        # Initial conditions
+        self.y = 0.0  # altitude (m)
+        self.v = 0.0  # velocity (m/s)
+        self.t = 0.0  # time of the next step
+        self.frame = 0
+        self._state = {"t": np.float64(0.0), "altitude": np.float64(0.0), "velocity": np.float64(0.0)}
+
+    @property
+    def done(self):
+        return self.y < 0 or self.t >= self.max_time
+
+    def step(self):
+        # Calculate drag force
+        rho, cd = self.rho, self.cd
+        if self._atmosphere is not None or self._mach_cd is not None:
+            sound = aero.SPEED_OF_SOUND
+            if self._atmosphere is not None:
+                rho, sound = self._atmosphere.at(self.y)
+            if self._mach_cd is not None:
+                cd = self.cd * self._mach_cd.at(abs(self.v) / sound)
+        F_drag = 0.5 * rho * cd * self.area * self.v * abs(self.v)
+
+        # Calculate acceleration
+        burning = self.burn_time is None or self.t < self.burn_time
+        thrust = self.thrust if burning else 0.0
+        mass = self.mass
+        if self._motor is not None:
+            thrust, motor_mass = self._motor.at(self.t)
+            thrust = thrust if burning else 0.0
+            mass = self.mass + motor_mass
+            # Held on the pad until the thrust curve exceeds the weight
+            if self.y == 0.0 and self.v == 0.0 and thrust <= mass * self.g + F_drag:
+                thrust = mass * self.g
+        elif self.propellant:
+            burnt = self._mdot * (self.t if self.burn_time is None else min(self.t, self.burn_time))
+            remaining = max(self.propellant - burnt, 0.0)
+            thrust = thrust if remaining > 0 else 0.0
+            mass = self.mass + remaining
+        a = (thrust - mass * self.g - F_drag) / mass
+
+        # Update velocity and position
+        self.v = self.v + a * self.dt
+        self.y = self.y + self.v * self.dt
+
+        self._state = {"t": np.float64(self.t), "altitude": np.float64(self.y), "velocity": np.float64(self.v)}
+        self.t += self.dt
+        self.frame += 1
+
+    def state(self):
+        return self._state
+
+    def snapshot(self):
+        # Mutable state for astrosim.checkpoint
+        return {"y": self.y, "v": self.v, "t": self.t, "state_t": self._state["t"], "frame": self.frame}
+
+    def restore(self, snap):
+        self.y, self.v, self.t = float(snap["y"]), float(snap["v"]), float(snap["t"])
+        self.frame = int(snap["frame"])
+        self._state = {"t": np.float64(snap["state_t"]), "altitude": np.float64(self.y), "velocity": np.float64(self.v)}
+
+
+def simulate(recorder=None, **params):
+    # Run one flight to the ground (or max_time) and return its time series
+    # plus the headline results. The series go through `recorder` (default:
+    # in memory); pass an on-disk Recorder to stream long runs to .npy files.
+    rocket = RocketModel(**params)
+    recorder = Recorder(chunk_size=4096) if recorder is None else recorder
+    while not rocket.done:
+        rocket.step()
+        recorder.record(rocket.state())
+    series = recorder.arrays()
+    altitude = series.get("altitude", np.zeros(0))
+    return {
+        "time": series.get("t", np.zeros(0)),
+        "altitude": altitude,
+        "velocity": series.get("velocity", np.zeros(0)),
+        "max_altitude": altitude.max() if len(altitude) else 0.0,
+        "flight_time": rocket.t,
+    }
+
+
+def disperse(n, rng=None, sigma=0.05, thrust=F_THRUST, cd=CD, area=AREA, mass=MASS):
+    # n parameter samples with independent normal dispersions of relative
+    # size sigma around the nominal values
+    rng = np.random.default_rng(rng)
+    return {
+        name: nominal * (1 + sigma * rng.standard_normal(n))
+        for name, nominal in (("thrust", thrust), ("cd", cd), ("area", area), ("mass", mass))
+    }
+
+
+def simulate_ensemble(thrust=F_THRUST, cd=CD, area=AREA, mass=MASS,
+                      g=G, rho=RHO, dt=DT, max_time=MAX_TIME, burn_time=BURN_TIME,
+                      atmosphere=False, cd_mach=None, propellant=0.0, isp=ISP, motor=None):
+    """Fly every parameter sample at once.
+
+    Parameters broadcast against each other to one sample per element. Each
+    step updates only the rockets still in the air: landed ones are dropped
+    from the working arrays, so the cost follows the live count. Steps and
+    landing checks match simulate() exactly, including the atmosphere, Cd,
+    propellant and motor options of RocketModel.
+
+    burn_time, if given, is a single cutoff time shared by all samples, and
+    so is a motor's thrust curve. propellant may vary per sample.
+    Returns apogee, flight_time and landed arrays, one entry per sample.
+    """
+    thrust, cd, area, mass, propellant = np.broadcast_arrays(
+        *(np.asarray(p, dtype=np.float64) for p in (thrust, cd, area, mass, propellant)))
+    n = thrust.size
+    thrust, cd, area, mass, propellant = (p.ravel() for p in (thrust, cd, area, mass, propellant))
+    drag_k = 0.5 * rho * cd * area
+    weight = mass * g
+    atmosphere = aero.atmosphere_table() if atmosphere else None
+    mach_cd = aero.mach_cd_table(cd_mach) if cd_mach is not None and cd_mach is not False else None
+    motor = aero.motor(motor)
+    motor = None if motor is None else motor.table()
+    # Samples without propellant fly the constant-mass model, as in simulate()
+    fuelled = propellant > 0
+    burns = motor is None and bool(fuelled.any())
+    mdot = thrust / (isp * aero.G0) if burns else None
+
+    apogee = np.zeros(n)
+    flight_time = np.zeros(n)
+    landed = np.zeros(n, dtype=bool)
+
+    idx = np.arange(n)
+    y = np.zeros(n)
+    v = np.zeros(n)
+    top = np.full(n, -np.inf)
+    t = 0.0
+    while len(idx) and t < max_time:
+        if atmosphere is None and mach_cd is None:
+            drag = drag_k * v * np.abs(v)
+        else:
+            rho_now, sound = rho, aero.SPEED_OF_SOUND
+            if atmosphere is not None:
+                rho_now, sound = atmosphere(y)
+            cd_now = cd if mach_cd is None else cd * mach_cd(np.abs(v) / sound)
+            drag = 0.5 * rho_now * cd_now * area * v * np.abs(v)
+
+        burning = burn_time is None or t < burn_time
+        thrust_now, mass_now, weight_now = (thrust if burning else 0.0), mass, weight
+        if motor is not None:
+            thrust_now, motor_mass = motor.at(t)
+            thrust_now = thrust_now if burning else 0.0
+            mass_now = mass + motor_mass
+            weight_now = mass_now * g
+            # Held on the pad until the thrust curve exceeds the weight
+            pad = (y == 0.0) & (v == 0.0) & (thrust_now <= weight_now + drag)
+            if pad.any():
+                thrust_now = np.where(pad, weight_now, thrust_now)
+        elif burns:
+            remaining = np.maximum(propellant - mdot * (t if burn_time is None else min(t, burn_time)), 0.0)
+            thrust_now = np.where(fuelled & (remaining <= 0), 0.0, thrust_now)
+            mass_now = np.where(fuelled, mass + remaining, mass)
+            weight_now = np.where(fuelled, mass_now * g, weight)
+        a = (thrust_now - weight_now - drag) / mass_now
+        v += a * dt
+        y += v * dt
+        np.maximum(top, y, out=top)
+        t += dt
+
+        down = y < 0
+        if down.any():
+            gone = idx[down]
+            apogee[gone] = top[down]
+            flight_time[gone] = t
+            landed[gone] = True
+            keep = ~down
+            idx, y, v, top = idx[keep], y[keep], v[keep], top[keep]
+            thrust, cd, area, mass, drag_k, weight, propellant = (
+                p[keep] for p in (thrust, cd, area, mass, drag_k, weight, propellant))
+            if burns:
+                mdot, fuelled = mdot[keep], fuelled[keep]
+
+    # Still flying at max_time
+    apogee[idx] = top
+    flight_time[idx] = t
+    return {"apogee": apogee, "flight_time": flight_time, "landed": landed}
+
+
+def fly(thrust=F_THRUST, cd=CD, area=AREA, mass=MASS, g=G, rho=RHO,
+        max_time=MAX_TIME, burn_time=BURN_TIME, rtol=1e-8, atol=1e-8):
+    """One flight with the adaptive Dormand-Prince integrator.
+
+    The burn and the coast are integrated as separate legs so the thrust
+    cutoff is never stepped across. Apogee (velocity falling through zero)
+    and impact (altitude falling through zero) are located as events instead
+    of being caught on the step after they happen.
+    """
+    drag_k = 0.5 * rho * cd * area
+
+    def rhs(thrust_now):
+        def f(t, s):
+            v = s[1]
+            return np.array([v, (thrust_now - mass * g - drag_k * v * abs(v)) / mass])
+        return f
+
+    @event(terminal=True, direction=-1)
+    def impact(t, s):
+        return s[0]
+
+    @event(direction=-1)
+    def apogee(t, s):
+        return s[1]
+
+    # (thrust, end time) of the burn and, if the motor cuts out early, the coast
+    legs = [(thrust, max_time if burn_time is None else min(burn_time, max_time))]
+    if burn_time is not None and burn_time < max_time:
+        legs.append((0.0, max_time))
+
+    result = {"burnout_time": None, "apogee_time": None, "impact_time": None, "nfev": 0, "steps": 0}
+    t, s = 0.0, np.zeros(2)
+    ts, states = [np.zeros(1)], [s[None, :]]
+    for leg, (thrust_now, t_end) in enumerate(legs):
+        sol = dopri5(rhs(thrust_now), t, s, t_end, rtol=rtol, atol=atol, events=[impact, apogee])
+        result["nfev"] += sol["nfev"]
+        result["steps"] += sol["steps"]
+        ts.append(sol["t"][1:])
+        states.append(sol["y"][1:])
+        t, s = sol["t"][-1], sol["y"][-1]
+        if len(sol["t_events"][1]) and result["apogee_time"] is None:
+            result["apogee_time"] = sol["t_events"][1][0]
+            result["apogee"] = sol["y_events"][1][0][0]
+        if sol["terminated"] is not None:
+            result["impact_time"] = t
+            break
+        if leg == 0 and len(legs) > 1:
+            result["burnout_time"] = t
+
+    states = np.concatenate(states)
+    if result["apogee_time"] is None:
+        # Still climbing at the end of the run
+        top = int(np.argmax(states[:, 0]))
+        result["apogee"] = states[top, 0]
+    result["time"] = np.concatenate(ts)
+    result["altitude"] = states[:, 0]
+    result["velocity"] = states[:, 1]
+    result["flight_time"] = t
+    return result
+
+
+def _ensemble_chunk(args):
+    params, kwargs = args
+    return simulate_ensemble(**params, **kwargs)
+
+
+def run_ensemble(params, workers=None, chunk_size=10_000, **kwargs):
+    # simulate_ensemble() in chunks small enough to stay in cache, spread over
+    # a process pool. params maps thrust/cd/area/mass to equal-length sample
+    # arrays.
+    n = len(next(iter(params.values())))
+    workers = workers or os.cpu_count() or 1
+    chunks = [({k: np.asarray(v)[lo:lo + chunk_size] for k, v in params.items()}, kwargs)
+              for lo in range(0, n, chunk_size)]
+    if workers == 1 or len(chunks) == 1:
+        parts = [_ensemble_chunk(c) for c in chunks]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            parts = list(pool.map(_ensemble_chunk, chunks))
+    return {key: np.concatenate([p[key] for p in parts]) for key in parts[0]}
+
+
+def _monte_carlo_chunk(args):
+    n, seed, sigma, kwargs = args
+    return simulate_ensemble(**disperse(n, seed, sigma), **kwargs)
+
+
+def monte_carlo(n, seed=None, sigma=0.05, workers=None, chunk_size=10_000, **kwargs):
+    # n dispersed flights in chunks over a process pool. Each chunk draws its
+    # own samples from a child of `seed` (see astrosim.seeding), so the result
+    # depends on seed and chunk_size only, not on the number of workers.
+    sizes = [min(chunk_size, n - lo) for lo in range(0, n, chunk_size)]
+    chunks = [(size, child, sigma, kwargs) for size, child in zip(sizes, spawn(seed, len(sizes)))]
+    workers = workers or os.cpu_count() or 1
+    if workers == 1 or len(chunks) == 1:
+        parts = [_monte_carlo_chunk(c) for c in chunks]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            parts = list(pool.map(_monte_carlo_chunk, chunks))
+    return {key: np.concatenate([p[key] for p in parts]) for key in parts[0]}
+
+
+def summarize(result, percentiles=(5, 50, 95)):
+    # Percentiles of the apogee and flight-time distributions
+    return {
+        key: dict(zip((f"p{p}" for p in percentiles), np.percentile(result[key], percentiles)))
+        for key in ("apogee", "flight_time")
+    }
+
+
+def flight_summary(rocket, states):
+    # Sweep metrics (see astrosim.sweep) for a RocketModel run: the
+    # headline results of simulate(), plus the top speed
+    max_altitude = top_speed = 0.0
+    for state in states:
+        max_altitude = max(max_altitude, float(state["altitude"]))
+        top_speed = max(top_speed, abs(float(state["velocity"])))
+    return {"max_altitude": np.float64(max_altitude), "flight_time": np.float64(rocket.t),
+            "top_speed": np.float64(top_speed)}
+
+
+def create(**params):
+    return RocketModel(**params)
@@ -0,0 +1,39 @@
+# Headless stepping of any compute core.
+
+from astrosim.recorder import Recorder
+
+
+def run(sim, steps, profiler=None, checkpoints=None):
+    # Step sim up to `steps` times (stopping early if it reports done) and
+    # yield its state after each step. States may be views into the sim's own
+    # buffers, so copy what you keep. An astrosim.profiling.Profiler, if
+    # given, times every step as one frame's "physics". With an
+    # astrosim.checkpoint.Checkpoints over sim, keyframes are taken as the
+    # run goes.
+    stepper = sim if checkpoints is None else checkpoints
+    for _ in range(steps):
+        if getattr(sim, "done", False):
+            return
+        if profiler is None:
+            stepper.step()
+            yield sim.state()
+            continue
+        profiler.start_frame()
+        with profiler.phase("physics"):
+            stepper.step()
+            state = sim.state()
+        yield state
+
+
+def record(sim, steps, recorder, every=1, profiler=None, checkpoints=None):
+    # Feed every `every`-th state into a Recorder; returns the recorder
+    for i, state in enumerate(run(sim, steps, profiler, checkpoints)):
+        if i % every == 0:
+            recorder.record(state)
+    recorder.flush()
+    return recorder
+
+
+def run_to_arrays(sim, steps, every=1, profiler=None, checkpoints=None):
+    # Collect every `every`-th state into arrays with a leading step axis
+    return record(sim, steps, Recorder(), every, profiler, checkpoints).arrays()
@@ -0,0 +1,34 @@
+# Reproducible random streams.
+#
+# Nothing in astrosim draws from the global np.random state. Every
+# simulation takes a seed (an int, a np.random.SeedSequence or None for
+# fresh OS entropy) and builds its own Generator from it. Runs that are
+# split across processes get child seeds spawned from one master seed.
+# The children are statistically independent, and each one depends only on
+# the master seed and its position, never on which process runs it or in
+# what order. A batch therefore reproduces bit for bit with any number of
+# workers.
+
+import numpy as np
+
+
+def spawn(seed, n):
+    # n independent child SeedSequences of a master seed. A SeedSequence
+    # is copied first, so spawning twice from it gives the same children.
+    if isinstance(seed, np.random.SeedSequence):
+        parent = np.random.SeedSequence(seed.entropy, spawn_key=seed.spawn_key)
+    else:
+        parent = np.random.SeedSequence(seed)
+    return parent.spawn(n)
+
+
+def streams(seed, n):
+    # n independent Generators from a master seed
+    return [np.random.default_rng(child) for child in spawn(seed, n)]
+
+
+def seed_key(seed):
+    # JSON-friendly, stable form of a seed, for cache keys
+    if isinstance(seed, np.random.SeedSequence):
+        return {"entropy": seed.entropy, "spawn_key": list(seed.spawn_key)}
+    return seed
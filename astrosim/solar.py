@@ -0,0 +1,172 @@
+# Compute core for the Solar System simulation.
+#
+# By default the planets are integrated under their mutual gravity by the
+# N-body engine; gravity=False keeps the original kinematic model of circular
+# inclined orbits at the real periods. Either way, orbit radii are replaced by
+# hand-picked display radii so the inner planets are visible.
+
+import numpy as np
+
+from astrosim.ephemeris import Ephemeris
+from astrosim.geometry import orbit_polyline
+from astrosim.nbody import NBody
+
+# Planetary data: name, color, orbital radius (AU), orbital period (years), inclination (deg), axial tilt (deg)
+PLANETS = [
+    ("Sun", "yellow", 0, 1, 0, 7.25),
+    ("Mercury", "brown", 0.39, 0.24, 7.0, 0.03),
+    ("Venus", "orange", 0.72, 0.62, 3.4, 177.4),
+    ("Earth", "blue", 1.00, 1.00, 0.0, 23.4),
+    ("Mars", "red", 1.52, 1.88, 1.85, 25.2),
+    ("Jupiter", "goldenrod", 5.20, 11.86, 1.3, 3.1),
+    ("Saturn", "gold", 9.58, 29.46, 2.5, 26.7),
+    ("Uranus", "lightblue", 19.18, 84.01, 0.8, 97.8),
+    ("Neptune", "darkblue", 30.07, 164.8, 1.8, 28.3),
+]
+
+# Planet masses in solar masses (Earth includes the Moon)
+PLANET_MASSES = {
+    "Sun": 1.0,
+    "Mercury": 1.660e-7,
+    "Venus": 2.448e-6,
+    "Earth": 3.040e-6,
+    "Mars": 3.227e-7,
+    "Jupiter": 9.548e-4,
+    "Saturn": 2.859e-4,
+    "Uranus": 4.366e-5,
+    "Neptune": 5.151e-5,
+}
+
+# Custom scale factors for orbital radii to spread out inner planets more visually
+RADIUS_SCALE_FACTORS = {
+    "Sun": 0,
+    "Mercury": 5,
+    "Venus": 9,
+    "Earth": 13,
+    "Mars": 18,
+    "Jupiter": 26,
+    "Saturn": 32,
+    "Uranus": 38,
+    "Neptune": 44,
+}
+
+TIME_STEP = 0.002  # years per frame at sim_speed 1
+
+
+class SolarSystem:
+    """Solar system display model; all planets are advanced together.
+
+    With gravity=True the planets (and `test_particles` asteroids) are
+    integrated by an NBody engine, available as self.engine; otherwise they
+    follow fixed circles. sim_speed can be changed between steps (the
+    interactive view binds it to the arrow keys). state() gives the
+    (n_planets, 3) display positions, plus "particles" when there are test
+    particles.
+    """
+
+    def __init__(self, planets=PLANETS, scale_factors=RADIUS_SCALE_FACTORS,
+                 sim_speed=1, time_step=TIME_STEP, gravity=True, test_particles=0,
+                 masses=PLANET_MASSES, rng=None, ephemeris=None):
+        self.planets = planets
+        self.names = [p[0] for p in planets]
+        self.radius_au = np.array([p[2] for p in planets], dtype=np.float64)
+        self.scaled_radius = np.array([scale_factors[p[0]] for p in planets], dtype=np.float64)
+        self.period = np.array([p[3] for p in planets], dtype=np.float64)
+        self.incl_deg = np.array([p[4] for p in planets], dtype=np.float64)
+        self.incl_rad = np.radians(self.incl_deg)
+        self.tilt_rad = np.radians([p[5] for p in planets])
+        self.sim_speed = sim_speed
+        self.time_step = time_step
+        self.sim_time = 0.0
+        self.frame = 0
+        self.engine = None
+        # Optional Ephemeris of planet_states(), used by the kinematic model
+        # instead of evaluating the circles every frame
+        self.ephemeris = ephemeris
+        if gravity:
+            self.engine = NBody.from_planets(planets, masses, test_particles, rng=rng, dt=time_step)
+        self._state = self._make_state()
+
+    def display_radius(self, r):
+        # Map heliocentric distances (AU) onto the display scale, piecewise
+        # linear through the planets and proportional beyond the last one
+        r_max, s_max = self.radius_au[-1], self.scaled_radius[-1]
+        return np.where(r > r_max, r * s_max / r_max, np.interp(r, self.radius_au, self.scaled_radius))
+
+    def _to_display(self, helio):
+        r = np.linalg.norm(helio, axis=1)
+        scale = self.display_radius(r) / np.where(r > 0, r, 1.0)
+        return helio * scale[:, None]
+
+    def _make_state(self):
+        state = {"sim_time": np.float64(self.sim_time)}
+        if self.engine is None:
+            state["positions"] = self.positions_at(self.sim_time)
+            return state
+        n = len(self.planets)
+        helio = self.engine.positions - self.engine.positions[0]
+        positions = self._to_display(helio[:n])
+        # Small axial tilt effect on z-axis for visualization
+        positions[:, 2] += 0.1 * np.sin(self.tilt_rad)
+        state["positions"] = positions
+        if len(self.engine) > n:
+            state["particles"] = self._to_display(helio[n:])
+        return state
+
+    def planet_states(self, sim_time):
+        # Kinematic (..., n_planets, 3) display positions and velocities (per
+        # year) for an array of times; the gravity=False model
+        t = np.asarray(sim_time, dtype=np.float64)[..., None]
+        omega = np.where(self.period != 0, 2 * np.pi / np.where(self.period != 0, self.period, 1.0), 0.0)
+        c, s = np.cos(omega * t), np.sin(omega * t)
+
+        # 3D position with orbital inclination
+        r, ci, si = self.scaled_radius, np.cos(self.incl_rad), np.sin(self.incl_rad)
+        # Small axial tilt effect on z-axis for visualization
+        positions = np.stack([r * c, r * s * ci, r * s * si + 0.1 * np.sin(self.tilt_rad)], axis=-1)
+        velocities = np.stack([-r * omega * s, r * omega * c * ci, r * omega * c * si], axis=-1)
+        return positions, velocities
+
+    def tabulate(self, span, step=TIME_STEP):
+        # Ephemeris of the kinematic model over [0, span] years
+        return Ephemeris.tabulate(self.planet_states, 0.0, span, step, names=self.names)
+
+    def positions_at(self, sim_time):
+        # Kinematic display positions (the gravity=False model)
+        if self.ephemeris is not None:
+            return self.ephemeris.states(sim_time, velocities=False)
+        return self.planet_states(sim_time)[0]
+
+    def orbit_paths(self, samples=200):
+        # (n_planets, 3, samples) display orbit circles; these never change,
+        # so each comes from the geometry cache
+        return np.stack([orbit_polyline(r, 0.0, i, samples) for r, i in zip(self.scaled_radius, self.incl_deg)])
+
+    def step(self):
+        if self.engine is not None:
+            self.engine.advance(self.time_step * self.sim_speed)
+        self.sim_time += self.time_step * self.sim_speed
+        self.frame += 1
+        self._state = self._make_state()
+
+    def state(self):
+        return self._state
+
+    def snapshot(self):
+        # Mutable state for astrosim.checkpoint, the engine's included
+        snap = {"sim_time": self.sim_time, "sim_speed": self.sim_speed, "frame": self.frame}
+        if self.engine is not None:
+            snap.update({"engine." + key: value for key, value in self.engine.snapshot().items()})
+        return snap
+
+    def restore(self, snap):
+        self.sim_time = float(snap["sim_time"])
+        self.sim_speed = float(snap["sim_speed"])
+        self.frame = int(snap["frame"])
+        if self.engine is not None:
+            self.engine.restore({key[7:]: value for key, value in snap.items() if key.startswith("engine.")})
+        self._state = self._make_state()
+
+
+def create(seed=None, **params):
+    return SolarSystem(rng=np.random.default_rng(seed), **params)
@@ -0,0 +1,182 @@
+# Uniform-grid spatial index for batched radius searches.
+#
+# Points are binned into cubic cells and sorted by cell key, so all points in a
+# cell form one contiguous run. A radius query looks at the 27 cells around
+# each centre, which is exact as long as the cell size is at least the radius.
+#
+# The index is kept valid across steps Verlet-list style: it is built with a
+# cell size of radius + skin, callers report how far points may have moved, and
+# the grid is only rebuilt once that drift exceeds the skin. Candidates from
+# the stale grid are always checked against the current positions.
+#
+# close_pairs() is the self-join: every pair of points closer than a radius,
+# from one sort of the points by cell.
+
+import numpy as np
+
+# Offsets of the 27 cells surrounding (and including) a cell
+_NEIGHBOURS = np.stack(np.meshgrid([-1, 0, 1], [-1, 0, 1], [-1, 0, 1], indexing="ij"), -1).reshape(-1, 3)
+# The 13 of them that come after a cell in key order: joining every cell
+# with these and with itself visits each pair of neighbouring cells once
+_FORWARD = _NEIGHBOURS[[tuple(o) > (0, 0, 0) for o in _NEIGHBOURS.tolist()]]
+
+
+def brute_force_pairs(points, centers, radius, active=None, chunk=1 << 22):
+    # Reference O(N*M) search. Returns (center_idx, point_idx) with
+    # |points[point_idx] - centers[center_idx]| < radius.
+    points = np.asarray(points, dtype=np.float64)
+    centers = np.asarray(centers, dtype=np.float64)
+    idx = np.arange(len(points)) if active is None else np.flatnonzero(active)
+    out_c, out_p = [], []
+    step = max(1, chunk // max(1, len(centers)))
+    for lo in range(0, len(idx), step):
+        sub = idx[lo:lo + step]
+        d = points[sub, None, :] - centers[None, :, :]
+        p, c = np.nonzero(np.einsum("pcj,pcj->pc", d, d) < radius * radius)
+        out_c.append(c)
+        out_p.append(sub[p])
+    if not out_c:
+        return np.empty(0, np.intp), np.empty(0, np.intp)
+    return np.concatenate(out_c), np.concatenate(out_p)
+
+
+def _cross(start_a, count_a, start_b, count_b):
+    # Every (slot in run a, slot in run b) for paired runs of sorted slots
+    size = count_a * count_b
+    k = np.arange(size.sum()) - np.repeat(np.cumsum(size) - size, size)
+    cb = np.repeat(count_b, size)
+    return np.repeat(start_a, size) + k // cb, np.repeat(start_b, size) + k % cb
+
+
+def close_pairs(points, radius):
+    # Every unordered pair (i, j), i < j, of points closer than radius.
+    # Points are binned into cells of size radius and sorted by cell; each
+    # occupied cell is joined with itself and its 13 forward neighbours, so
+    # the cost follows the number of points and close pairs, not N^2.
+    points = np.asarray(points, dtype=np.float64)
+    if len(points) < 2:
+        return np.empty(0, np.intp), np.empty(0, np.intp)
+    cells = np.floor((points - points.min(axis=0)) / radius).astype(np.int64) + 1
+    ny, nz = cells[:, 1].max() + 2, cells[:, 2].max() + 2
+    keys = (cells[:, 0] * ny + cells[:, 1]) * nz + cells[:, 2]
+    order = np.argsort(keys)
+    keys = keys[order]
+    first = np.flatnonzero(np.r_[True, keys[1:] != keys[:-1]])
+    occupied = keys[first]
+    count = np.diff(np.r_[first, len(keys)])
+
+    # Pairs inside one cell
+    multi = count > 1
+    a, b = _cross(first[multi], count[multi], first[multi], count[multi])
+    keep = a < b
+    slots_a, slots_b = [a[keep]], [b[keep]]
+    # Pairs across neighbouring cells
+    for dx, dy, dz in _FORWARD:
+        target = occupied + (dx * ny + dy) * nz + dz
+        pos = np.minimum(np.searchsorted(occupied, target), len(occupied) - 1)
+        match = np.flatnonzero(occupied[pos] == target)
+        a, b = _cross(first[match], count[match], first[pos[match]], count[pos[match]])
+        slots_a.append(a)
+        slots_b.append(b)
+    i, j = order[np.concatenate(slots_a)], order[np.concatenate(slots_b)]
+    d = points[i] - points[j]
+    hit = np.einsum("ij,ij->i", d, d) < radius * radius
+    i, j = i[hit], j[hit]
+    return np.minimum(i, j), np.maximum(i, j)
+
+
+class GridIndex:
+    """Uniform grid over a point set supporting batched radius queries.
+
+    radius is the largest radius that will be queried; skin is how far points
+    may drift before the grid has to be rebuilt.
+    """
+
+    def __init__(self, radius, skin=0.0):
+        self.radius = float(radius)
+        self.skin = float(skin)
+        self.cell_size = self.radius + self.skin
+        self.drift = 0.0
+        self.builds = 0
+        self._active = None
+        self._sorted_keys = None
+
+    def build(self, points, active=None):
+        points = np.asarray(points, dtype=np.float64)
+        n = len(points)
+        self._active = np.ones(n, dtype=bool) if active is None else np.array(active, dtype=bool)
+        idx = np.flatnonzero(self._active)
+
+        # One empty cell of padding on each side keeps neighbour lookups in range
+        if len(idx):
+            lo = points[idx].min(axis=0)
+            hi = points[idx].max(axis=0)
+        else:
+            lo = hi = np.zeros(3)
+        self._origin = lo - self.cell_size
+        self._dims = (np.floor((hi - self._origin) / self.cell_size).astype(np.int64) + 2)
+
+        keys = self._cell_keys(self._cells(points[idx]))
+        order = np.argsort(keys, kind="stable")
+        self._order = idx[order]
+        self._sorted_keys = keys[order]
+        self.drift = 0.0
+        self.builds += 1
+        return self
+
+    @property
+    def stale(self):
+        return self._sorted_keys is None or self.drift > self.skin
+
+    def advance(self, max_displacement):
+        # Record that no point moved further than max_displacement since the
+        # last call; returns True if the grid now needs a rebuild
+        self.drift += max_displacement
+        return self.stale
+
+    def invalidate(self):
+        # Force a rebuild before the next query
+        self._sorted_keys = None
+
+    def discard(self, idx):
+        # Drop points from future query results without rebuilding
+        self._active[idx] = False
+
+    def _cells(self, points):
+        return np.floor((points - self._origin) / self.cell_size).astype(np.int64)
+
+    def _cell_keys(self, cells):
+        nx, ny, nz = self._dims
+        return (cells[..., 0] * ny + cells[..., 1]) * nz + cells[..., 2]
+
+    def candidates(self, centers):
+        # (center_idx, point_idx) for every active point in the 27 cells
+        # around each centre
+        centers = np.asarray(centers, dtype=np.float64).reshape(-1, 3)
+        cells = self._cells(centers)[:, None, :] + _NEIGHBOURS[None, :, :]
+        inside = np.all((cells >= 0) & (cells < self._dims), axis=-1)
+        owner = np.nonzero(inside)[0]
+        keys = self._cell_keys(cells[inside])
+
+        start = np.searchsorted(self._sorted_keys, keys, side="left")
+        count = np.searchsorted(self._sorted_keys, keys, side="right") - start
+        total = count.sum()
+        # Expand the (start, count) runs into one flat array of sorted slots
+        run_offset = np.repeat(start - np.cumsum(count) + count, count)
+        slots = run_offset + np.arange(total)
+        center_idx = np.repeat(owner, count)
+        point_idx = self._order[slots]
+        keep = self._active[point_idx]
+        return center_idx[keep], point_idx[keep]
+
+    def query_pairs(self, points, centers, radius=None):
+        # Exact radius search of the current positions of the indexed points.
+        # Returns (center_idx, point_idx) pairs.
+        radius = self.radius if radius is None else radius
+        if radius + self.drift > self.cell_size:
+            raise ValueError("query radius plus drift exceeds the grid cell size; rebuild the index")
+        centers = np.asarray(centers, dtype=np.float64).reshape(-1, 3)
+        center_idx, point_idx = self.candidates(centers)
+        d = np.asarray(points)[point_idx] - centers[center_idx]
+        hit = np.einsum("ij,ij->i", d, d) < radius * radius
+        return center_idx[hit], point_idx[hit]
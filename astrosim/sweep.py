@@ -0,0 +1,193 @@
+# Parameter sweeps over any registered simulation, with a result cache.
+#
+# A design is a list of parameter dicts, built as a full grid, uniform
+# random samples or a Latin hypercube. Each run builds the sim from its
+# params, steps it headlessly and keeps a result: the final state, or
+# whatever a metrics function extracts from the states the run goes
+# through. Runs are spread over a process pool. Every result is stored in
+# a content-addressed cache, under a hash of the sim name, params, step
+# count, metrics function and the source of the compute cores. A sweep that
+# repeats or overlaps an earlier one therefore only runs the missing
+# points, and any code change starts a fresh set of keys. Points of a
+# random simulation without a seed are run every time, never cached.
+
+import hashlib
+import itertools
+import json
+import os
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+
+import numpy as np
+
+from astrosim import registry
+from astrosim.runner import run
+from astrosim.seeding import seed_key, spawn
+
+CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "astrosim", "sweeps")
+
+
+def grid(**axes):
+    # Every combination of the given values, e.g. grid(thrust=[1000, 1500], cd=[0.5, 0.75])
+    names = list(axes)
+    return [dict(zip(names, values)) for values in itertools.product(*axes.values())]
+
+
+def random_design(n, rng=None, **ranges):
+    # n points drawn uniformly from (low, high) ranges
+    rng = np.random.default_rng() if rng is None else rng
+    columns = {name: rng.uniform(lo, hi, n) for name, (lo, hi) in ranges.items()}
+    return [{name: float(col[i]) for name, col in columns.items()} for i in range(n)]
+
+
+def latin_hypercube(n, rng=None, **ranges):
+    # n points from (low, high) ranges, one per equal-width stratum of every
+    # range, with the strata paired up at random
+    rng = np.random.default_rng() if rng is None else rng
+    columns = {}
+    for name, (lo, hi) in ranges.items():
+        u = (rng.permutation(n) + rng.uniform(0, 1, n)) / n
+        columns[name] = lo + u * (hi - lo)
+    return [{name: float(col[i]) for name, col in columns.items()} for i in range(n)]
+
+
+@lru_cache(maxsize=None)
+def code_version():
+    # Hash of every compute-core source file; views cannot change results
+    root = os.path.dirname(os.path.abspath(__file__))
+    digest = hashlib.sha256()
+    for name in sorted(os.listdir(root)):
+        if name.endswith(".py"):
+            with open(os.path.join(root, name), "rb") as f:
+                digest.update(name.encode() + b"\0" + f.read())
+    return digest.hexdigest()[:16]
+
+
+def replicate(design, replicates, seed=None):
+    # Every point `replicates` times, each copy with its own "seed" param:
+    # a child of the master seed, so the sweep reproduces exactly and
+    # every run's cache key names its random stream
+    children = iter(spawn(seed, len(design) * replicates))
+    return [{**params, "seed": next(children)} for params in design for _ in range(replicates)]
+
+
+def _jsonable(value):
+    if isinstance(value, np.random.SeedSequence):
+        return seed_key(value)
+    if isinstance(value, np.ndarray):
+        return value.tolist()
+    if isinstance(value, np.generic):
+        return value.item()
+    if isinstance(value, (list, tuple)):
+        return [_jsonable(v) for v in value]
+    return value
+
+
+def run_key(name, params, steps, metrics=None):
+    # Content address of one run
+    spec = {
+        "sim": name,
+        "params": {k: _jsonable(v) for k, v in sorted(params.items())},
+        "steps": steps,
+        "metrics": None if metrics is None else f"{metrics.__module__}.{metrics.__qualname__}",
+        "code": code_version(),
+    }
+    return hashlib.sha256(json.dumps(spec, sort_keys=True).encode()).hexdigest()
+
+
+class ResultCache:
+    """Results on disk as <root>/<key[:2]>/<key>.npz, one per run."""
+
+    def __init__(self, root=CACHE_DIR):
+        self.root = root
+
+    def path(self, key):
+        return os.path.join(self.root, key[:2], key + ".npz")
+
+    def get(self, key):
+        try:
+            with np.load(self.path(key)) as data:
+                return {name: data[name] for name in data.files}
+        except FileNotFoundError:
+            return None
+
+    def put(self, key, result):
+        # Write to a temporary file and rename, so that concurrent sweeps
+        # never see half a result
+        path = self.path(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+        with os.fdopen(fd, "wb") as f:
+            np.savez(f, **result)
+        os.replace(tmp, path)
+
+
+def final_state(sim, states):
+    # Default metrics: a copy of the state the run ends in
+    for _ in states:
+        pass
+    return {key: np.array(value) for key, value in sim.state().items()}
+
+
+def _run_one(args):
+    name, params, steps, metrics = args
+    sim = registry.create(name, **params)
+    return (metrics or final_state)(sim, run(sim, steps))
+
+
+def sweep(name, design, steps=1000, metrics=None, workers=None, cache=None):
+    """Run simulation `name` once per params dict in `design`.
+
+    metrics(sim, states) -> dict of arrays reduces one run to its result.
+    It gets the sim and the iterator that steps it (see runner.run); by
+    default the result is the final state.
+    metrics must be a module-level function so it can be sent to the
+    worker processes. cache is a ResultCache (or None for no caching).
+    Returns the results, in design order, and a stats dict with the run,
+    hit and timing counts.
+    """
+    start = time.perf_counter()
+    # A random sim given no seed draws a fresh state every run, so such a
+    # point has no key: it is never cached or merged with its duplicates
+    random = registry.takes_seed(name)
+    keys = [None if random and params.get("seed") is None else run_key(name, params, steps, metrics)
+            for params in design]
+    results = [cache.get(key) if cache is not None and key is not None else None for key in keys]
+    todo = [i for i, result in enumerate(results) if result is None]
+    # Identical points in one design only run once
+    first, runs = {}, []
+    for i in todo:
+        if keys[i] is not None:
+            if keys[i] in first:
+                continue
+            first[keys[i]] = i
+        runs.append(i)
+    jobs = [(name, design[i], steps, metrics) for i in runs]
+
+    workers = workers or os.cpu_count() or 1
+    if workers == 1 or len(jobs) <= 1:
+        fresh = [_run_one(job) for job in jobs]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            fresh = list(pool.map(_run_one, jobs))
+    by_index = dict(zip(runs, fresh))
+    if cache is not None:
+        for i in runs:
+            if keys[i] is not None:
+                cache.put(keys[i], by_index[i])
+    for i in todo:
+        results[i] = by_index[i if keys[i] is None else first[keys[i]]]
+
+    seconds = time.perf_counter() - start
+    stats = {
+        "points": len(design),
+        "runs": len(jobs),
+        "hits": len(design) - len(todo),
+        "hit_rate": (len(design) - len(todo)) / len(design) if design else 0.0,
+        "seconds": seconds,
+        "runs_per_s": len(jobs) / seconds if jobs else 0.0,
+        "points_per_s": len(design) / seconds if design else 0.0,
+    }
+    return results, stats
@@ -0,0 +1,42 @@
+# Fixed-capacity trail of recent positions.
+#
+# Every point is written twice, at i and i + capacity, into a buffer twice
+# the capacity. The last `capacity` points are then always one contiguous
+# slice, oldest first. view() is therefore a zero-copy array, and appending
+# is O(1) however long the run.
+
+import numpy as np
+
+
+class Trail:
+    """The last `capacity` positions of n_bodies bodies.
+
+    append() takes an (n_bodies, 3) array; view() returns a read-only
+    (size, n_bodies, 3) view, oldest first, into the trail's own buffer. The
+    view is only valid until the next append.
+    """
+
+    def __init__(self, capacity, n_bodies, dim=3):
+        self.capacity = capacity
+        self._buf = np.zeros((2 * capacity, n_bodies, dim))
+        self._next = 0  # slot the next point goes to
+        self.size = 0
+
+    def __len__(self):
+        return self.size
+
+    def append(self, points):
+        i = self._next
+        self._buf[i] = points
+        self._buf[i + self.capacity] = points
+        self._next = (i + 1) % self.capacity
+        self.size = min(self.size + 1, self.capacity)
+
+    def view(self):
+        start = (self._next - self.size) % self.capacity
+        out = self._buf[start:start + self.size]
+        out.flags.writeable = False
+        return out
+
+    def clear(self):
+        self._next = self.size = 0
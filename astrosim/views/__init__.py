@@ -0,0 +1,131 @@
+# Matplotlib front ends for the compute cores.
+#
+# This is the only part of astrosim that imports matplotlib. A view owns the
+# figure and artists; update(frame) steps its simulation and then redraws
+# from the new state, so physics and drawing stay separate. Set
+# view.recorder to an astrosim.recorder.Recorder to keep the states an
+# animation goes through. view.instrument() attaches an
+# astrosim.profiling.Profiler that times the physics, artist updates and
+# drawing of every frame; animate() does so by itself when profiling is
+# switched on through the environment. Set view.checkpoints to an
+# astrosim.checkpoint.Checkpoints over the simulation to make the animation
+# scrubbable: seek(frame) jumps anywhere, and in a running animation "["
+# and "]" step back and forward one keyframe interval and "0" restarts.
+# run_async() moves the physics onto a worker thread (see
+# astrosim.producer), so the callback only draws frames computed ahead.
+
+import os
+
+
+class View:
+    interval = 30  # ms between animation frames
+    blit = True
+
+    def __init__(self, sim):
+        self.sim = sim
+        self.ani = None
+        self.recorder = None
+        self.profiler = None
+        self.checkpoints = None
+        self.producer = None
+
+    def run_async(self, depth=None, interpolate=True, between_frames=None):
+        # Compute frames on a worker thread from now on; returns the
+        # astrosim.producer.FrameProducer. On a single CPU the worker only
+        # runs between frames unless between_frames says otherwise.
+        from astrosim.producer import DEPTH, FrameProducer
+        if between_frames is None:
+            between_frames = (os.cpu_count() or 1) == 1
+        self.producer = FrameProducer(self.sim, None, depth or DEPTH, interpolate, self.checkpoints, between_frames)
+        self.fig.canvas.mpl_connect("close_event", lambda event: self.producer.stop())
+        self._report_draws()
+        return self.producer.start()
+
+    def _report_draws(self):
+        # Tell the producer when each animation frame has been drawn
+        if self.ani is None or "_draw_next_frame" in vars(self.ani):
+            return
+        draw_next_frame = self.ani._draw_next_frame
+
+        def drawn(*args):
+            draw_next_frame(*args)
+            if self.producer is not None:
+                self.producer.drawn()
+        self.ani._draw_next_frame = drawn
+
+    def next_state(self):
+        # The state to draw next: a step of the simulation, or the
+        # producer's frame for this moment
+        if self.producer is not None:
+            return self.producer.get()
+        (self.checkpoints or self.sim).step()
+        return self.sim.state()
+
+    def update(self, frame):
+        if self.profiler is not None:
+            return self._profiled_update()
+        state = self.next_state()
+        if self.recorder is not None:
+            self.recorder.record(state)
+        return self.draw(state)
+
+    def _profiled_update(self):
+        profiler = self.profiler
+        profiler.start_frame()
+        with profiler.phase("physics"):
+            state = self.next_state()
+        if self.recorder is not None:
+            self.recorder.record(state)
+        with profiler.phase("artists"):
+            return self.draw(state)
+
+    def instrument(self, profiler):
+        # Time every frame with `profiler`. Full figure draws and the
+        # animation's blits count as the "draw" phase.
+        self.profiler = profiler
+        if "draw" not in vars(self.fig):
+            self.fig.draw = profiler.timed("draw", self.fig.draw)
+        if self.ani is not None and "_post_draw" not in vars(self.ani):
+            self.ani._post_draw = profiler.timed("draw", self.ani._post_draw)
+        return profiler
+
+    def draw(self, state):
+        # Push a state into the artists; return the artists that changed
+        raise NotImplementedError
+
+    def reset(self):
+        # Forget view state built up over past frames (trails) after a seek
+        pass
+
+    def seek(self, frame):
+        # Move the simulation to `frame` through self.checkpoints and draw it;
+        # a producer restarts from there
+        if self.producer is not None:
+            self.producer.stop()
+        state = self.checkpoints.seek(frame)
+        self.reset()
+        artists = self.draw(state)
+        if self.producer is not None:
+            self.producer.start()
+        return artists
+
+    def _on_seek_key(self, event):
+        frame = {"[": self.sim.frame - self.checkpoints.every, "]": self.sim.frame + self.checkpoints.every,
+                 "0": 0}.get(event.key)
+        if frame is not None:
+            self.seek(frame)
+            self.fig.canvas.draw_idle()
+
+    def animate(self, frames):
+        from matplotlib.animation import FuncAnimation
+
+        from astrosim import profiling
+        self.ani = FuncAnimation(self.fig, self.update, frames=frames, interval=self.interval, blit=self.blit)
+        if self.checkpoints is not None:
+            self.fig.canvas.mpl_connect("key_press_event", self._on_seek_key)
+        if self.producer is not None:
+            self._report_draws()
+        profiler = self.profiler or profiling.from_env()
+        if profiler is not None:
+            self.instrument(profiler)
+        return self.ani
@@ -0,0 +1,48 @@
+# 3D animation of a satellite constellation: one scatter per shell, however
+# many satellites it holds, over the shell's orbit planes.
+
+import matplotlib.patches as mpatches
+import matplotlib.pyplot as plt
+
+from astrosim.geometry import sphere_mesh
+from astrosim.orbits import EARTH_RADIUS
+from astrosim.views import View
+from astrosim.views.layers import LOD_LIMIT, OrbitLayer, PointLayer
+
+MAX_RADIUS = 9000
+
+
+class ConstellationView(View):
+    interval = 30
+
+    def __init__(self, sim, max_points=LOD_LIMIT, show_planes=True):
+        super().__init__(sim)
+        self.fig = fig = plt.figure(figsize=(10, 8))
+        self.ax = ax = fig.add_subplot(111, projection='3d')
+        fig.patch.set_facecolor('black')
+        ax.set_facecolor('black')
+
+        x_earth, y_earth, z_earth = sphere_mesh(EARTH_RADIUS, 60, 30)
+        ax.plot_surface(x_earth, y_earth, z_earth, color='blue', alpha=0.6)
+
+        positions = sim.state()["positions"]
+        self.layers = []
+        for k, (shell, rows) in enumerate(zip(sim.shells, sim.slices)):
+            if show_planes and "planes" in shell:
+                OrbitLayer(ax, sim.plane_paths(k), color=shell["color"], linewidth=0.3, alpha=0.25)
+            self.layers.append(PointLayer(ax, positions[rows], max_points=max_points, color=shell["color"], s=2))
+
+        ax.set_xlim([-MAX_RADIUS, MAX_RADIUS])
+        ax.set_ylim([-MAX_RADIUS, MAX_RADIUS])
+        ax.set_zlim([-MAX_RADIUS, MAX_RADIUS])
+        ax.set_title(f"{len(sim)} Satellites", color='white')
+        ax.tick_params(colors='white')
+
+        handles = [mpatches.Patch(color=s["color"], label=s["name"]) for s in sim.shells]
+        legend = ax.legend(handles=handles, loc='upper left', facecolor='black', edgecolor='white')
+        for text in legend.get_texts():
+            text.set_color('white')
+
+    def draw(self, state):
+        positions = state["positions"]
+        return [layer.set_points(positions[rows]) for layer, rows in zip(self.layers, self.sim.slices)]
@@ -0,0 +1,74 @@
+# 3D animation of the debris cleanup: one scatter artist per orbit band plus
+# the collector satellites.
+
+import matplotlib.patches as mpatches
+import matplotlib.pyplot as plt
+
+from astrosim.debris import BANDS, BAND_R, BAND_r, LEO, MEO, GEO
+from astrosim.geometry import sphere_mesh, torus_mesh
+from astrosim.views import View
+from astrosim.views.layers import PointLayer
+
+RADIUS_EARTH = 1
+DEBRIS_COLORS = ['red', 'orange', 'deepskyblue']
+SATELLITE_COLORS = ['cyan', 'lime', 'magenta']
+
+
+def plot_torus(ax, R, r, color, alpha):
+    X, Y, Z = torus_mesh(R, r, 60, 30)
+    ax.plot_surface(X, Y, Z, color=color, alpha=alpha, edgecolor='none')
+
+
+# Draw filled transparent spheres for LEO, MEO, GEO boundaries
+def plot_orbit_boundary(ax, radius, color, alpha):
+    xs, ys, zs = sphere_mesh(radius, 40, 20)
+    ax.plot_surface(xs, ys, zs, color=color, alpha=alpha, edgecolor='none')
+
+
+class DebrisView(View):
+    interval = 30
+
+    def __init__(self, sim):
+        super().__init__(sim)
+        self.fig = fig = plt.figure()
+        self.ax = ax = fig.add_subplot(111, projection='3d')
+        ax.set_facecolor('black')
+        fig.patch.set_facecolor('black')
+        ax.set_xlim([-10, 10])
+        ax.set_ylim([-10, 10])
+        ax.set_zlim([-10, 10])
+        ax.set_title("Space Debris Cleanup in Different Orbits", color='white', fontsize=14, pad=20)
+        ax.tick_params(colors='white')
+
+        x, y, z = sphere_mesh(RADIUS_EARTH, 40, 20)
+        ax.plot_surface(x, y, z, color='blue', alpha=0.6)
+
+        plot_orbit_boundary(ax, BAND_R[LEO] + BAND_r[LEO], 'red', 0.08)
+        plot_orbit_boundary(ax, BAND_R[MEO] + BAND_r[MEO], 'orange', 0.08)
+        plot_orbit_boundary(ax, BAND_R[GEO] + BAND_r[GEO], 'deepskyblue', 0.08)  # Changed color for GEO
+
+        # One scatter artist per band, however many fragments it holds;
+        # huge fields are drawn decimated
+        self.debris_layers = [PointLayer(ax, sim.band_positions(band), color=color, s=25)
+                              for band, color in enumerate(DEBRIS_COLORS)]
+        self._bands = [sim.band == band for band in range(len(DEBRIS_COLORS))]
+
+        # Collector satellites, colored by band
+        sat_colors = [SATELLITE_COLORS[b] for b in sim.sat_band]
+        pos = sim.sat_pos
+        self.satellites = ax.scatter(pos[:, 0], pos[:, 1], pos[:, 2], c=sat_colors, s=100, depthshade=False)
+
+        legend_patches = [mpatches.Patch(color='blue', label='Earth')]
+        legend_patches += [mpatches.Patch(color=c, label=f'{b} Debris') for b, c in zip(BANDS, DEBRIS_COLORS)]
+        legend_patches += [mpatches.Patch(color=c, label=f'{b} Satellite') for b, c in zip(BANDS, SATELLITE_COLORS)]
+        ax.legend(handles=legend_patches, loc='upper left', fontsize=8, facecolor='white', edgecolor='white')
+
+    def draw(self, state):
+        # From the state alone, which may be a frame computed ahead
+        positions, live = state["positions"], ~state["captured"]
+        scatters = [layer.set_points(positions[in_band & live])
+                    for in_band, layer in zip(self._bands, self.debris_layers)]
+
+        pos = state["sat_pos"]
+        self.satellites._offsets3d = (pos[:, 0], pos[:, 1], pos[:, 2])
+        return scatters + [self.satellites]
@@ -0,0 +1,62 @@
+# 3D animation of the Earth-Mars Hohmann transfer.
+
+import matplotlib.pyplot as plt
+import numpy as np
+from mpl_toolkits.mplot3d import Axes3D
+
+from astrosim.geometry import orbit_polyline
+from astrosim.views import View
+
+
+class HohmannView(View):
+    interval = 50
+
+    def __init__(self, sim):
+        super().__init__(sim)
+        # Set up 3D plot
+        self.fig = fig = plt.figure(figsize=(8, 8))
+        self.ax = ax = fig.add_subplot(111, projection='3d')
+        fig.patch.set_facecolor('black')
+        ax.set_facecolor('black')
+        ax.set_xlim(-2, 2)
+        ax.set_ylim(-2, 2)
+        ax.set_zlim(-2, 2)
+        ax.set_title("Earth-Mars Hohmann Transfer", color='white')
+        ax.set_box_aspect([1, 1, 1])
+
+        # Plot elements
+        # Set colors for better visibility on black
+        ax.plot([0], [0], [0], 'yo', markersize=18, label='Sun')  # Bigger sun
+        self.earth, = ax.plot([], [], [], 'bo', markersize=10, label='Earth')  # Bigger earth
+        self.mars, = ax.plot([], [], [], 'ro', markersize=7, label='Mars')  # Mars a bit smaller than earth
+
+        # Transfer orbit plot (half ellipse in 3D, z=0)
+        ax.plot(*sim.transfer_orbit(), linestyle='--', color='#90ff90', label='Hohmann Transfer')
+
+        # Spacecraft marker (lighter green)
+        self.spacecraft, = ax.plot([], [], [], marker='o', color='#90ff90', markersize=5, label='Spacecraft')
+
+        # Draw orbits in 3D (z=0)
+        ax.plot(*orbit_polyline(sim.r1, 0.0, 0.0, 300), color='blue', linestyle='--', label='_nolegend_')
+        ax.plot(*orbit_polyline(sim.r2, 0.0, 0.0, 300), color='red', linestyle='--', label='_nolegend_')
+        # Place legend outside the plot with a title
+        leg = ax.legend(loc='center left', bbox_to_anchor=(1.02, 0.5), facecolor='black', edgecolor='white', labelcolor='white', title='Legend', borderpad=1.5, handletextpad=1.5, labelspacing=1.2)
+        # Set legend title color to white for visibility
+        leg.get_title().set_color('white')
+        leg.get_title().set_fontsize(13)
+        ax.tick_params(colors='white')
+
+    def draw(self, state):
+        for artist, (x, y, z) in ((self.earth, state["earth"]), (self.mars, state["mars"])):
+            artist.set_data([x], [y])
+            artist.set_3d_properties([z])
+
+        x, y, z = state["spacecraft"]
+        if np.isnan(x):
+            self.spacecraft.set_data([], [])
+            self.spacecraft.set_3d_properties([])
+        else:
+            self.spacecraft.set_data([x], [y])
+            self.spacecraft.set_3d_properties([z])
+
+        return self.earth, self.mars, self.spacecraft
@@ -0,0 +1,91 @@
+# Collection artists for drawing many bodies at once.
+#
+# Draw cost in matplotlib grows with the number of artists far more than with
+# the number of points in one artist. A whole shell of satellites is
+# therefore one scatter whose offsets are replaced from a NumPy array every
+# frame, and a set of orbit outlines is one Line3DCollection. Past a point
+# budget, layers draw an evenly strided subset (level of detail). Trails of
+# all bodies are a single Line3DCollection too, which lets every segment
+# carry its own alpha.
+
+import numpy as np
+from matplotlib.colors import to_rgba_array
+from mpl_toolkits.mplot3d.art3d import Line3DCollection
+
+LOD_LIMIT = 5000  # most points a layer draws per frame
+LOD_LINES = 200  # most outlines an OrbitLayer draws
+
+
+def lod_stride(n, limit):
+    # Stride that keeps at most `limit` of n items; 1 means draw everything
+    if not limit or n <= limit:
+        return 1
+    return -(-n // limit)
+
+
+class PointLayer:
+    """One 3D scatter for all points of a shell.
+
+    set_points() takes an (n, 3) array and returns the artist, for draw()
+    to pass on. colors, if given, are per-point and assume the point count
+    stays fixed.
+    """
+
+    def __init__(self, ax, points, max_points=LOD_LIMIT, colors=None, **style):
+        self.max_points = max_points
+        self.colors = colors
+        self.stride = lod_stride(len(points), max_points)
+        pts = points[::self.stride]
+        if colors is not None:
+            style["c"] = colors[::self.stride]
+        style.setdefault("depthshade", False)
+        self.artist = ax.scatter(pts[:, 0], pts[:, 1], pts[:, 2], **style)
+
+    def set_points(self, points):
+        stride = lod_stride(len(points), self.max_points)
+        if stride != self.stride and self.colors is not None:
+            self.artist.set_color(self.colors[::stride])
+        self.stride = stride
+        pts = points[::stride]
+        self.artist._offsets3d = (pts[:, 0], pts[:, 1], pts[:, 2])
+        return self.artist
+
+
+class OrbitLayer:
+    """Static orbit outlines, (n, 3, samples), as one Line3DCollection."""
+
+    def __init__(self, ax, paths, max_lines=LOD_LINES, **style):
+        self.stride = lod_stride(len(paths), max_lines)
+        segments = paths[::self.stride].transpose(0, 2, 1)  # (lines, samples, 3)
+        self.artist = Line3DCollection(segments, **style)
+        ax.add_collection3d(self.artist)
+
+
+class TrailLayer:
+    """Trails of several bodies as one Line3DCollection, fading with age.
+
+    set_trail() takes the (size, n_bodies, 3) view of an astrosim.trail.Trail
+    and returns the artist. colors has one entry per body; segment alpha
+    rises linearly from 0 at the oldest point to max_alpha at the newest.
+    """
+
+    def __init__(self, ax, colors, capacity, max_alpha=1.0, **style):
+        self.rgba = to_rgba_array(colors)  # (n_bodies, 4)
+        self.fade = np.linspace(0.0, max_alpha, capacity)[1:]  # per segment, newest last
+        self.artist = Line3DCollection([], **style)
+        # Starts empty, so it must not take part in autoscaling
+        ax.add_collection(self.artist, autolim=False)
+
+    def set_trail(self, points):
+        n_seg = len(points) - 1
+        if n_seg < 1:
+            self.artist.set_segments([])
+            return self.artist
+        # (n_bodies, n_seg, 2, 3) segment endpoints, body by body
+        path = points.transpose(1, 0, 2)
+        segments = np.stack([path[:, :-1], path[:, 1:]], axis=2)
+        colors = np.repeat(self.rgba, n_seg, axis=0)
+        colors[:, 3] = np.tile(self.fade[-n_seg:], len(self.rgba)) * colors[:, 3]
+        self.artist.set_segments(segments.reshape(-1, 2, 3))
+        self.artist.set_color(colors)
+        return self.artist
@@ -0,0 +1,73 @@
+# 3D animation of satellites on LEO, MEO and GEO orbits around Earth.
+
+import matplotlib.pyplot as plt
+import numpy as np
+
+from astrosim.geometry import sphere_mesh
+from astrosim.orbits import EARTH_RADIUS
+from astrosim.trail import Trail
+from astrosim.views import View
+from astrosim.views.layers import PointLayer, TrailLayer
+
+NUM_STARS = 300
+STAR_SEED = 0  # fixed sky, so every run and render chunk shows the same stars
+MAX_RADIUS = 45000
+TRAIL_LENGTH = 50  # how long the tail is
+TRAIL_ALPHA = 0.8  # opacity of the newest trail segment
+
+
+class OrbitView(View):
+    interval = 10
+
+    def __init__(self, sim, star_seed=STAR_SEED):
+        super().__init__(sim)
+        self.fig = fig = plt.figure(figsize=(10, 8))
+        self.ax = ax = fig.add_subplot(111, projection='3d')
+        fig.patch.set_facecolor('black')
+        ax.set_facecolor('black')
+
+        # Stars
+        star_x, star_y, star_z = np.random.default_rng(star_seed).uniform(-45000, 45000, (3, NUM_STARS))
+        ax.scatter(star_x, star_y, star_z, color='white', s=1)
+
+        # Earth
+        x_earth, y_earth, z_earth = sphere_mesh(EARTH_RADIUS, 100, 100)
+        ax.plot_surface(x_earth, y_earth, z_earth, color='blue', alpha=0.6)
+
+        for orbit, (x, y, z) in zip(sim.orbits, sim.paths):
+            ax.plot3D(x, y, z, color=orbit["color"], label=orbit["name"])
+
+        ax.set_xlim([-MAX_RADIUS, MAX_RADIUS])
+        ax.set_ylim([-MAX_RADIUS, MAX_RADIUS])
+        ax.set_zlim([-MAX_RADIUS, MAX_RADIUS])
+
+        ax.set_xlabel("X (km)")
+        ax.set_ylabel("Y (km)")
+        ax.set_zlabel("Z (km)")
+        ax.set_title("3D Orbits of Satellites")
+        ax.xaxis.label.set_color('white')
+        ax.yaxis.label.set_color('white')
+        ax.zaxis.label.set_color('white')
+        ax.title.set_color('white')
+        ax.tick_params(colors='white')
+        legend = ax.legend()
+        legend.get_frame().set_facecolor('black')
+        legend.get_frame().set_edgecolor('white')
+        for text in legend.get_texts():
+            text.set_color('white')
+
+        # All satellites in one scatter, colored by orbit
+        colors = [orbit["color"] for orbit in sim.orbits]
+        self.satellites = PointLayer(ax, sim.state()["positions"], colors=colors, s=36)
+
+        # Trails fade out towards their tail; all of them are one collection
+        self.positions_history = Trail(TRAIL_LENGTH, len(sim.orbits))
+        self.trails = TrailLayer(ax, colors, TRAIL_LENGTH, max_alpha=TRAIL_ALPHA, linewidth=1)
+
+    def reset(self):
+        self.positions_history.clear()
+
+    def draw(self, state):
+        satellites = self.satellites.set_points(state["positions"])
+        self.positions_history.append(state["positions"])
+        return [satellites, self.trails.set_trail(self.positions_history.view())]
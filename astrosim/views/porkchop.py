@@ -0,0 +1,35 @@
+# Porkchop plot of a launch-window sweep: departure C3 contours over
+# departure and arrival dates, with lines of constant time of flight.
+
+import matplotlib.pyplot as plt
+import numpy as np
+
+from astrosim.ephemeris import J2000
+from astrosim.porkchop import best
+
+C3_LEVELS = (8, 9, 10, 12, 14, 16, 20, 25, 30, 40, 50)  # km^2 / s^2
+TOF_LEVELS = (100, 150, 200, 250, 300, 350, 400, 450, 500)  # days
+
+
+def dates(days):
+    return J2000 + np.round(np.asarray(days) * 1440).astype("timedelta64[m]")
+
+
+def plot_porkchop(grid, c3_levels=C3_LEVELS, tof_levels=TOF_LEVELS, ax=None):
+    if ax is None:
+        _, ax = plt.subplots(figsize=(10, 8))
+    dep, arr = dates(grid["departure"]), dates(grid["arrival"])
+    X, Y = np.meshgrid(dep, arr, indexing="ij")
+    c3 = ax.contour(X, Y, grid["c3"], levels=c3_levels, cmap="viridis")
+    ax.clabel(c3, fmt="%g", fontsize=8)
+    tof = ax.contour(X, Y, grid["tof"], levels=tof_levels, colors="grey", linestyles="--", linewidths=0.6)
+    ax.clabel(tof, fmt="%g d", fontsize=7)
+
+    d, a, value = best(grid, "c3")
+    ax.plot(dates(d), dates(a), "r*", markersize=12, label=f"min C3 = {value:.2f} km²/s²")
+    ax.set_xlabel("Departure date")
+    ax.set_ylabel("Arrival date")
+    ax.set_title("Earth-Mars launch window: departure C3 (km²/s²) and time of flight")
+    ax.legend(loc="upper left")
+    ax.figure.autofmt_xdate()
+    return ax
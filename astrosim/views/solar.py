@@ -0,0 +1,110 @@
+# 3D animation of the solar system with click-to-select planets and keyboard
+# speed control (up/down arrows, space to pause).
+
+import matplotlib.patches as mpatches
+import matplotlib.pyplot as plt
+
+from astrosim.trail import Trail
+from astrosim.views import View
+from astrosim.views.layers import TrailLayer
+
+TRAIL_LENGTH = 200
+
+
+class SolarSystemView(View):
+    interval = 20
+
+    def __init__(self, sim):
+        super().__init__(sim)
+        planets = sim.planets
+
+        # Setup figure and 3D axis
+        self.fig = fig = plt.figure(figsize=(10, 8))
+        self.ax = ax = fig.add_subplot(111, projection='3d')
+        ax.set_facecolor("black")
+        fig.patch.set_facecolor('black')
+
+        ax.set_xlim([-50, 50])
+        ax.set_ylim([-50, 50])
+        ax.set_zlim([-10, 10])
+
+        ax.set_title("3D Solar System Simulator", color='white')
+
+        # Style the panes and ticks to be visible and white
+        ax.xaxis.pane.set_edgecolor('white')
+        ax.yaxis.pane.set_edgecolor('white')
+        ax.zaxis.pane.set_edgecolor('white')
+        ax.tick_params(colors='white')
+
+        legend_handles = [mpatches.Patch(color=p[1], label=p[0]) for p in planets]
+        leg = ax.legend(handles=legend_handles, loc='upper left', bbox_to_anchor=(1.05, 1), facecolor='black', edgecolor='white')
+
+        # Set legend text color to white
+        for text in leg.get_texts():
+            text.set_color('white')
+
+        # Prepare plot elements for planets, trails, orbit lines
+        self.planet_objs = []
+        # Last TRAIL_LENGTH positions of every planet, in constant memory,
+        # drawn as one fading collection
+        self.trail_history = Trail(TRAIL_LENGTH, len(planets))
+        self.trails = TrailLayer(ax, [p[1] for p in planets], TRAIL_LENGTH, lw=1)
+        self.orbit_lines = []
+
+        # Orbit lines are static: drawn once here and never returned by draw()
+        orbits = sim.orbit_paths()
+        for (name, color, radius, period, incl, tilt), (ox, oy, oz) in zip(planets, orbits):
+            orbit_line, = ax.plot(ox, oy, oz, color=color, lw=0.5, alpha=0.4)
+            self.orbit_lines.append(orbit_line)
+            marker_size = 10 if name == "Sun" else 6
+            planet_obj, = ax.plot([], [], [], 'o', color=color, markersize=marker_size, picker=5)
+            self.planet_objs.append(planet_obj)
+
+        # Test particles (asteroids), if the engine has any
+        self.particles = None
+        if "particles" in sim.state():
+            self.particles = ax.scatter([], [], [], color='gray', s=1, alpha=0.6)
+
+        # Text display for clicked planet
+        self.picked_text = ax.text2D(0.05, 0.95, "", transform=ax.transAxes, color='white')
+
+        fig.canvas.mpl_connect('pick_event', self.on_pick)
+        fig.canvas.mpl_connect('key_press_event', self.on_key)
+
+    def on_pick(self, event):
+        for i, artist in enumerate(self.planet_objs):
+            if event.artist == artist:
+                self.picked_text.set_text(f"Selected: {self.sim.names[i]}")
+                break
+
+    # Keyboard controls for speed and pause/play
+    def on_key(self, event):
+        if event.key == 'up':
+            self.sim.sim_speed *= 1.2
+        elif event.key == 'down':
+            self.sim.sim_speed /= 1.2
+        elif event.key == ' ' and self.ani is not None:
+            if self.ani.event_source.running:
+                self.ani.event_source.stop()
+            else:
+                self.ani.event_source.start()
+
+    def reset(self):
+        self.trail_history.clear()
+
+    def draw(self, state):
+        for i, (x, y, z) in enumerate(state["positions"]):
+            # Update planet position
+            self.planet_objs[i].set_data([x], [y])
+            self.planet_objs[i].set_3d_properties([z])
+
+        # Update trails (last TRAIL_LENGTH positions)
+        self.trail_history.append(state["positions"])
+        trails = self.trails.set_trail(self.trail_history.view())
+
+        artists = self.planet_objs + [trails, self.picked_text]
+        if self.particles is not None:
+            pts = state["particles"]
+            self.particles._offsets3d = (pts[:, 0], pts[:, 1], pts[:, 2])
+            artists.append(self.particles)
+        return artists
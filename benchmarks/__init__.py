@@ -0,0 +1,2 @@
+# Benchmark scripts. Run them from the repository root, e.g.
+#   python -m benchmarks.debris_field
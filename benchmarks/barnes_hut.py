@@ -0,0 +1,89 @@
+# Barnes-Hut octree against direct summation.
+#
+#   python -m benchmarks.barnes_hut [--theta 0.5] [--sizes 1000 4000 16000 64000]
+#
+# Sources are massive planetesimals in a thick disc, and every source is also
+# a target. A second set of test particles is evaluated as well: they feel
+# the sources but not each other. Before timing, theta=0 (every cell opened)
+# is checked against the direct sum. Errors are |a - a_direct| / |a_direct|
+# per target.
+
+import argparse
+import time
+
+import numpy as np
+
+from astrosim.barnes_hut import THETA, Octree
+from astrosim.nbody import direct_field
+
+SIZES = (1000, 4000, 16000, 64000)
+THETAS = (0.2, 0.3, 0.5, 0.7, 1.0)
+ACCURACY_N = 4000
+DIRECT_LIMIT = 16000  # direct sums beyond this are too slow to wait for
+
+
+def disc(n, rng):
+    r = np.sqrt(rng.uniform(1, 40**2, n))
+    phi = rng.uniform(0, 2 * np.pi, n)
+    points = np.column_stack([r * np.cos(phi), r * np.sin(phi), rng.normal(0, 0.5, n)])
+    return points, rng.uniform(1e-9, 1e-8, n)
+
+
+def timed(fn, *args, **kwargs):
+    start = time.perf_counter()
+    result = fn(*args, **kwargs)
+    return result, (time.perf_counter() - start) * 1e3
+
+
+def relative_error(a, ref):
+    return np.linalg.norm(a - ref, axis=1) / np.linalg.norm(ref, axis=1)
+
+
+def check_exact(rng):
+    points, masses = disc(500, rng)
+    particles, _ = disc(200, rng)
+    tree = Octree(points, masses)
+    for targets, sources_first in ((points, True), (particles, False)):
+        ref = direct_field(targets, points, masses, sources_first=sources_first)
+        assert relative_error(tree.field(targets, theta=0), ref).max() < 1e-10
+    print("theta=0 matches the direct sum for sources and test particles")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Barnes-Hut benchmark")
+    parser.add_argument("--theta", type=float, default=THETA)
+    parser.add_argument("--sizes", type=int, nargs="+", default=SIZES)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+    rng = np.random.default_rng(args.seed)
+
+    check_exact(rng)
+
+    print(f"\ntheta={args.theta}, targets = sources + as many test particles")
+    print(f"{'sources':>8} {'cells':>8} {'build ms':>9} {'tree ms':>9} {'direct ms':>10} {'speedup':>8} {'p99 err':>9}")
+    for n in args.sizes:
+        points, masses = disc(n, rng)
+        targets = np.concatenate([points, disc(n, rng)[0]])
+        tree, build_ms = timed(Octree, points, masses)
+        field, tree_ms = timed(tree.field, targets, args.theta)
+        if n <= DIRECT_LIMIT:
+            ref, direct_ms = timed(direct_field, targets, points, masses, sources_first=True)
+            err = np.percentile(relative_error(field, ref), 99)
+            print(f"{n:>8} {len(tree):>8} {build_ms:>9.1f} {tree_ms:>9.1f} {direct_ms:>10.1f} "
+                  f"{direct_ms / (build_ms + tree_ms):>7.1f}x {err:>9.2e}")
+        else:
+            print(f"{n:>8} {len(tree):>8} {build_ms:>9.1f} {tree_ms:>9.1f} {'-':>10} {'-':>8} {'-':>9}")
+
+    print(f"\naccuracy at {ACCURACY_N} sources")
+    points, masses = disc(ACCURACY_N, rng)
+    ref = direct_field(points, points, masses, sources_first=True)
+    tree = Octree(points, masses)
+    print(f"{'theta':>6} {'ms':>8} {'median err':>11} {'p99 err':>9} {'max err':>9}")
+    for theta in THETAS:
+        field, ms = timed(tree.field, points, theta)
+        err = relative_error(field, ref)
+        print(f"{theta:>6} {ms:>8.1f} {np.median(err):>11.2e} {np.percentile(err, 99):>9.2e} {err.max():>9.2e}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,127 @@
+# Catalog ingest throughput and cache load times.
+#
+#   python -m benchmarks.catalog [--objects 50000] [--repeats 3]
+#
+# A synthetic catalog is written out as a three-line TLE file and as an
+# OMM-style CSV. The table shows parse throughput (objects/s and MB/s) for
+# read_tle(), read_csv() and a naive parser that calls float() on every
+# field of every line. It also shows load_catalog() cold, when it parses
+# and writes the .npy cache, and warm, when it memory-maps the cache.
+#
+# Checks: the TLE and CSV parses agree, the naive parser agrees with
+# read_tle(), and the cached columns equal the parsed ones.
+
+import argparse
+import os
+import shutil
+import statistics
+import tempfile
+import time
+
+import numpy as np
+
+from astrosim.catalog import COLUMNS, ELEMENTS, load_catalog, read_csv, read_tle, semi_major_axis
+from astrosim.ephemeris import DAY, J2000
+
+
+def checksum(line):
+    # TLE modulo-10 checksum: digits count their value, minus signs 1
+    return sum(int(c) if c.isdigit() else c == "-" for c in line[:68]) % 10
+
+
+def write_files(n, directory, rng):
+    norad = np.arange(10000, 10000 + n)
+    mean_motion = np.round(rng.uniform(1.0, 15.5, n), 8)
+    e = rng.integers(0, 9_000_000, n)
+    angles = np.round(rng.uniform(0, 360, (4, n)), 4)
+    angles[0] = np.round(rng.uniform(0, 180, n), 4)
+    day = np.round(rng.uniform(1, 366, n), 8)
+    tle = os.path.join(directory, "catalog.tle")
+    with open(tle, "w") as f:
+        for k in range(n):
+            line1 = (f"1 {norad[k]:05d}U 98067A   24{day[k]:012.8f}  .00001234  00000-0  12345-4 0  999")
+            line2 = (f"2 {norad[k]:05d} {angles[0, k]:8.4f} {angles[1, k]:8.4f} {e[k]:07d} "
+                     f"{angles[2, k]:8.4f} {angles[3, k]:8.4f} {mean_motion[k]:11.8f}12345")
+            f.write(f"OBJECT {norad[k]}\n{line1}{checksum(line1)}\n{line2}{checksum(line2)}\n")
+    epochs = np.datetime64("2024-01-01T00:00:00", "us") + np.round((day - 1) * DAY * 1e6).astype("timedelta64[us]")
+    csv = os.path.join(directory, "catalog.csv")
+    with open(csv, "w") as f:
+        f.write("OBJECT_NAME,NORAD_CAT_ID,EPOCH,MEAN_MOTION,ECCENTRICITY,INCLINATION,RA_OF_ASC_NODE,"
+                "ARG_OF_PERICENTER,MEAN_ANOMALY\n")
+        for k in range(n):
+            f.write(f"OBJECT {norad[k]},{norad[k]},{epochs[k]},{mean_motion[k]:.8f},{e[k] / 1e7:.7f},"
+                    f"{angles[0, k]:.4f},{angles[1, k]:.4f},{angles[2, k]:.4f},{angles[3, k]:.4f}\n")
+    return tle, csv
+
+
+def naive_tle(path):
+    # One float() per field, one dict per object
+    rows = []
+    with open(path) as f:
+        lines = [line.rstrip("\n") for line in f]
+    for name, line1, line2 in zip(lines[::3], lines[1::3], lines[2::3]):
+        yy, day = int(line1[18:20]), float(line1[20:32])
+        year = 2000 + yy if yy < 57 else 1900 + yy
+        jan1 = (np.datetime64(f"{year}-01-01", "s") - J2000) / np.timedelta64(1, "s")
+        rows.append({"norad": int(line2[2:7]), "name": name, "epoch": jan1 + (day - 1) * DAY,
+                     "a": float(semi_major_axis(float(line2[52:63]))), "e": float("0." + line2[26:33]),
+                     "inclination": float(line2[8:16]), "raan": float(line2[17:25]),
+                     "argp": float(line2[34:42]), "mean_anomaly": float(line2[43:51])})
+    return {key: np.array([row[key] for row in rows]) for key in ("epoch",) + ELEMENTS}
+
+
+def timed(fn, repeats, setup=None):
+    times, result = [], None
+    for _ in range(repeats):
+        if setup:
+            setup()
+        start = time.perf_counter()
+        result = fn()
+        times.append(time.perf_counter() - start)
+    return statistics.median(times), result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Catalog ingest and cache benchmark")
+    parser.add_argument("--objects", type=int, default=50_000)
+    parser.add_argument("--repeats", type=int, default=3)
+    args = parser.parse_args()
+
+    directory = tempfile.mkdtemp(prefix="astrosim-catalog-")
+    cache_dir = os.path.join(directory, "cache")
+    try:
+        tle, csv = write_files(args.objects, directory, np.random.default_rng(0))
+        clear = lambda: shutil.rmtree(cache_dir, ignore_errors=True)  # noqa: E731
+        rows = [
+            ("read_tle", tle, lambda: read_tle(tle), None),
+            ("read_csv", csv, lambda: read_csv(csv), None),
+            ("naive tle", tle, lambda: naive_tle(tle), None),
+            ("cold load", tle, lambda: load_catalog(tle, cache_dir=cache_dir), clear),
+            ("warm load", tle, lambda: load_catalog(tle, cache_dir=cache_dir), None),
+        ]
+        results = {}
+        print(f"{args.objects} objects, TLE {os.path.getsize(tle) / 1e6:.1f} MB, CSV {os.path.getsize(csv) / 1e6:.1f} MB")
+        print(f"{'parser':>10} {'seconds':>8} {'objects/s':>10} {'MB/s':>7}")
+        for label, path, fn, setup in rows:
+            seconds, results[label] = timed(fn, args.repeats, setup)
+            print(f"{label:>10} {seconds:>8.3f} {args.objects / seconds:>10.3g} "
+                  f"{os.path.getsize(path) / 1e6 / seconds:>7.1f}")
+
+        parsed, warm = results["read_tle"], results["warm load"]
+        assert len(parsed) == args.objects
+        assert isinstance(warm["a"], np.memmap), "warm load did not memory-map the cache"
+        for name in COLUMNS:
+            assert np.array_equal(parsed[name], warm[name]), f"cached {name} differs"
+        from_csv = results["read_csv"]
+        assert np.array_equal(parsed["norad"], from_csv["norad"]) and np.array_equal(parsed["name"], from_csv["name"])
+        for name in ("epoch",) + ELEMENTS:
+            assert np.allclose(parsed[name], from_csv[name], rtol=0, atol=1e-5), f"TLE and CSV {name} differ"
+        for name, values in results["naive tle"].items():
+            assert np.allclose(parsed[name], values, rtol=1e-12, atol=0), f"naive {name} differs"
+        print("check: TLE, CSV, naive and cached catalogs agree")
+    finally:
+        shutil.rmtree(directory, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
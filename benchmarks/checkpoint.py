@@ -0,0 +1,97 @@
+# Cost of seeking with keyframe checkpoints against replaying from frame 0.
+#
+#   python -m benchmarks.checkpoint [--frames 3000] [--seeks 20] [--every 100]
+#
+# Each simulation is run once to --frames while keyframes are taken. It is
+# then sent to --seeks random frames, forwards and backwards, first with
+# every keyframe in memory and then with a memory budget of two keyframes,
+# so the rest spill to disk and are read back. The "replay" row rebuilds
+# the simulation and steps it from frame 0 to each target instead. The
+# table also shows keyframe size and the overhead of taking keyframes
+# during the first run.
+#
+# Every seek is checked against the replayed state, which must match bit
+# for bit.
+
+import argparse
+import tempfile
+import time
+
+import numpy as np
+
+from astrosim import registry
+from astrosim.checkpoint import Checkpoints
+
+CASES = {
+    "debris": {"num_debris": 20_000, "seed": 1},
+    "solar": {"seed": 1, "test_particles": 500},
+}
+
+
+def replay(name, params, frame):
+    sim = registry.create(name, **params)
+    for _ in range(frame):
+        sim.step()
+    return sim.state()
+
+
+def same(a, b):
+    return all(np.array_equal(a[key], b[key], equal_nan=True) for key in a)
+
+
+def run_case(name, params, frames, targets, every):
+    sim = registry.create(name, **params)
+    start = time.perf_counter()
+    for _ in range(frames):
+        sim.step()
+    plain = time.perf_counter() - start
+
+    rows = []
+    with tempfile.TemporaryDirectory() as directory:
+        for label, spill in (("memory", False), ("spilled", True)):
+            sim = registry.create(name, **params)
+            checkpoints = Checkpoints(sim, every=every, directory=directory if spill else None)
+            size = checkpoints.memory_bytes
+            if spill:
+                checkpoints.max_bytes = 2 * size
+            start = time.perf_counter()
+            for _ in range(frames):
+                checkpoints.step()
+            taking = time.perf_counter() - start
+            start = time.perf_counter()
+            states = []
+            for frame in targets:
+                states.append({key: np.array(value) for key, value in checkpoints.seek(frame).items()})
+            seeking = time.perf_counter() - start
+            rows.append((label, seeking, taking / plain - 1, size, len(checkpoints), states))
+
+    start = time.perf_counter()
+    expected = [replay(name, params, frame) for frame in targets]
+    replaying = time.perf_counter() - start
+    for label, *_, states in rows:
+        for frame, state, reference in zip(targets, states, expected):
+            assert same(state, reference), f"{name}: {label} seek to frame {frame} differs from a replay"
+
+    print(f"{name} {params}: {frames} frames, {plain / frames * 1e3:.2f} ms/step")
+    print(f"{'seeks':>9} {'ms/seek':>9} {'speedup':>8} {'take cost':>9} {'keyframe':>9} {'keyframes':>9}")
+    print(f"{'replay':>9} {replaying / len(targets) * 1e3:>9.1f} {1:>7.0f}x")
+    for label, seeking, overhead, size, count, _ in rows:
+        print(f"{label:>9} {seeking / len(targets) * 1e3:>9.1f} {replaying / seeking:>7.0f}x "
+              f"{overhead:>+9.1%} {size / 1e6:>7.2f}MB {count:>9}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Keyframe checkpoint seek benchmark")
+    parser.add_argument("--frames", type=int, default=3000)
+    parser.add_argument("--seeks", type=int, default=20)
+    parser.add_argument("--every", type=int, default=100, help="steps between keyframes")
+    args = parser.parse_args()
+
+    targets = np.random.default_rng(0).integers(0, args.frames + 1, args.seeks)
+    for name, params in CASES.items():
+        run_case(name, params, args.frames, targets, args.every)
+        print("check: every seek matches a replay from frame 0")
+
+
+if __name__ == "__main__":
+    main()
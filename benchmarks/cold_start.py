@@ -0,0 +1,63 @@
+# Cold-start time of a headless run against launching the animated scripts.
+#
+#   python -m benchmarks.cold_start [--repeat 5]
+#
+# Each command runs in a fresh interpreter. The scripts are launched with the
+# Agg backend so plt.show() returns immediately; what is timed is interpreter
+# start, imports and figure construction. The headless runs also assert that
+# matplotlib was never imported.
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+SCRIPTS = {
+    "orbits": "Orbit_Visualizer/Orbit Visualizer.py",
+    "rocket": "Rocket_Trajectory_Sim/Rocket Trajectory Simulation.py",
+    "solar": "Solar_System_Sim/Solar System Simulation.py",
+    "debris": "Space_Debris_Cleanup_Sim/Space Debris Cleanup Simulation.py",
+    "hohmann": "Earth-Mars_Hohmann_Transfer_Sim/Earth-Mars Hohmann Transfer Simulator.py",
+}
+
+HEADLESS = (
+    "import sys\n"
+    "from astrosim.cli import main\n"
+    "main(['run', {sim!r}, '--steps', '1', '--out', {out!r}])\n"
+    "assert 'matplotlib' not in sys.modules, 'matplotlib imported on the compute path'\n"
+)
+
+
+def median_seconds(cmd, repeat, env):
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        subprocess.run(cmd, cwd=ROOT, env=env, check=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        times.append(time.perf_counter() - start)
+    return statistics.median(times)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Headless cold-start benchmark")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    env = dict(os.environ, MPLBACKEND="Agg")
+    baseline = median_seconds([sys.executable, "-c", "pass"], args.repeat, env)
+    print(f"bare interpreter: {baseline * 1e3:.0f} ms")
+    print(f"{'sim':>8} {'script ms':>10} {'headless ms':>12} {'speedup':>8}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for sim, script in SCRIPTS.items():
+            script_s = median_seconds([sys.executable, script], args.repeat, env)
+            code = HEADLESS.format(sim=sim, out=os.path.join(tmp, sim + ".npz"))
+            headless_s = median_seconds([sys.executable, "-c", code], args.repeat, env)
+            print(f"{sim:>8} {script_s * 1e3:10.0f} {headless_s * 1e3:12.0f} {script_s / headless_s:7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+# Conjunction screening throughput on synthetic 10k and 100k object catalogs.
+#
+#   python -m benchmarks.conjunction [--sizes 10000 100000] [--span 1800] [--workers N]
+#
+# Catalogs mix LEO, MEO, GEO and highly eccentric transfer orbits. The
+# table shows how many pairs survive each stage: hash candidates,
+# apogee/perigee filter, orbit-path filter, then conjunctions after TCA
+# refinement. pairs/s is all N(N-1)/2 pairs screened over the span, per
+# second of wall time.
+#
+# Before timing, a dense 300-object shell is screened over 20 minutes and
+# checked two ways. The filters must not drop any conjunction found
+# without them. Every pair that brute-force sampling every 0.5 s puts well
+# inside the threshold must be reported.
+
+import argparse
+import os
+
+import numpy as np
+
+from astrosim.conjunction import screen
+from astrosim.kepler import KeplerOrbits
+from astrosim.orbits import EARTH_RADIUS
+
+THRESHOLD = 5.0  # km
+
+
+def catalog(n, rng):
+    # 80% LEO, 7% MEO, 8% GEO belt, 5% transfer orbits (perigee in LEO)
+    kind = rng.choice(4, n, p=[0.8, 0.07, 0.08, 0.05])
+    altitude = np.select([kind == 0, kind == 1, kind == 2],
+                         [rng.uniform(400, 1500, n), rng.uniform(19000, 24000, n), rng.normal(35786, 50, n)],
+                         rng.uniform(200, 600, n))
+    e = np.select([kind == 0, kind == 3], [rng.uniform(0, 0.01, n), rng.uniform(0.6, 0.73, n)], rng.uniform(0, 0.005, n))
+    a = np.where(kind == 3, (EARTH_RADIUS + altitude) / (1 - e), EARTH_RADIUS + altitude)
+    inclination = np.where(kind == 2, rng.uniform(0, 5, n), rng.uniform(0, 110, n))
+    return KeplerOrbits(a, e, inclination, rng.uniform(0, 360, n), rng.uniform(0, 360, n), rng.uniform(0, 360, n))
+
+
+def check(threshold=20.0, span=1200.0):
+    rng = np.random.default_rng(1)
+    n = 300
+    orbits = KeplerOrbits(EARTH_RADIUS + rng.uniform(700, 720, n), rng.uniform(0, 0.002, n), rng.uniform(0, 180, n),
+                          rng.uniform(0, 360, n), rng.uniform(0, 360, n), rng.uniform(0, 360, n))
+    filtered, _ = screen(orbits, 0.0, span, threshold, workers=1)
+    unfiltered, _ = screen(orbits, 0.0, span, threshold, filters=False, workers=1)
+    assert np.array_equal(filtered["i"], unfiltered["i"]) and np.array_equal(filtered["j"], unfiltered["j"]), \
+        "the orbit filters dropped a conjunction"
+
+    i, j = np.triu_indices(n, 1)
+    closest = np.full(len(i), np.inf)
+    for t in np.arange(0.0, span, 0.5):
+        p = orbits.positions(t)
+        np.minimum(closest, np.linalg.norm(p[i] - p[j], axis=1), out=closest)
+    # Sampling at 0.5 s can overshoot the true minimum by up to ~4 km
+    sure = set(zip(i[closest < threshold - 4], j[closest < threshold - 4]))
+    found = set(zip(filtered["i"].tolist(), filtered["j"].tolist()))
+    assert sure <= found, f"missed conjunctions: {sorted(sure - found)[:5]}"
+    print(f"check: {len(filtered['tca'])} conjunctions in a dense shell, none lost to the filters, "
+          f"all {len(sure)} brute-force pairs found")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Conjunction screening benchmark")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000])
+    parser.add_argument("--span", type=float, default=1800.0, help="seconds screened")
+    parser.add_argument("--workers", type=int, default=os.cpu_count())
+    args = parser.parse_args()
+
+    check()
+    print(f"{'objects':>8} {'workers':>7} {'candidates':>10} {'ap/pe':>8} {'path':>8} {'events':>7} "
+          f"{'seconds':>8} {'pairs/s':>10}")
+    for n in args.sizes:
+        orbits = catalog(n, np.random.default_rng(0))
+        for workers in sorted({1, args.workers}):
+            events, stats = screen(orbits, 0.0, args.span, THRESHOLD, workers=workers)
+            print(f"{n:>8} {workers:>7} {stats['candidates']:>10} {stats['apogee_perigee']:>8} "
+                  f"{stats['orbit_path']:>8} {stats['conjunctions']:>7} {stats['seconds']:>8.2f} "
+                  f"{stats['pairs_per_s']:>10.3g}")
+        print(f"{'':>8} {stats['shell_overlap_pairs'] / stats['pairs']:.1%} of all pairs overlap in radius; "
+              f"closest approach {events['miss'].min() if len(events['miss']) else float('nan'):.3f} km")
+
+
+if __name__ == "__main__":
+    main()
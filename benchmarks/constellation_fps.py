@@ -0,0 +1,85 @@
+# Frame rate of a constellation drawn per object versus as one collection.
+#
+#   python -m benchmarks.constellation_fps [--frames 20] [--lod 2000]
+#
+# Every frame propagates the constellation and redraws the figure with Agg
+# (a full draw, as when the view is being rotated). "artists" is the old
+# approach of one Line3D marker per satellite, "collection" is one scatter
+# layer, and "lod" is the same layer decimated to --lod points. Per-object
+# artists are only tried up to ARTIST_LIMIT objects, and with few frames.
+
+import argparse
+import statistics
+import time
+
+import matplotlib
+
+matplotlib.use("Agg")
+
+import matplotlib.pyplot as plt  # noqa: E402
+
+from astrosim.constellation import create  # noqa: E402
+from astrosim.views.layers import PointLayer  # noqa: E402
+
+COUNTS = (100, 1000, 10000, 100000)
+ARTIST_LIMIT = 10000
+ARTIST_FRAMES = 3
+
+
+class ArtistPerObject:
+    def __init__(self, ax, points):
+        self.markers = [ax.plot([x], [y], [z], 'o', color='cyan', markersize=2)[0] for x, y, z in points]
+
+    def set_points(self, points):
+        for marker, (x, y, z) in zip(self.markers, points):
+            marker.set_data([x], [y])
+            marker.set_3d_properties([z])
+
+
+def fps(n, mode, frames, lod):
+    sim = create(num_satellites=n)
+    fig = plt.figure(figsize=(8, 8))
+    ax = fig.add_subplot(111, projection='3d')
+    lim = 8000
+    ax.set_xlim(-lim, lim)
+    ax.set_ylim(-lim, lim)
+    ax.set_zlim(-lim, lim)
+    points = sim.state()["positions"]
+    if mode == "artists":
+        layer = ArtistPerObject(ax, points)
+    else:
+        layer = PointLayer(ax, points, max_points=lod if mode == "lod" else None, color='cyan', s=2)
+    fig.canvas.draw()
+    times = []
+    for _ in range(frames):
+        start = time.perf_counter()
+        sim.step()
+        layer.set_points(sim.state()["positions"])
+        fig.canvas.draw()
+        times.append(time.perf_counter() - start)
+    plt.close(fig)
+    return len(sim), 1.0 / statistics.median(times)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Constellation rendering frame-rate benchmark")
+    parser.add_argument("--frames", type=int, default=20)
+    parser.add_argument("--lod", type=int, default=2000, help="point budget of the lod mode")
+    parser.add_argument("--counts", type=int, nargs="+", default=COUNTS)
+    args = parser.parse_args()
+
+    print(f"{'objects':>8} {'artists fps':>12} {'collection fps':>15} {'lod fps':>8}")
+    for n in args.counts:
+        row = {}
+        for mode in ("artists", "collection", "lod"):
+            if mode == "artists" and n > ARTIST_LIMIT:
+                row[mode] = "-"
+                continue
+            frames = min(args.frames, ARTIST_FRAMES) if mode == "artists" else args.frames
+            total, rate = fps(n, mode, frames, args.lod)
+            row[mode] = f"{rate:.1f}"
+        print(f"{total:>8} {row['artists']:>12} {row['collection']:>15} {row['lod']:>8}")
+
+
+if __name__ == "__main__":
+    main()
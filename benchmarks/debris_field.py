@@ -0,0 +1,71 @@
+# Per-frame cost of the debris field engine at increasing field sizes.
+#
+#   python -m benchmarks.debris_field [--frames 50]
+#
+# The 10^3 case is also run through the original one-dict-per-fragment loop
+# for comparison.
+
+import argparse
+import time
+
+import numpy as np
+
+from astrosim.debris import DebrisField, BANDS, BAND_R, BAND_r, SAT_SPEEDS, CAPTURE_RADIUS
+
+SIZES = (10**3, 10**5, 10**6)
+
+
+def legacy_step(debris, frame):
+    # The scalar loop the old update() ran, minus the matplotlib calls
+    for band, items in enumerate(debris):
+        R, r = BAND_R[band], BAND_r[band]
+        for d in items:
+            if d["captured"]:
+                continue
+            d["theta"] += d["speed"]
+            t, p = d["theta"], d["phi"]
+            d["pos"] = ((R + r * np.cos(p)) * np.cos(t), (R + r * np.cos(p)) * np.sin(t), r * np.sin(p))
+        ang = SAT_SPEEDS[band] * frame
+        sx, sy, sz = (R + r) * np.cos(ang), (R + r) * np.sin(ang), 0.0
+        for d in items:
+            if d["captured"]:
+                continue
+            dx, dy, dz = d["pos"][0] - sx, d["pos"][1] - sy, d["pos"][2] - sz
+            if np.sqrt(dx * dx + dy * dy + dz * dz) < CAPTURE_RADIUS:
+                d["captured"] = True
+
+
+def time_frames(step, frames):
+    step(0)  # warm up
+    start = time.perf_counter()
+    for frame in range(1, frames + 1):
+        step(frame)
+    return (time.perf_counter() - start) / frames
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Debris field per-frame benchmark")
+    parser.add_argument("--frames", type=int, default=50)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    print(f"{'fragments':>10} {'engine ms/frame':>16} {'legacy ms/frame':>16}")
+    for n in SIZES:
+        rng = np.random.default_rng(args.seed)
+        field = DebrisField.random(n // len(BANDS), rng=rng)
+        engine = time_frames(lambda frame: field.step(), args.frames) * 1e3
+
+        legacy = ""
+        if n <= 10**3:
+            debris = [
+                [{"theta": t, "phi": p, "speed": s, "captured": False}
+                 for t, p, s in zip(field.theta[field.band == b], field.phi[field.band == b],
+                                    field.speed[field.band == b])]
+                for b in range(len(BANDS))
+            ]
+            legacy = f"{time_frames(lambda frame: legacy_step(debris, frame), args.frames) * 1e3:16.3f}"
+        print(f"{n:>10} {engine:16.3f} {legacy:>16}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+# Ephemeris table lookups against evaluating the planet model directly.
+#
+#   python -m benchmarks.ephemeris [--epochs 1000000] [--step 0.25]
+#
+# The eight J2000 Kepler planets are tabulated over 1950-2100, saved and
+# memory-mapped back. Lookups of all planets at random epochs are timed
+# against the model evaluated one epoch at a time (as a sim does once per
+# frame) and as one batched call. The accuracy table gives the worst
+# position and velocity error of the interpolation for a few table steps.
+
+import argparse
+import tempfile
+import time
+
+import numpy as np
+
+from astrosim.ephemeris import DAY, Ephemeris, j2000_days, planet_ephemeris, planet_orbits
+
+START, STOP = j2000_days("1950-01-01"), j2000_days("2100-01-01")
+ACCURACY_STEPS = (0.125, 0.25, 1.0, 4.0)  # days
+ACCURACY_EPOCHS = 100_000
+SCALAR_EPOCHS = 2000
+
+
+def check_accuracy(orbits, rng):
+    print(f"{'step days':>10} {'rows':>8} {'max pos err km':>15} {'max vel err m/s':>16}")
+    t = rng.uniform(START, STOP, ACCURACY_EPOCHS) * DAY
+    pos, vel = orbits.positions(t, velocities=True)
+    for step in ACCURACY_STEPS:
+        table = planet_ephemeris(START, STOP, step)
+        p, v = table.states(t)
+        print(f"{step:>10} {len(table):>8} {np.abs(p - pos).max():>15.4f} {np.abs(v - vel).max() * 1e3:>16.4f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Ephemeris lookup benchmark")
+    parser.add_argument("--epochs", type=int, default=10**6)
+    parser.add_argument("--step", type=float, default=0.25, help="table step in days")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+    rng = np.random.default_rng(args.seed)
+    orbits = planet_orbits()
+
+    check_accuracy(orbits, rng)
+
+    start = time.perf_counter()
+    table = planet_ephemeris(START, STOP, args.step)
+    build = time.perf_counter() - start
+    with tempfile.TemporaryDirectory() as tmp:
+        table.save(tmp)
+        start = time.perf_counter()
+        table = Ephemeris.load(tmp)
+        load_ms = (time.perf_counter() - start) * 1e3
+        print(f"table: {len(table)} epochs x {len(table.names)} planets, built in {build:.2f}s, "
+              f"memory-mapped in {load_ms:.2f} ms")
+
+        t = rng.uniform(START, STOP, args.epochs) * DAY
+        start = time.perf_counter()
+        for ti in t[:SCALAR_EPOCHS]:
+            orbits.positions(ti)
+        scalar = SCALAR_EPOCHS / (time.perf_counter() - start)
+        start = time.perf_counter()
+        direct = orbits.positions(t)
+        batched = args.epochs / (time.perf_counter() - start)
+        start = time.perf_counter()
+        looked_up = table.positions_at(t)
+        lookup = args.epochs / (time.perf_counter() - start)
+        err = np.abs(looked_up - direct).max()
+        del looked_up, table
+
+    print(f"{'method':>16} {'epochs/s':>14} {'vs per-epoch':>13}")
+    for name, rate in (("model per epoch", scalar), ("model batched", batched), ("table lookup", lookup)):
+        print(f"{name:>16} {rate:>14,.0f} {rate / scalar:>12.0f}x")
+    print(f"lookup vs batched model: {lookup / batched:.1f}x faster, max error {err:.4f} km")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+# Fleet sizing: debris cleared per simulated day and scheduler re-plan cost.
+#
+#   python -m benchmarks.fleet [--fragments 60000] [--frames 100]
+#
+# Each fleet is spread evenly around the bands and run once with the
+# FleetScheduler chasing targets and once passively (collectors coasting at
+# their base speed, as in the original simulation).
+
+import argparse
+import time
+
+import numpy as np
+
+from astrosim.debris import DebrisField, BANDS, SAT_SPEEDS, FRAME_SECONDS
+from astrosim.fleet import FleetScheduler
+
+FLEETS = (3, 30, 100, 300, 1000)
+
+
+def make_field(fragments, collectors, seed):
+    band = np.arange(collectors) % len(BANDS)
+    # Evenly spaced within each band
+    slot = np.arange(collectors) // len(BANDS)
+    per_band = np.bincount(band, minlength=len(BANDS))[band]
+    sat_theta = 2 * np.pi * slot / per_band
+    return DebrisField.random(fragments // len(BANDS), rng=np.random.default_rng(seed),
+                              sat_band=band, sat_speeds=SAT_SPEEDS[band], sat_theta=sat_theta)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Fleet scheduler benchmark")
+    parser.add_argument("--fragments", type=int, default=60000)
+    parser.add_argument("--frames", type=int, default=100)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    days = args.frames * FRAME_SECONDS / 86400
+    print(f"{args.fragments} fragments, {args.frames} frames ({days:.3f} simulated days)")
+    print(f"{'collectors':>10} {'cleared/day':>12} {'passive/day':>12} {'replans':>8} "
+          f"{'replan ms':>10} {'p95 ms':>8} {'ms/frame':>9}")
+    for m in FLEETS:
+        field = make_field(args.fragments, m, args.seed)
+        start = time.perf_counter()
+        scheduler = FleetScheduler(field)
+        for _ in range(args.frames):
+            scheduler.step()
+        wall = time.perf_counter() - start
+        r = scheduler.report()
+
+        passive = make_field(args.fragments, m, args.seed)
+        for _ in range(args.frames):
+            passive.step()
+        passive_rate = passive.captured.sum() / days
+
+        print(f"{m:>10} {r['cleared_per_day']:12.0f} {passive_rate:12.0f} {r['replans']:>8} "
+              f"{r['replan_ms_mean']:10.2f} {r['replan_ms_p95']:8.2f} {wall / args.frames * 1e3:9.2f}")
+
+
+if __name__ == "__main__":
+    main()
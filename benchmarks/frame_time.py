@@ -0,0 +1,86 @@
+# Per-frame cost of the animated views, rendered off screen with Agg.
+#
+#   python -m benchmarks.frame_time [--frames 100] [--sims solar debris]
+#
+# Each frame is timed in two parts. "update" covers stepping the simulation
+# and pushing the new state into the artists. "redraw" covers what
+# FuncAnimation then paints. Blitting views restore the static background and
+# redraw only the artists update() returned; the other views redraw the
+# whole figure. The "solar (legacy)" row puts back what the solar view used
+# to do every frame: rebuild all nine orbit ellipses, push them into their
+# lines and return those lines for redrawing.
+
+import argparse
+import statistics
+import time
+
+import matplotlib
+
+matplotlib.use("Agg")
+
+import numpy as np  # noqa: E402
+
+from astrosim import registry  # noqa: E402
+
+SIMS = ("orbits", "solar", "debris", "hohmann")
+
+
+def legacy_solar_update(view, frame):
+    artists = view.update(frame)
+    sim = view.sim
+    theta = np.linspace(0, 2 * np.pi, 200)
+    r = sim.scaled_radius[:, None]
+    orbits = np.stack([
+        r * np.cos(theta),
+        r * np.sin(theta) * np.cos(sim.incl_rad)[:, None],
+        r * np.sin(theta) * np.sin(sim.incl_rad)[:, None],
+    ], axis=1)
+    for line, (ox, oy, oz) in zip(view.orbit_lines, orbits):
+        line.set_data(ox, oy)
+        line.set_3d_properties(oz)
+    return list(artists) + view.orbit_lines
+
+
+def time_frames(name, frames, legacy=None):
+    view = registry.view_class(name)(registry.create(name))
+    update = view.update if legacy is None else (lambda i: legacy(view, i))
+    canvas = view.fig.canvas
+    canvas.draw()
+    background = canvas.copy_from_bbox(view.fig.bbox)
+    update_ms, redraw_ms, counts = [], [], []
+    for i in range(frames):
+        start = time.perf_counter()
+        artists = update(i)
+        mid = time.perf_counter()
+        if view.blit:
+            canvas.restore_region(background)
+            for artist in artists:
+                view.fig.draw_artist(artist)
+            canvas.blit(view.fig.bbox)
+        else:
+            canvas.draw()
+        end = time.perf_counter()
+        update_ms.append((mid - start) * 1e3)
+        redraw_ms.append((end - mid) * 1e3)
+        counts.append(len(artists))
+    return statistics.median(update_ms), statistics.median(redraw_ms), max(counts)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Per-frame view cost benchmark")
+    parser.add_argument("--frames", type=int, default=100)
+    parser.add_argument("--sims", nargs="+", default=SIMS, choices=SIMS)
+    args = parser.parse_args()
+
+    rows = [(name, name, None) for name in args.sims]
+    if "solar" in args.sims:
+        rows.insert(rows.index(("solar", "solar", None)), ("solar (legacy)", "solar", legacy_solar_update))
+
+    print(f"{'view':>15} {'artists':>8} {'update ms':>10} {'redraw ms':>10} {'total ms':>9}")
+    for label, name, legacy in rows:
+        update_ms, redraw_ms, count = time_frames(name, args.frames, legacy)
+        print(f"{label:>15} {count:>8} {update_ms:>10.2f} {redraw_ms:>10.2f} {update_ms + redraw_ms:>9.2f}")
+
+
+if __name__ == "__main__":
+    main()
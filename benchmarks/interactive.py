@@ -0,0 +1,108 @@
+# Frame-time jitter of the interactive Solar System view, with physics in
+# the animation callback (sync) and on a worker thread (async, see
+# astrosim.producer).
+#
+#   python -m benchmarks.interactive [--frames 200] [--particles 1000] [--press-every 10]
+#
+# The animation loop is driven headlessly on Agg the way matplotlib's Tk
+# timer drives it: update the view, blit the changed artists, then wait one
+# interval. Every --press-every frames the view gets an "up" key press, as
+# from the keyboard. Each press raises sim_speed by 20%, and with it the
+# number of N-body substeps per frame. The table shows the time each
+# callback blocks the GUI and the jitter (standard deviation) of the
+# intervals between frames, plus the producer's dropped, interpolated and
+# held frames.
+#
+# Check: with interpolation off, every frame the producer hands out matches
+# the same frame of a synchronous run with the same seed.
+
+import argparse
+import time
+from types import SimpleNamespace
+
+import matplotlib
+
+matplotlib.use("Agg")
+
+import numpy as np  # noqa: E402
+
+from astrosim.solar import create  # noqa: E402
+from astrosim.views.solar import SolarSystemView  # noqa: E402
+
+
+def session(view, frames, press_every, interval):
+    # Timer-driven animation loop; returns frame start times and callback
+    # durations (s)
+    canvas = view.fig.canvas
+    for artist in view.update(0):
+        artist.set_animated(True)
+    canvas.draw()
+    background = canvas.copy_from_bbox(view.fig.bbox)
+    starts, blocked = [], []
+    for i in range(frames):
+        start = time.perf_counter()
+        if i and i % press_every == 0:
+            view.on_key(SimpleNamespace(key="up"))
+        artists = view.update(i)
+        canvas.restore_region(background)
+        for artist in artists:
+            view.fig.draw_artist(artist)
+        canvas.blit(view.fig.bbox)
+        if view.producer is not None:
+            view.producer.drawn()  # as View does after each animation frame
+        end = time.perf_counter()
+        starts.append(start)
+        blocked.append(end - start)
+        time.sleep(interval)
+    return np.array(starts), np.array(blocked)
+
+
+def check(particles, frames=60):
+    sim = create(seed=3, test_particles=particles)
+    expected = {}
+    for _ in range(frames):
+        sim.step()
+        expected[sim.frame] = sim.state()["positions"].copy()
+    view = SolarSystemView(create(seed=3, test_particles=particles))
+    with view.run_async(interpolate=False) as producer:
+        shown = set()
+        while len(shown) < frames // 2:
+            state = producer.get()
+            assert np.array_equal(state["positions"], expected[producer.frame]), f"frame {producer.frame} differs"
+            shown.add(producer.frame)
+            producer.drawn()
+            time.sleep(view.interval / 1000)
+    print(f"check: {len(shown)} async frames match the synchronous run")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Interactive frame-time jitter benchmark")
+    parser.add_argument("--frames", type=int, default=200)
+    parser.add_argument("--particles", type=int, default=1000, help="asteroid test particles")
+    parser.add_argument("--press-every", type=int, default=10, help="frames between 'up' key presses")
+    parser.add_argument("--no-check", action="store_true")
+    args = parser.parse_args()
+
+    if not args.no_check:
+        check(args.particles)
+    final_speed = 1.2 ** ((args.frames - 1) // args.press_every)
+    print(f"{args.frames} frames, {args.particles} test particles, sim_speed 1 -> {final_speed:.1f}")
+    print(f"{'mode':>6} {'fps':>6} {'block ms':>9} {'p99 ms':>7} {'jitter ms':>10} "
+          f"{'dropped':>8} {'interp':>7} {'held':>5}")
+    for mode in ("sync", "async"):
+        view = SolarSystemView(create(seed=1, test_particles=args.particles))
+        interval = view.interval / 1000
+        producer = view.run_async() if mode == "async" else None
+        starts, blocked = session(view, args.frames, args.press_every, interval)
+        stats = {"dropped": "-", "interpolated": "-", "held": "-"}
+        if producer is not None:
+            producer.stop()
+            stats = producer.stats
+        gaps = np.diff(starts) * 1e3
+        print(f"{mode:>6} {len(gaps) / (starts[-1] - starts[0]):>6.1f} {np.median(blocked) * 1e3:>9.1f} "
+              f"{np.percentile(blocked, 99) * 1e3:>7.1f} {gaps.std():>10.2f} "
+              f"{stats['dropped']:>8} {stats['interpolated']:>7} {stats['held']:>5}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+# Kepler propagation throughput and accuracy.
+#
+#   python -m benchmarks.kepler [--epochs 10]
+#
+# Random satellites (e up to 0.9, any orientation) are propagated to a batch
+# of epochs in one call, with the Halley and Newton solvers. The residual is
+# the worst |E - e sin E - M| over all solutions. One orbit is also checked
+# against a tight direct integration of the two-body equations.
+
+import argparse
+import time
+
+import numpy as np
+
+from astrosim.integrate import dopri5
+from astrosim.kepler import MU_EARTH, KeplerOrbits, solve_kepler
+
+SIZES = (10**3, 10**4, 10**5, 10**6)
+
+
+def random_orbits(n, rng):
+    return KeplerOrbits(
+        a=rng.uniform(6800, 45000, n),
+        e=rng.uniform(0, 0.9, n),
+        inclination=rng.uniform(0, 180, n),
+        raan=rng.uniform(0, 360, n),
+        argp=rng.uniform(0, 360, n),
+        mean_anomaly=rng.uniform(0, 360, n),
+    )
+
+
+def check_against_integration():
+    sat = KeplerOrbits(a=26600, e=0.74, inclination=63.4, raan=40, argp=270)  # Molniya
+
+    def two_body(t, y):
+        r = y[:3]
+        return np.concatenate([y[3:], -MU_EARTH * r / np.linalg.norm(r) ** 3])
+
+    pos, vel = sat.positions(0.0, velocities=True)
+    t_end = 1.5 * sat.period[0]
+    sol = dopri5(two_body, 0.0, np.concatenate([pos[0], vel[0]]), t_end, rtol=1e-12, atol=1e-9)
+    err = np.linalg.norm(sol["y"][-1, :3] - sat.positions(t_end)[0])
+    print(f"Molniya orbit after 1.5 periods: {err:.2e} km from direct integration")
+    assert err < 1e-3
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Kepler propagator benchmark")
+    parser.add_argument("--epochs", type=int, default=10, help="epochs per propagate() call")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+    rng = np.random.default_rng(args.seed)
+
+    check_against_integration()
+
+    print(f"{'satellites':>10} {'method':>7} {'iters':>6} {'ms':>9} {'states/s':>12} {'max residual':>13}")
+    for n in SIZES:
+        sats = random_orbits(n, rng)
+        epochs = np.linspace(0, 86400, args.epochs)
+        M = sats.mean_anomaly + sats.mean_motion * epochs[:, None]
+        for method in ("halley", "newton"):
+            start = time.perf_counter()
+            sats.positions(epochs, method=method)
+            seconds = time.perf_counter() - start
+            E, iters = solve_kepler(M, sats.e, method=method, full_output=True)
+            residual = np.abs(np.mod(E - sats.e * np.sin(E) - M + np.pi, 2 * np.pi) - np.pi).max()
+            print(f"{n:>10} {method:>7} {iters:>6} {seconds * 1e3:>9.1f} {n * args.epochs / seconds:>12,.0f} {residual:>13.2e}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+# N-body engine: step rate as test particles are added, and energy drift.
+#
+#   python -m benchmarks.nbody [--drift-steps 1000000]
+#
+# The step table adds asteroid-belt test particles to the nine solar system
+# bodies. The drift run integrates the planets alone and reports the largest
+# relative energy error seen (sampled every DRIFT_SAMPLE steps) after each
+# power of ten steps; a symplectic integrator should keep it bounded rather
+# than growing with the step count.
+
+import argparse
+import time
+
+import numpy as np
+
+from astrosim.nbody import DT, NBody
+from astrosim.solar import PLANET_MASSES, PLANETS
+
+TEST_PARTICLES = (0, 100, 1000, 10000)
+DRIFT_SAMPLE = 1000
+
+
+def steps_per_second(n_particles, steps, seed):
+    sim = NBody.from_planets(PLANETS, PLANET_MASSES, n_particles, rng=np.random.default_rng(seed))
+    start = time.perf_counter()
+    for _ in range(steps):
+        sim.step()
+    return steps / (time.perf_counter() - start)
+
+
+def energy_drift(steps, dt):
+    sim = NBody.from_planets(PLANETS, PLANET_MASSES, dt=dt)
+    e0 = sim.energy()
+    worst = 0.0
+    checkpoints = []
+    done = 0
+    while done < steps:
+        chunk = min(DRIFT_SAMPLE, steps - done)
+        for _ in range(chunk):
+            sim.step()
+        done += chunk
+        worst = max(worst, abs(sim.energy() / e0 - 1))
+        if np.log10(done).is_integer() or done == steps:
+            checkpoints.append((done, sim.time, worst))
+    return checkpoints
+
+
+def main():
+    parser = argparse.ArgumentParser(description="N-body engine benchmark")
+    parser.add_argument("--steps", type=int, default=200, help="steps per row of the rate table")
+    parser.add_argument("--drift-steps", type=int, default=100_000)
+    parser.add_argument("--dt", type=float, default=DT)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    print(f"{'bodies':>8} {'particles':>10} {'steps/s':>10} {'body-steps/s':>14}")
+    for n in TEST_PARTICLES:
+        rate = steps_per_second(n, args.steps, args.seed)
+        print(f"{len(PLANETS):>8} {n:>10} {rate:>10,.0f} {rate * (len(PLANETS) + n):>14,.0f}")
+
+    print(f"\nenergy drift, dt={args.dt} yr")
+    print(f"{'steps':>10} {'years':>10} {'max |dE/E|':>12}")
+    for steps, years, worst in energy_drift(args.drift_steps, args.dt):
+        print(f"{steps:>10} {years:>10.1f} {worst:>12.2e}")
+
+
+if __name__ == "__main__":
+    main()
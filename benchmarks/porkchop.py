@@ -0,0 +1,94 @@
+# Porkchop sweep throughput, with checks of the Lambert solutions.
+#
+#   python -m benchmarks.porkchop [--workers N] [--sizes 100 1000]
+#
+# An n x n grid of departure and arrival dates around the 2026 Earth-Mars
+# window is swept serially and over a process pool. Throughput is in grid
+# points (Lambert solutions) per second. "ephemeris ms" is the planet state
+# lookup on the first sweep; the second sweep takes it from the cache.
+# Before timing, sampled solutions are propagated with direct integration
+# to check they reach Mars, and a sweep between circular coplanar orbits is
+# checked against the Hohmann transfer.
+
+import argparse
+import os
+import time
+
+import numpy as np
+
+from astrosim.ephemeris import AU_KM, DAY, MU_SUN, j2000_days
+from astrosim.integrate import dopri5
+from astrosim.porkchop import _ephemeris, best, ephemeris, lambert, porkchop
+
+SIZES = (100, 1000)
+DEPARTURE_SPAN = 200  # days
+ARRIVAL_SPAN = 450
+
+
+def grid_axes(n):
+    dep = j2000_days("2026-08-01") + np.linspace(0, DEPARTURE_SPAN, n)
+    arr = j2000_days("2027-03-01") + np.linspace(0, ARRIVAL_SPAN, n)
+    return dep, arr
+
+
+def check_against_integration(samples=5, seed=0):
+    dep, arr = grid_axes(100)
+    r1, _ = ephemeris("earth", dep)
+    r2, _ = ephemeris("mars", arr)
+
+    def two_body(t, y):
+        return np.concatenate([y[3:], -MU_SUN * y[:3] / np.linalg.norm(y[:3])**3])
+
+    rng = np.random.default_rng(seed)
+    worst = 0.0
+    for i, j in rng.integers(0, 100, (samples, 2)):
+        tof = (arr[j] - dep[i]) * DAY
+        v1, _ = lambert(r1[i], r2[j], tof)
+        sol = dopri5(two_body, 0.0, np.concatenate([r1[i], v1]), tof, rtol=1e-12, atol=1e-3)
+        worst = max(worst, np.linalg.norm(sol["y"][-1, :3] - r2[j]))
+    print(f"{samples} sampled transfers miss Mars by at most {worst:.3f} km under direct integration")
+    assert worst < 10
+
+
+def check_against_hohmann():
+    # Circular coplanar orbits at 1 and 1.52 AU: the cheapest transfer on a
+    # fine grid must cost what the Hohmann transfer does
+    r1, r2 = AU_KM, 1.52 * AU_KM
+    earth, mars = (r1, 0.0, 0.0, 0.0, 0.0, 0.0), (r2, 0.0, 0.0, 0.0, 0.0, 135.0)
+    a = (r1 + r2) / 2
+    hohmann = (np.sqrt(MU_SUN / r1) * (np.sqrt(r2 / a) - 1) + np.sqrt(MU_SUN / r2) * (1 - np.sqrt(r1 / a)))
+    grid = porkchop(np.linspace(0, 400, 201), np.linspace(150, 700, 276), earth, mars, workers=1)
+    _, _, dv = best(grid)
+    print(f"circular coplanar sweep: min dv {dv:.4f} km/s, Hohmann {hohmann:.4f} km/s")
+    assert abs(dv - hohmann) < 0.01 * hohmann
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Porkchop sweep benchmark")
+    parser.add_argument("--workers", type=int, default=os.cpu_count())
+    parser.add_argument("--sizes", type=int, nargs="+", default=SIZES)
+    args = parser.parse_args()
+
+    check_against_integration()
+    check_against_hohmann()
+
+    print(f"{'grid':>11} {'mode':>8} {'seconds':>8} {'points/s':>11} {'ephemeris ms':>13} {'min C3':>7}")
+    for n in args.sizes:
+        dep, arr = grid_axes(n)
+        for mode, workers in (("serial", 1), (f"pool x{args.workers}", args.workers)):
+            _ephemeris.cache_clear()
+            start = time.perf_counter()
+            ephemeris("earth", dep)
+            ephemeris("mars", arr)
+            lookup_ms = (time.perf_counter() - start) * 1e3
+            start = time.perf_counter()
+            grid = porkchop(dep, arr, workers=workers)
+            seconds = time.perf_counter() - start
+            _, _, c3 = best(grid, "c3")
+            print(f"{n:>5}x{n:<5} {mode:>8} {seconds:>8.2f} {n * n / seconds:>11,.0f} {lookup_ms:>13.2f} {c3:>7.2f}")
+    hits = _ephemeris.cache_info().hits
+    print(f"ephemeris cache hits: {hits}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+# Recording cost: Python lists against the chunked Recorder.
+#
+#   python -m benchmarks.recorder [--steps 100000] [--sim solar]
+#
+# Every mode records the same run; peak memory is measured with tracemalloc
+# (numpy buffers included). The on-disk recording is read back through
+# load() and checked against the in-memory one.
+
+import argparse
+import shutil
+import tempfile
+import time
+import tracemalloc
+
+import numpy as np
+
+from astrosim import registry
+from astrosim.recorder import Recorder, load
+from astrosim.runner import run
+
+RING_ROWS = 200
+
+
+def record_lists(sim, steps):
+    columns = {}
+    for state in run(sim, steps):
+        for key, value in state.items():
+            columns.setdefault(key, []).append(np.array(value).tolist())
+    return columns
+
+
+def record_with(recorder):
+    def go(sim, steps):
+        for state in run(sim, steps):
+            recorder.record(state)
+        recorder.close()
+        return recorder
+    return go
+
+
+def measure(fn, sim, steps):
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = fn(sim, steps)
+    seconds = time.perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return result, seconds, peak
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Trajectory recorder benchmark")
+    parser.add_argument("--sim", default="solar", choices=sorted(registry.SIMULATIONS))
+    parser.add_argument("--steps", type=int, default=100_000)
+    args = parser.parse_args()
+
+    out = tempfile.mkdtemp()
+    try:
+        modes = {
+            "lists": record_lists,
+            "memory": record_with(Recorder()),
+            "ring": record_with(Recorder(chunk_size=RING_ROWS, ring=True)),
+            "disk": record_with(Recorder(out)),
+        }
+        results = {}
+        print(f"{args.sim}, {args.steps} steps")
+        print(f"{'mode':>8} {'seconds':>9} {'steps/s':>10} {'peak MiB':>9}")
+        for name, fn in modes.items():
+            results[name], seconds, peak = measure(fn, registry.create(args.sim), args.steps)
+            print(f"{name:>8} {seconds:>9.3f} {args.steps / seconds:>10,.0f} {peak / 2**20:>9.1f}")
+
+        memory = results["memory"].arrays()
+        disk = load(out)
+        for key, values in memory.items():
+            assert np.array_equal(values, disk[key], equal_nan=True), key
+            assert np.array_equal(values[-RING_ROWS:], results["ring"].arrays()[key], equal_nan=True), key
+        print("disk and ring recordings match the in-memory one")
+    finally:
+        shutil.rmtree(out)
+
+
+if __name__ == "__main__":
+    main()
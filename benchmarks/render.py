@@ -0,0 +1,54 @@
+# Offline export wall time against the number of worker processes.
+#
+#   python -m benchmarks.render [--workers 1 2 4] [--sims hohmann solar]
+#
+# Renders the 400-frame Hohmann animation and the 1000-frame Solar System
+# animation to PNG sequences with astrosim.render, which the workers write
+# themselves, so the whole export is parallel. "speedup" is against the
+# first worker count and "efficiency" is speedup per added worker. Every
+# run's frames must be byte-identical to those of the first run, which
+# checks that chunk boundaries do not show.
+
+import argparse
+import filecmp
+import os
+import tempfile
+import time
+
+from astrosim.render import PNG_PATTERN, render
+
+FRAMES = {"hohmann": 400, "solar": 1000}
+PARAMS = {"solar": {"seed": 1}}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Parallel offline rendering benchmark")
+    parser.add_argument("--workers", type=int, nargs="+", default=sorted({1, os.cpu_count() or 1}))
+    parser.add_argument("--sims", nargs="+", default=list(FRAMES), choices=list(FRAMES))
+    parser.add_argument("--dpi", type=float, help="figure resolution (default: the view's own)")
+    args = parser.parse_args()
+
+    print(f"{'sim':>8} {'frames':>7} {'workers':>8} {'seconds':>8} {'fps':>7} {'speedup':>8} {'efficiency':>11}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for name in args.sims:
+            frames = FRAMES[name]
+            names = [PNG_PATTERN.format(i) for i in range(frames)]
+            first = base = None
+            for workers in args.workers:
+                out = os.path.join(tmp, f"{name}_{workers}")
+                start = time.perf_counter()
+                render(name, out, frames=frames, workers=workers, dpi=args.dpi, **PARAMS.get(name, {}))
+                seconds = time.perf_counter() - start
+                if first is None:
+                    first, base = out, seconds
+                else:
+                    _, mismatch, errors = filecmp.cmpfiles(first, out, names, shallow=False)
+                    assert not mismatch and not errors, f"{name}: frames differ with {workers} workers"
+                speedup = base / seconds
+                efficiency = speedup / (workers / args.workers[0])
+                print(f"{name:>8} {frames:>7} {workers:>8} {seconds:>8.1f} {frames / seconds:>7.1f} "
+                      f"{speedup:>7.2f}x {efficiency:>10.0%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+# Monte Carlo throughput: vectorized rocket ensemble against the scalar loop.
+#
+#   python -m benchmarks.rocket_ensemble [--workers N]
+#
+# Samples are drawn with disperse() around the nominal rocket. The scalar rate
+# comes from simulate(), one sample at a time. The seeded Monte Carlo batch
+# must come out bit-for-bit the same serially and over the pool.
+
+import argparse
+import os
+import time
+
+import numpy as np
+
+from astrosim.rocket import disperse, monte_carlo, run_ensemble, simulate, simulate_ensemble, summarize
+
+SIZES = (10**3, 10**4, 10**5)
+POOL_SIZE = 10**6
+SCALAR_SAMPLES = 20
+REPRO_SAMPLES = 50_000
+
+
+def samples(n, seed):
+    return disperse(n, np.random.default_rng(seed), sigma=0.1)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Rocket ensemble benchmark")
+    parser.add_argument("--workers", type=int, default=os.cpu_count())
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    params = samples(SCALAR_SAMPLES, args.seed)
+    start = time.perf_counter()
+    for i in range(SCALAR_SAMPLES):
+        simulate(**{k: v[i] for k, v in params.items()})
+    scalar_rate = SCALAR_SAMPLES / (time.perf_counter() - start)
+    print(f"scalar loop: {scalar_rate:,.0f} samples/s")
+
+    print(f"{'samples':>10} {'mode':>10} {'samples/s':>12} {'vs scalar':>10}")
+    for n in SIZES:
+        params = samples(n, args.seed)
+        start = time.perf_counter()
+        simulate_ensemble(**params)
+        rate = n / (time.perf_counter() - start)
+        print(f"{n:>10} {'vectorized':>10} {rate:12,.0f} {rate / scalar_rate:9.0f}x")
+
+    params = samples(POOL_SIZE, args.seed)
+    start = time.perf_counter()
+    result = run_ensemble(params, workers=args.workers)
+    rate = POOL_SIZE / (time.perf_counter() - start)
+    print(f"{POOL_SIZE:>10} {'pool x' + str(args.workers):>10} {rate:12,.0f} {rate / scalar_rate:9.0f}x")
+
+    for key, stats in summarize(result).items():
+        print(key, ", ".join(f"{p}={v:.2f}" for p, v in stats.items()))
+
+    serial = monte_carlo(REPRO_SAMPLES, seed=args.seed, sigma=0.1, workers=1)
+    pooled = monte_carlo(REPRO_SAMPLES, seed=args.seed, sigma=0.1, workers=args.workers)
+    assert all(np.array_equal(serial[k], pooled[k]) for k in serial)
+    print(f"monte_carlo({REPRO_SAMPLES}, seed={args.seed}): identical with 1 and {args.workers} workers")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+# Accuracy against cost: fixed-step Euler loop versus adaptive Dormand-Prince.
+#
+#   python -m benchmarks.rocket_integrators
+#
+# The rocket burns for 5 s and then coasts, so the flight has a burnout, an
+# apogee and a ground impact. Errors are measured against fly() at a 1e-12
+# tolerance.
+#
+# Check: a rocket whose thrust is below its weight never leaves the pad, and
+# fly() reports its impact at t = 0 instead of integrating it underground.
+
+import time
+
+from astrosim.rocket import DT, G, MASS, fly, simulate
+
+SCENARIO = {"burn_time": 5.0, "max_time": 120.0}
+EULER_DT = (0.1, 0.01, 0.001, 0.0001)
+DOPRI_RTOL = (1e-4, 1e-6, 1e-8, 1e-10)
+
+
+def timed(fn, **kwargs):
+    start = time.perf_counter()
+    result = fn(**kwargs)
+    return result, (time.perf_counter() - start) * 1e3
+
+
+def check_low_thrust():
+    r = fly(thrust=0.5 * MASS * G)
+    assert r["impact_time"] == 0.0 and r["altitude"].min() >= 0.0, "low-thrust rocket fell through the ground"
+    assert simulate(thrust=0.5 * MASS * G)["flight_time"] <= DT, "Euler low-thrust rocket did not land at once"
+    print("check: a rocket with thrust below its weight lands at once")
+
+
+def main():
+    check_low_thrust()
+    ref = fly(rtol=1e-12, atol=1e-12, **SCENARIO)
+    print(f"reference: apogee {ref['apogee']:.6f} m at {ref['apogee_time']:.6f} s, "
+          f"impact at {ref['impact_time']:.6f} s")
+    print(f"{'method':>18} {'steps':>8} {'rhs evals':>10} {'ms':>9} {'apogee err m':>13} {'impact err s':>13}")
+
+    for dt in EULER_DT:
+        r, ms = timed(simulate, dt=dt, **SCENARIO)
+        steps = len(r["time"])
+        print(f"{'euler dt=' + str(dt):>18} {steps:>8} {steps:>10} {ms:9.2f} "
+              f"{abs(r['max_altitude'] - ref['apogee']):13.2e} {abs(r['flight_time'] - ref['impact_time']):13.2e}")
+
+    for rtol in DOPRI_RTOL:
+        r, ms = timed(fly, rtol=rtol, atol=rtol, **SCENARIO)
+        print(f"{'dopri rtol=' + format(rtol, 'g'):>18} {r['steps']:>8} {r['nfev']:>10} {ms:9.2f} "
+              f"{abs(r['apogee'] - ref['apogee']):13.2e} {abs(r['impact_time'] - ref['impact_time']):13.2e}")
+
+
+if __name__ == "__main__":
+    main()
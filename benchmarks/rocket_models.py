@@ -0,0 +1,121 @@
+# Cost and accuracy of the tabulated atmosphere, Mach-Cd and motor models.
+#
+#   python -m benchmarks.rocket_models [--samples 100000]
+#
+# First, the lookup tables are checked against the functions they sample.
+# Second, simulate() and simulate_ensemble() must agree exactly with every
+# option switched on, also in a batch mixing samples with and without
+# propellant. Last, an ensemble is flown at each level of model detail, and
+# the output shows its throughput (rocket steps/s) and mean apogee. The
+# "direct" row evaluates the atmosphere formulas and interpolates the Cd
+# breakpoints on every step instead of using the tables, as a reference for
+# what the tables save.
+
+import argparse
+import os
+import time
+
+import numpy as np
+
+from astrosim import aero
+from astrosim.rocket import disperse, simulate, simulate_ensemble
+
+MOTOR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                     "Rocket_Trajectory_Sim", "motors", "Example_M1500.eng")
+FLIGHT = {"burn_time": 8.0, "max_time": 300.0, "thrust": 4000.0}  # about Mach 1.1 at burnout
+
+MODELS = {
+    "constant": {},
+    "atmosphere": {"atmosphere": True},
+    "+ mach cd": {"atmosphere": True, "cd_mach": True},
+    "+ propellant": {"atmosphere": True, "cd_mach": True, "propellant": 15.0},
+    "motor curve": {"atmosphere": True, "cd_mach": True, "motor": MOTOR, "burn_time": None},
+}
+
+
+class DirectAtmosphere:
+    # Stands in for the atmosphere table but evaluates the formulas
+    def __call__(self, y):
+        atm = aero.standard_atmosphere(y)
+        return atm["density"], atm["speed_of_sound"]
+
+
+class DirectMachCd:
+    def __call__(self, mach):
+        points = np.array(aero.MACH_CD)
+        return np.interp(mach, points[:, 0], points[:, 1])
+
+
+def check_tables():
+    altitude = np.random.default_rng(0).uniform(0, aero.TOP, 100_000)
+    exact = aero.standard_atmosphere(altitude)
+    rho, sound = aero.atmosphere_table()(altitude)
+    rho_err = np.max(np.abs(rho / exact["density"] - 1))
+    sound_err = np.max(np.abs(sound / exact["speed_of_sound"] - 1))
+    scalar = np.array([aero.atmosphere_table().at(h) for h in altitude[:1000]])
+    assert np.array_equal(scalar.T, np.stack([rho, sound])[:, :1000]), "scalar and vector lookups differ"
+    print(f"atmosphere table, 10 m steps: density rel err {rho_err:.1e}, speed of sound rel err {sound_err:.1e}")
+
+    motor = aero.load_eng(MOTOR)
+    table = motor.table()
+    thrust = table(motor.times)[0]
+    impulse = np.sum(table.values[1:, 0] + table.values[:-1, 0]) * aero.MOTOR_STEP / 2
+    burnt = motor.total_mass - table.values[-1, 1]
+    print(f"{motor}: table impulse {impulse:.1f} N s, propellant burnt {burnt:.3f} kg, "
+          f"max thrust err at breakpoints {np.max(np.abs(thrust - motor.thrusts)):.1e} N")
+    assert np.allclose(thrust, motor.thrusts) and np.isclose(burnt, motor.propellant_mass)
+
+
+def check_match():
+    for label, options in MODELS.items():
+        params = {**FLIGHT, "mass": 20.0, **options}
+        single = simulate(**params)
+        batch = simulate_ensemble(**params)
+        assert single["max_altitude"] == batch["apogee"][0], f"{label}: apogee differs"
+        assert single["flight_time"] == batch["flight_time"][0], f"{label}: flight time differs"
+    # A batch mixing dry and fuelled samples flies each with its own model
+    params = {**FLIGHT, "mass": 20.0, **MODELS["+ propellant"]}
+    loads = [0.0, params.pop("propellant"), 0.0]
+    batch = simulate_ensemble(**params, propellant=loads)
+    for k, load in enumerate(loads):
+        single = simulate(**params, propellant=load)
+        assert single["max_altitude"] == batch["apogee"][k], f"propellant {load}: apogee differs"
+        assert single["flight_time"] == batch["flight_time"][k], f"propellant {load}: flight time differs"
+    print("simulate() and simulate_ensemble() agree exactly for every model and mixed propellant loads")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Rocket atmosphere and motor model benchmark")
+    parser.add_argument("--samples", type=int, default=100_000)
+    args = parser.parse_args()
+
+    check_tables()
+    check_match()
+
+    params = disperse(args.samples, rng=0, thrust=FLIGHT["thrust"], mass=20.0)
+    rows = list(MODELS.items())
+    rows.insert(3, ("+ mach cd, direct", {"atmosphere": True, "cd_mach": True, "direct": True}))
+
+    print(f"{'model':>18} {'seconds':>8} {'Msteps/s':>9} {'mean apogee m':>14} {'landed':>7}")
+    for label, options in rows:
+        options = dict(options)
+        kwargs = {**FLIGHT, **params, **options}
+        if kwargs.pop("direct", False):
+            # Swap the tables for the direct evaluations for this run only
+            saved = aero.atmosphere_table, aero.mach_cd_table
+            aero.atmosphere_table = lambda step=None: DirectAtmosphere()
+            aero.mach_cd_table = lambda points=None, step=None: DirectMachCd()
+        else:
+            saved = None
+        start = time.perf_counter()
+        result = simulate_ensemble(**kwargs)
+        seconds = time.perf_counter() - start
+        if saved:
+            aero.atmosphere_table, aero.mach_cd_table = saved
+        steps = np.sum(np.round(result["flight_time"] / kwargs.get("dt", 0.01)))
+        print(f"{label:>18} {seconds:>8.2f} {steps / seconds / 1e6:>9.2f} "
+              f"{result['apogee'].mean():>14.1f} {result['landed'].mean():>7.0%}")
+
+
+if __name__ == "__main__":
+    main()
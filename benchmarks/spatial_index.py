@@ -0,0 +1,87 @@
+# Capture detection: uniform-grid radius search against the brute-force check.
+#
+#   python -m benchmarks.spatial_index [--frames 10]
+#
+# Before timing anything, the grid results are checked pair-for-pair against
+# brute_force_pairs, both on a static point cloud and over a running debris
+# field (where the grid is only rebuilt once drift exceeds its skin).
+
+import argparse
+import time
+
+import numpy as np
+
+from astrosim.debris import DebrisField, BANDS, CAPTURE_RADIUS
+from astrosim.spatial import GridIndex, brute_force_pairs
+
+SIZES = (10**4, 10**5, 10**6)
+COLLECTORS = (3, 100, 1000)
+# Brute force is skipped above this many fragment-collector pairs
+BRUTE_LIMIT = 10**8
+
+
+def as_pair_set(pairs):
+    return set(zip(*(p.tolist() for p in pairs)))
+
+
+def check_static(rng):
+    points = rng.uniform(-10, 10, (20000, 3))
+    centers = rng.uniform(-10, 10, (300, 3))
+    active = rng.random(len(points)) > 0.1
+    grid = GridIndex(CAPTURE_RADIUS, skin=0.3).build(points, active=active)
+    got = as_pair_set(grid.query_pairs(points, centers))
+    want = as_pair_set(brute_force_pairs(points, centers, CAPTURE_RADIUS, active=active))
+    assert got == want, f"grid found {len(got)} pairs, brute force {len(want)}"
+    return len(want)
+
+
+def check_field(rng, frames=600):
+    seed = int(rng.integers(2**32))
+    kwargs = dict(sat_band=np.repeat(np.arange(len(BANDS)), 20), sat_speeds=rng.uniform(0.01, 0.05, 60))
+    grid = DebrisField.random(2000, rng=np.random.default_rng(seed), **kwargs)
+    brute = DebrisField.random(2000, rng=np.random.default_rng(seed), use_index=False, **kwargs)
+    for _ in range(frames):
+        assert np.array_equal(grid.step(), brute.step())
+    assert np.array_equal(grid.captured_by, brute.captured_by)
+    return int(grid.captured.sum())
+
+
+def fleet(n, m, seed, use_index):
+    rng = np.random.default_rng(seed)
+    sat_band = np.arange(m) % len(BANDS)
+    return DebrisField.random(n // len(BANDS), rng=rng, sat_band=sat_band,
+                              sat_speeds=rng.uniform(0.01, 0.05, m), use_index=use_index)
+
+
+def time_step(field, frames):
+    # Whole step, so grid rebuilds are amortised into the figure
+    field.step()
+    start = time.perf_counter()
+    for _ in range(frames):
+        field.step()
+    return (time.perf_counter() - start) / frames * 1e3
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Spatial index capture benchmark")
+    parser.add_argument("--frames", type=int, default=10)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(args.seed)
+    print(f"static check: {check_static(rng)} pairs match brute force")
+    print(f"field check: {check_field(rng)} captures match brute force over 600 frames")
+    print()
+    print(f"{'fragments':>10} {'collectors':>10} {'brute ms/step':>14} {'grid ms/step':>13} {'speedup':>8}")
+    for n in SIZES:
+        for m in COLLECTORS:
+            grid_ms = time_step(fleet(n, m, args.seed, True), args.frames)
+            if n * m <= BRUTE_LIMIT:
+                brute_ms = time_step(fleet(n, m, args.seed, False), max(1, args.frames // 4))
+                print(f"{n:>10} {m:>10} {brute_ms:14.2f} {grid_ms:13.2f} {brute_ms / grid_ms:7.1f}x")
+            else:
+                print(f"{n:>10} {m:>10} {'-':>14} {grid_ms:13.2f} {'':>8}")
+
+
+if __name__ == "__main__":
+    main()
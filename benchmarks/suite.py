@@ -0,0 +1,188 @@
+# Fixed-workload benchmark suite with a history file and regression checks.
+#
+#   python -m benchmarks.suite [--quick] [--cases debris rocket] [--baseline last]
+#                              [--threshold 0.15] [--history FILE] [--no-save]
+#
+# Every case has a fixed size and seed, so runs on one machine are
+# comparable over time. Cases cover the rocket integration loop, the debris
+# step at several field sizes, and the orbit, solar and Hohmann frame
+# updates. The frame cases run twice: "headless" steps the compute core
+# only, and "agg" drives the view and redraws it off screen with Agg, the
+# way FuncAnimation does. Each case reports the median ms per step or frame
+# over several repeats.
+#
+# Each run is appended as one JSON line to the history file, along with the
+# commit, Python, NumPy and host it ran on. A run is compared with a
+# baseline entry from that history: "last" (the default) or a commit
+# prefix. Cases that got slower by more than the threshold are flagged, and
+# the exit status is then 1, so the suite can gate CI. Timings only compare
+# meaningfully between runs on the same machine.
+
+import argparse
+import fnmatch
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+
+import matplotlib
+
+matplotlib.use("Agg")
+
+import numpy as np  # noqa: E402
+
+from astrosim import registry  # noqa: E402
+from astrosim.runner import run  # noqa: E402
+
+HISTORY = os.path.join(os.path.dirname(os.path.abspath(__file__)), "history.jsonl")
+THRESHOLD = 0.15  # flag cases more than 15% slower than the baseline
+SEED = 12345
+REPEATS = 5
+
+
+def headless(name, steps, **params):
+    # ms per step of the compute core alone; every repeat starts afresh
+    def case():
+        sim = registry.create(name, **params)
+        sim.step()  # warm up
+        start = time.perf_counter()
+        done = sum(1 for _ in run(sim, steps))
+        return (time.perf_counter() - start) * 1e3 / max(done, 1)
+    return case
+
+
+def agg(name, frames, **params):
+    # ms per animation frame: view update plus the Agg redraw (a blit for
+    # views that blit, a full canvas draw otherwise)
+    def case():
+        import matplotlib.pyplot as plt
+
+        view = registry.view_class(name)(registry.create(name, **params))
+        canvas = view.fig.canvas
+        canvas.draw()
+        background = canvas.copy_from_bbox(view.fig.bbox)
+        start = time.perf_counter()
+        for i in range(frames):
+            artists = view.update(i)
+            if view.blit:
+                canvas.restore_region(background)
+                for artist in artists:
+                    view.fig.draw_artist(artist)
+                canvas.blit(view.fig.bbox)
+            else:
+                canvas.draw()
+        elapsed = time.perf_counter() - start
+        plt.close(view.fig)
+        return elapsed * 1e3 / frames
+    return case
+
+
+def cases(quick=False):
+    # Name -> zero-argument callable returning ms per unit of work
+    scale = 5 if quick else 1
+    return {
+        "rocket/loop": headless("rocket", 3000),  # one full 30 s flight
+        "debris/step/1e3": headless("debris", 500 // scale, num_debris=10**3, seed=SEED),
+        "debris/step/1e4": headless("debris", 200 // scale, num_debris=10**4, seed=SEED),
+        "debris/step/1e5": headless("debris", 50 // scale, num_debris=10**5, seed=SEED),
+        "debris/agg/1e3": agg("debris", 50 // scale, num_debris=10**3, seed=SEED),
+        "orbits/headless": headless("orbits", 2000 // scale),
+        "orbits/agg": agg("orbits", 50 // scale),
+        "solar/headless": headless("solar", 2000 // scale, seed=SEED),
+        "solar/agg": agg("solar", 30 // scale, seed=SEED),
+        "hohmann/headless": headless("hohmann", 2000 // scale),
+        "hohmann/agg": agg("hohmann", 50 // scale),
+    }
+
+
+def measure(case, repeats):
+    times = [case() for _ in range(repeats)]
+    return {"ms": statistics.median(times), "min_ms": min(times), "max_ms": max(times)}
+
+
+def environment():
+    try:
+        commit = subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True,
+                                cwd=os.path.dirname(HISTORY)).stdout.strip() or None
+    except OSError:
+        commit = None
+    return {
+        "time": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "commit": commit,
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "host": platform.node(),
+        "machine": platform.machine(),
+        "cpus": os.cpu_count(),
+    }
+
+
+def load_history(path):
+    if not os.path.exists(path):
+        return []
+    with open(path) as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+def find_baseline(history, ref, quick=False):
+    # The newest entry run at the same size ("last"), or the newest one whose
+    # commit starts with ref
+    for entry in reversed(history):
+        if entry.get("quick", False) != quick:
+            continue
+        if ref == "last" or (entry.get("commit") or "").startswith(ref):
+            return entry
+    return None
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark suite with regression tracking")
+    parser.add_argument("--cases", nargs="+", default=["*"], help="case names or glob patterns")
+    parser.add_argument("--quick", action="store_true", help="one fifth of the work per case, fewer repeats")
+    parser.add_argument("--repeats", type=int, default=None)
+    parser.add_argument("--history", default=HISTORY)
+    parser.add_argument("--baseline", default="last", help='"last" or a commit prefix from the history')
+    parser.add_argument("--threshold", type=float, default=THRESHOLD)
+    parser.add_argument("--no-save", action="store_true", help="do not append this run to the history")
+    args = parser.parse_args()
+
+    suite = cases(args.quick)
+    selected = [name for name in suite if any(fnmatch.fnmatch(name, p) for p in args.cases)]
+    if not selected:
+        parser.error(f"no case matches {args.cases}; choose from {', '.join(suite)}")
+    repeats = args.repeats or (3 if args.quick else REPEATS)
+    history = load_history(args.history)
+    baseline = find_baseline(history, args.baseline, args.quick)
+    if baseline is None and history:
+        print(f"no baseline matches {args.baseline!r}", file=sys.stderr)
+    base = (baseline or {}).get("results", {})
+
+    label = f"vs {baseline['commit'] or baseline['time']}" if baseline else "baseline"
+    print(f"{'case':>18} {'ms':>10} {'min ms':>10} {'max ms':>10} {label:>16}")
+    results, regressions = {}, []
+    for name in selected:
+        result = results[name] = measure(suite[name], repeats)
+        change = ""
+        if name in base:
+            ratio = result["ms"] / base[name]["ms"] - 1
+            change = f"{ratio:+.1%}"
+            if ratio > args.threshold:
+                change += " SLOWER"
+                regressions.append(name)
+        print(f"{name:>18} {result['ms']:>10.4f} {result['min_ms']:>10.4f} {result['max_ms']:>10.4f} {change:>16}")
+
+    if not args.no_save:
+        entry = {**environment(), "quick": args.quick, "repeats": repeats, "results": results}
+        with open(args.history, "a") as f:
+            f.write(json.dumps(entry) + "\n")
+    if regressions:
+        print(f"{len(regressions)} case(s) more than {args.threshold:.0%} slower than the baseline: "
+              f"{', '.join(regressions)}", file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+# Parameter sweep throughput and result-cache reuse.
+#
+#   python -m benchmarks.sweep [--workers N]
+#
+# Each sim is swept three times against one fresh cache. "cold" runs every
+# point of a grid, "repeat" is the same grid again, and "overlap" is a grid
+# that shares half its points with the first one. runs/s counts simulations
+# actually run; points/s counts all points answered, cached or not. Cached
+# results must equal the freshly computed ones.
+
+import argparse
+import os
+import tempfile
+
+import numpy as np
+
+from astrosim.rocket import flight_summary
+from astrosim.sweep import ResultCache, grid, sweep
+
+THRUSTS = list(range(1000, 2600, 100))
+
+SWEEPS = {
+    "rocket": dict(
+        steps=3000,
+        metrics=flight_summary,
+        designs=(
+            grid(thrust=THRUSTS, cd=np.round(0.4 + 0.04 * np.arange(16), 2).tolist()),
+            grid(thrust=THRUSTS, cd=np.round(0.4 + 0.04 * np.arange(16), 2).tolist()),
+            grid(thrust=THRUSTS, cd=np.round(0.4 + 0.04 * np.arange(8, 24), 2).tolist()),
+        ),
+    ),
+    "debris": dict(
+        steps=300,
+        metrics=None,
+        designs=(
+            grid(capture_radius=[0.3, 0.5, 0.7, 0.9], num_debris=[1000], seed=[0, 1, 2, 3]),
+            grid(capture_radius=[0.3, 0.5, 0.7, 0.9], num_debris=[1000], seed=[0, 1, 2, 3]),
+            grid(capture_radius=[0.3, 0.5, 0.7, 0.9], num_debris=[1000], seed=[2, 3, 4, 5]),
+        ),
+    ),
+}
+
+
+def same(a, b):
+    return a.keys() == b.keys() and all(np.array_equal(a[k], b[k]) for k in a)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Parameter sweep benchmark")
+    parser.add_argument("--workers", type=int, default=os.cpu_count())
+    parser.add_argument("--sims", nargs="+", default=list(SWEEPS), choices=list(SWEEPS))
+    args = parser.parse_args()
+
+    print(f"{'sim':>7} {'sweep':>8} {'points':>7} {'runs':>5} {'hit rate':>9} {'seconds':>8} {'runs/s':>8} {'points/s':>9}")
+    for name in args.sims:
+        spec = SWEEPS[name]
+        with tempfile.TemporaryDirectory() as tmp:
+            cache = ResultCache(tmp)
+            first = None
+            for label, design in zip(("cold", "repeat", "overlap"), spec["designs"]):
+                results, stats = sweep(name, design, steps=spec["steps"], metrics=spec["metrics"],
+                                       workers=args.workers, cache=cache)
+                if first is None:
+                    first = results
+                elif label == "repeat":
+                    assert all(same(a, b) for a, b in zip(first, results)), f"{name}: cached results differ"
+                print(f"{name:>7} {label:>8} {stats['points']:>7} {stats['runs']:>5} {stats['hit_rate']:>9.0%} "
+                      f"{stats['seconds']:>8.2f} {stats['runs_per_s']:>8.1f} {stats['points_per_s']:>9.1f}")
+
+
+if __name__ == "__main__":
+    main()
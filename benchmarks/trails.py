@@ -0,0 +1,82 @@
+# Trail bookkeeping cost: the old Python-list trails against the ring buffer.
+#
+#   python -m benchmarks.trails [--bodies 9]
+#
+# "pop(0)" is the old Orbit Visualizer trail (append, pop(0), zip(*) per
+# body). "slice" is the old solar trail (append forever, slice the last
+# TRAIL_LENGTH and rebuild an array per body). "ring" is astrosim.trail.Trail
+# with its zero-copy view. "held" is the size of the trail data kept at the
+# end of the run.
+
+import argparse
+import sys
+import time
+
+import numpy as np
+
+from astrosim.trail import Trail
+
+TRAIL_LENGTH = 200
+RUN_LENGTHS = (10**3, 10**4, 10**5)
+
+
+def pop_front(frames, points):
+    history = [[] for _ in points[0]]
+    for p in points[:frames]:
+        for i, (x, y, z) in enumerate(p):
+            history[i].append((x, y, z))
+            if len(history[i]) > TRAIL_LENGTH:
+                history[i].pop(0)
+            trail_x, trail_y, trail_z = zip(*history[i])
+    return history
+
+
+def slice_tail(frames, points):
+    history = [[] for _ in points[0]]
+    for p in points[:frames]:
+        for i, (x, y, z) in enumerate(p):
+            history[i].append((x, y, z))
+            trail = np.array(history[i][-TRAIL_LENGTH:])
+    return history
+
+
+def ring(frames, points):
+    trail = Trail(TRAIL_LENGTH, len(points[0]))
+    for p in points[:frames]:
+        trail.append(p)
+        view = trail.view()
+    return trail
+
+
+def held_bytes(obj):
+    if isinstance(obj, Trail):
+        return obj._buf.nbytes
+    if isinstance(obj, np.ndarray):
+        return obj.nbytes
+    if isinstance(obj, (list, tuple)):
+        return sys.getsizeof(obj) + sum(held_bytes(item) for item in obj)
+    return sys.getsizeof(obj)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Trail buffer benchmark")
+    parser.add_argument("--bodies", type=int, default=9)
+    args = parser.parse_args()
+    points = np.random.default_rng(0).standard_normal((max(RUN_LENGTHS), args.bodies, 3))
+
+    # The ring view must match the last TRAIL_LENGTH positions
+    trail = ring(1000, points)
+    assert np.array_equal(trail.view(), points[1000 - TRAIL_LENGTH:1000])
+
+    print(f"{'frames':>8} {'method':>7} {'us/frame':>9} {'held KiB':>9}")
+    for frames in RUN_LENGTHS:
+        for name, fn in (("pop(0)", pop_front), ("slice", slice_tail), ("ring", ring)):
+            start = time.perf_counter()
+            kept = fn(frames, points)
+            seconds = time.perf_counter() - start
+            held = held_bytes(kept)
+            print(f"{frames:>8} {name:>7} {seconds / frames * 1e6:>9.1f} {held / 1024:>9.0f}")
+
+
+if __name__ == "__main__":
+    main()